@@ -1,13 +1,373 @@
+import functools
+import os
+import random
 import sys
-import unittest
+import time
+from typing import Callable, Iterable
+
+# Helpers shared by several problem files live in `problems/`, which is not a package.
+_PROBLEMS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROBLEMS_DIR not in sys.path:
+    sys.path.append(_PROBLEMS_DIR)
+from buffer_views import typed_view
+
+# Note: the recursive `getMaximumGold` below needs at most R * C = 225 frames for the
+# 15x15 constraint, which fits inside Python's default recursion limit (1000). The limit
+# is intentionally NOT raised at import time, since that would leak into the whole process.
+# Use `getMaximumGoldIterative` for grids whose paths could go deeper than that.
+
+# Possible directions for movement: (delta_row, delta_col)
+# (0, 1) -> Right, (0, -1) -> Left, (1, 0) -> Down, (-1, 0) -> Up
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def build_gold_graph(grid: list[list[int]]) -> tuple[list[tuple[int, int]], list[int], list[tuple[int, ...]]]:
+    """
+    Flattens the gold cells of `grid` into an adjacency table.
+
+    Every cell with gold gets a dense index `0..G-1` (row-major order). The search
+    engines then work purely on these indices, so visited state fits in one integer
+    bitmask (bit `i` set <=> gold cell `i` is on the current path) and the input grid
+    is never read again or written to.
+
+    Args:
+        grid: The gold grid. It is only read, never modified.
+
+    Returns:
+        A tuple `(cells, values, neighbors)` where `cells[i]` is the `(row, col)` of gold
+        cell `i`, `values[i]` its gold, and `neighbors[i]` a tuple with the indices of the
+        gold cells adjacent to it.
+
+    Time Complexity: O(R * C)
+    Space Complexity: O(R * C)
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+
+    index: dict[tuple[int, int], int] = {}
+    cells: list[tuple[int, int]] = []
+    values: list[int] = []
+    for r in range(rows):
+        row = grid[r]
+        for c in range(cols):
+            if row[c] > 0:
+                index[(r, c)] = len(cells)
+                cells.append((r, c))
+                values.append(row[c])
+
+    neighbors: list[tuple[int, ...]] = []
+    for r, c in cells:
+        neighbors.append(tuple(index[(r + dr, c + dc)] for dr, dc in DIRECTIONS if (r + dr, c + dc) in index))
+
+    return cells, values, neighbors
+
+
+def gold_components(neighbors: list[tuple[int, ...]]) -> list[list[int]]:
+    """
+    Splits the gold graph into connected components (lists of gold cell indices).
+
+    A path can never leave its component, so each component can be solved on its own.
+    """
+    component_of = [-1] * len(neighbors)
+    components: list[list[int]] = []
+    for root in range(len(neighbors)):
+        if component_of[root] != -1:
+            continue
+        component_of[root] = len(components)
+        component = [root]
+        stack = [root]
+        while stack:
+            for nxt in neighbors[stack.pop()]:
+                if component_of[nxt] == -1:
+                    component_of[nxt] = len(components)
+                    component.append(nxt)
+                    stack.append(nxt)
+        components.append(component)
+    return components
+
+
+def articulation_points(component: list[int], neighbors: list[tuple[int, ...]]) -> set[int]:
+    """
+    Finds the cut points of one component (iterative Tarjan low-link, no recursion).
+
+    A cut point can never be an endpoint of a maximal path: its neighbors lie in at least
+    two parts of the component that only meet at the cut point, so a path starting there
+    can enter only one of them and always has an unvisited neighbor left at its start.
+    Since all gold values are positive, every optimal path is maximal, hence cut points
+    never need to be used as DFS start cells.
+    """
+    order: dict[int, int] = {}
+    low: dict[int, int] = {}
+    cut_points: set[int] = set()
+    root = component[0]
+    order[root] = low[root] = 0
+    root_children = 0
+    stack = [(root, -1, iter(neighbors[root]))]
+    while stack:
+        cell, parent, pending = stack[-1]
+        for nxt in pending:
+            if nxt == parent:
+                continue
+            if nxt in order:
+                low[cell] = min(low[cell], order[nxt])
+            else:
+                order[nxt] = low[nxt] = len(order)
+                stack.append((nxt, cell, iter(neighbors[nxt])))
+                break
+        else:
+            stack.pop()
+            if parent == -1:
+                continue
+            low[parent] = min(low[parent], low[cell])
+            if parent == root:
+                root_children += 1
+            elif low[cell] >= order[parent]:
+                cut_points.add(parent)
+    if root_children > 1:
+        cut_points.add(root)
+    return cut_points
+
+
+def search_component(values: list[int], neighbors: list[tuple[int, ...]], starts: list[int],
+                     component_gold: int, best: int) -> int:
+    """
+    Branch-and-bound DFS over one component, from each cell in `starts`.
+
+    Same explicit-stack/bitmask walk as `Solution.getMaximumGoldIterative`, with two cuts:
+    - Before descending into a neighbor, the gold still reachable from it through
+      unvisited cells is flood-filled. If the path gold plus that reachable gold cannot
+      beat `best`, the whole subtree is skipped. The flood stops early as soon as the
+      bound exceeds `best`, so the check is cheap whenever the branch is promising.
+    - Once `best` equals `component_gold` (every cell collected), nothing can improve it.
+
+    Args:
+        values: Gold of every gold cell (global indices from `build_gold_graph`).
+        neighbors: Adjacency table from `build_gold_graph`.
+        starts: Cells of the component to start the DFS from.
+        component_gold: Total gold of the component, an upper bound for any path in it.
+        best: Best value known so far (from other components); only values above it count.
+
+    Returns:
+        The larger of `best` and the best path gold in the component.
+    """
+    bits = [1 << i for i in range(len(values))]
+    for start in starts:
+        if best >= component_gold:
+            break
+        mask = bits[start]
+        current_path_gold = values[start]
+        if current_path_gold > best:
+            best = current_path_gold
+
+        path = [start]
+        pending = [iter(neighbors[start])]
+        while pending:
+            for nxt in pending[-1]:
+                bit = bits[nxt]
+                if mask & bit:
+                    continue
+                gold = current_path_gold + values[nxt]
+
+                # Upper bound: gold of everything reachable from `nxt` off the path.
+                bound = gold
+                seen = mask | bit
+                flood = [nxt]
+                while flood and bound <= best:
+                    for cell in neighbors[flood.pop()]:
+                        cell_bit = bits[cell]
+                        if not seen & cell_bit:
+                            seen |= cell_bit
+                            bound += values[cell]
+                            flood.append(cell)
+                if bound <= best:
+                    continue
+
+                mask |= bit
+                current_path_gold = gold
+                if gold > best:
+                    best = gold
+                path.append(nxt)
+                pending.append(iter(neighbors[nxt]))
+                break
+            else:
+                pending.pop()
+                cell = path.pop()
+                mask ^= bits[cell]
+                current_path_gold -= values[cell]
+    return best
+
+
+def greedy_gold_path(start: int, values: list[int], neighbors: list[tuple[int, ...]]) -> list[int]:
+    """
+    Builds one good (not necessarily optimal) path from `start`.
+
+    The walk always steps to the unvisited neighbor with the fewest unvisited neighbors
+    of its own (Warnsdorff's rule, which keeps the walk from cutting the region in two),
+    breaking ties by higher gold. When it gets stuck it is reversed and continued from
+    the other end, then `improve_gold_path` grows it with detours. The walk takes
+    O(path length), the detours up to O(G^2) for G gold cells.
+    """
+    on_path = bytearray(len(values))
+    on_path[start] = 1
+    path = [start]
+    for _ in range(2):  # Extend the tail, then (reversed) the original head.
+        cell = path[-1]
+        while True:
+            candidates = [nxt for nxt in neighbors[cell] if not on_path[nxt]]
+            if not candidates:
+                break
+            cell = min(candidates, key=lambda nxt: (sum(not on_path[far] for far in neighbors[nxt]), -values[nxt]))
+            on_path[cell] = 1
+            path.append(cell)
+        path.reverse()
+    return improve_gold_path(path, values, neighbors, on_path)
+
+
+def improve_gold_path(path: list[int], values: list[int], neighbors: list[tuple[int, ...]],
+                      on_path: bytearray) -> list[int]:
+    """
+    Local improvement: replaces path steps `a -> b` by detours `a -> x -> y -> b`.
+
+    `x` and `y` must be unvisited, so every detour strictly adds gold. On a grid these
+    are the U-turns around a unit square next to the path. Repeats until no step of
+    the path can be detoured.
+
+    Time Complexity: O(G^2) for G gold cells. A pass over the path is O(G) and a pass
+        may add a single detour, with up to G / 2 detours. Each detour is also an O(G)
+        list insertion.
+    """
+    improved = True
+    while improved:
+        improved = False
+        i = 0
+        while i < len(path) - 1:
+            a, b = path[i], path[i + 1]
+            for x in neighbors[a]:
+                if on_path[x]:
+                    continue
+                y = next((y for y in neighbors[x] if not on_path[y] and b in neighbors[y]), None)
+                if y is not None:
+                    path[i + 1:i + 1] = [x, y]
+                    on_path[x] = on_path[y] = 1
+                    improved = True
+                    break
+            else:
+                i += 1  # After a detour, retry from `a`: the new step `a -> x` may detour too.
+    return path
+
+
+# The 8 symmetries of the square (rotations and reflections) as matrices (a, b, c, d)
+# acting on cells: (r, c) -> (a * r + b * c, c * r + d * c).
+SYMMETRIES = ((1, 0, 0, 1), (0, 1, -1, 0), (-1, 0, 0, -1), (0, -1, 1, 0),
+              (1, 0, 0, -1), (-1, 0, 0, 1), (0, 1, 1, 0), (0, -1, -1, 0))
+
+
+def canonical_component(cells: list[tuple[int, int]], values: list[int]) -> tuple[tuple[tuple[int, int, int], ...], dict]:
+    """
+    Canonical form of one component, identical for all its translations, rotations and reflections.
+
+    Every symmetry is applied, the result is translated to start at (0, 0), and the
+    lexicographically smallest sorted `(row, col, gold)` tuple wins.
+
+    Returns:
+        A tuple `(shape, to_original)`: the hashable canonical shape, and a dict mapping
+        each canonical `(row, col)` back to the original cell, used to map a path back.
+    """
+    best_shape = None
+    best_moved: list[tuple[int, int]] = []
+    for a, b, c, d in SYMMETRIES:
+        moved = [(a * r + b * col, c * r + d * col) for r, col in cells]
+        min_r = min(r for r, _ in moved)
+        min_c = min(col for _, col in moved)
+        moved = [(r - min_r, col - min_c) for r, col in moved]
+        shape = tuple(sorted((r, col, v) for (r, col), v in zip(moved, values)))
+        if best_shape is None or shape < best_shape:
+            best_shape, best_moved = shape, moved
+    return best_shape, dict(zip(best_moved, cells))
+
+
+@functools.lru_cache(maxsize=4096)
+def solve_canonical_component(shape: tuple[tuple[int, int, int], ...]) -> tuple[int, tuple[tuple[int, int], ...]]:
+    """
+    Exact best path of one canonical component, memoized in a bounded LRU cache.
+
+    Repeated components (in any position or orientation) share one canonical shape, so
+    each distinct shape is searched once. Use `solve_canonical_component.cache_info()`
+    to inspect hits and misses, and `.cache_clear()` to drop the cache.
+
+    Returns:
+        A tuple `(gold, path)` with `path` in canonical coordinates.
+    """
+    grid = [[0] * (max(c for _, c, _ in shape) + 1) for _ in range(max(r for r, _, _ in shape) + 1)]
+    for r, c, v in shape:
+        grid[r][c] = v
+    gold, path, _ = Solution().getMaximumGoldAnytime(grid)
+    return gold, tuple(path)
+
+
+# Per-process state of the parallel engine, set once by `_init_gold_worker` so that the
+# graph is sent to every worker a single time instead of being pickled with every task.
+_worker_values: list[int] = []
+_worker_neighbors: list[tuple[int, ...]] = []
+_worker_best = None
+
+
+def _init_gold_worker(values: list[int], neighbors: list[tuple[int, ...]], shared_best) -> None:
+    global _worker_values, _worker_neighbors, _worker_best
+    _worker_values = values
+    _worker_neighbors = neighbors
+    _worker_best = shared_best
+
+
+def _search_start_task(start: int, component_gold: int) -> int:
+    """
+    Process-pool task: searches the paths beginning at one start cell.
+
+    The best value published by the other workers is read before the search, so the
+    branch-and-bound in `search_component` prunes against the global best, and any
+    improvement is published back (under the value's lock) for the tasks that follow.
+    """
+    best = _worker_best.value
+    if best >= component_gold:
+        return best
+    found = search_component(_worker_values, _worker_neighbors, [start], component_gold, best)
+    if found > best:
+        with _worker_best.get_lock():
+            if found > _worker_best.value:
+                _worker_best.value = found
+    return found
+
+
+def grid_rows(grid, shape: tuple[int, int] | None = None):
+    """
+    Rows of a 2D buffer-protocol grid as zero-copy slices of one flat typed `memoryview`.
+
+    Accepts NumPy arrays, 2D `memoryview`s, and flat buffers (`array`, `bytes`...) with
+    `shape=(rows, cols)`; gold values (0..100) even fit in plain `bytes`. Strided 2D
+    grids (e.g. a transposed NumPy array) are copied once by `typed_view`. Objects
+    without the buffer protocol (sequences of rows) are returned unchanged.
+
+    Raises:
+        ValueError: If a flat buffer has no `shape`, or its size does not match it.
+    """
+    try:
+        view = memoryview(grid)
+    except TypeError:
+        return grid
+    if view.ndim == 2:
+        rows, cols = view.shape
+        view = typed_view(view)
+    elif shape is not None:
+        rows, cols = shape
+    else:
+        raise ValueError("1D buffers need shape=(rows, cols)")
+    if len(view) != rows * cols:
+        raise ValueError(f"Buffer of {len(view)} items does not match shape {(rows, cols)}")
+    return [view[r * cols:(r + 1) * cols] for r in range(rows)]
 
-# Increase the recursion limit for deep DFS paths, as grid can be up to 15x15 (225 cells).
-# Python's default recursion limit (often 1000) is usually sufficient, but for very long
-# paths, it might need to be increased. Setting it to 1000 or 2500 is common for DSA problems.
-sys.setrecursionlimit(2500) 
 
 class Solution:
-    def getMaximumGold(self, grid: list[list[int]]) -> int:
+    def getMaximumGold(self, grid: list[list[int]], shape: tuple[int, int] | None = None) -> int:
         """
         Calculates the maximum amount of gold a miner can collect from a grid.
         
@@ -60,6 +420,10 @@ class Solution:
             grid: A list of lists of integers representing the grid. Each `grid[i][j]`
                   is the amount of gold in cell `(i, j)`. Values are `0 <= grid[i][j] <= 100`.
                   Dimensions are `1 <= m, n <= 15` (where `m` is rows, `n` is columns).
+                  Other inputs (NumPy arrays, 2D `memoryview`s, flat buffers with `shape`,
+                  tuples of rows) are never written to: they are read in place through
+                  `grid_rows` by the iterative engine, which gives the same result.
+            shape: `(rows, cols)` when `grid` is a flat buffer.
                   
         Returns:
             The maximum amount of gold that can be collected.
@@ -92,6 +456,11 @@ class Solution:
         - The `grid` is modified in-place for visited tracking, so it does not
           add extra auxiliary space beyond the input itself.
         """
+        # The DFS below marks visited cells by writing into the grid; read-only buffers
+        # and tuples go to the iterative engine, which never writes to its input.
+        if not isinstance(grid, list):
+            return self.getMaximumGoldIterative(grid_rows(grid, shape))
+
         rows = len(grid)
         cols = len(grid[0])
         max_gold_collected = 0 # Stores the overall maximum gold found.
@@ -148,79 +517,453 @@ class Solution:
                     
         return max_gold_collected
 
-class TestSolution(unittest.TestCase):
-    def setUp(self):
-        self.sol = Solution()
-
-    def test_example_1(self):
-        grid = [[0,6,0],[5,8,7],[0,9,0]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 24)
-        # Expected path example: 9 -> 8 -> 7 (or 7 -> 8 -> 9), sum = 24.
-
-    def test_example_2(self):
-        grid = [[1,0,7],[2,0,6],[3,4,5],[0,3,0],[9,0,20]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 28)
-        # Expected path example: 1->2->3->4->5->6->7 (sum = 28)
-
-    def test_single_cell_grid(self):
-        grid = [[7]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 7)
-
-    def test_no_gold(self):
-        grid = [[0,0,0],[0,0,0],[0,0,0]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 0)
-
-    def test_isolated_gold_cells(self):
-        grid = [[1,0,10],[0,0,0],[100,0,1]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 100)
-        # The maximum gold comes from collecting from the single cell with 100 gold.
-
-    def test_simple_linear_path(self):
-        grid = [[1,1,1]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 3)
-
-    def test_forking_paths_complex(self):
-        grid = [[1,2,3],[0,10,0],[4,5,6]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 26)
-        # Path example: 3 -> 2 -> 10 -> 5 -> 6 (sum = 26)
-
-    def test_path_hitting_boundary_in_small_grid(self):
-        grid = [[1,2],[3,4]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 10)
-        # Path example: 1 -> 3 -> 4 -> 2 (sum = 10)
-
-    def test_all_zeros_except_one_path_segment(self):
-        grid = [[0,0,0,0],
-                [0,1,2,3],
-                [0,0,0,0]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 6) # Path: 1->2->3
-
-    def test_complex_grid_with_zeros_blocking(self):
-        grid = [[1,1,1,1,1],
-                [1,0,1,0,1],
-                [1,1,1,1,1]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 8)
-        # Path example: (0,0) -> (0,1) -> (0,2) -> (1,2) -> (2,2) -> (2,1) -> (2,0) -> (1,0) (sum = 8)
-
-    def test_large_grid_single_path(self):
-        grid = [[1,1,1,1,1],
-                [0,0,0,0,1],
-                [0,0,0,0,1],
-                [0,0,0,0,1],
-                [0,0,0,0,1]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 9)
-        # Path example: (0,0) -> (0,1) -> (0,2) -> (0,3) -> (0,4) -> (1,4) -> (2,4) -> (3,4) -> (4,4)
-
-    def test_disconnected_components(self):
-        grid = [[1,0,0,0,2],
-                [0,0,0,0,0],
-                [3,0,0,0,4]]
-        self.assertEqual(self.sol.getMaximumGold(grid), 4) # Max of {1, 2, 3, 4} (isolated cells)
+    def getMaximumGoldIterative(self, grid: list[list[int]]) -> int:
+        """
+        Same result as `getMaximumGold`, computed with an explicit stack instead of recursion.
+
+        The recursive version creates a Python frame for every DFS node, marks cells as
+        visited by writing 0 into the caller's grid, and depends on the recursion limit.
+        This engine avoids all three:
+        1. `build_gold_graph` flattens the gold cells into indices with a precomputed
+           neighbor table, so the hot loop never does bounds checks or grid lookups.
+        2. Visited state of the current path is a single integer bitmask (`mask`), so the
+           input grid is never mutated and concurrent calls on a shared grid are safe.
+        3. The DFS keeps one iterator over `neighbors[cell]` per path cell on a list that
+           acts as the stack. Advancing the top iterator is a "call", exhausting it is
+           a "return" that clears the cell's bit and subtracts its gold.
+
+        Args:
+            grid: A list of lists of integers, same constraints as `getMaximumGold`.
+                  The grid is only read.
+
+        Returns:
+            The maximum amount of gold that can be collected.
+
+        Time Complexity: O(G * 3^G) in the worst case, where G is the number of gold cells
+            (the same search tree as the recursive version, but with a cheaper step).
+        Space Complexity: O(G) for the adjacency table and the explicit stack.
+        """
+        _, values, neighbors = build_gold_graph(grid)
+        bits = [1 << i for i in range(len(values))]
+        max_gold_collected = 0
+
+        for start in range(len(values)):
+            mask = bits[start]                  # Cells on the current path.
+            current_path_gold = values[start]
+            if current_path_gold > max_gold_collected:
+                max_gold_collected = current_path_gold
+
+            path = [start]                      # Cells on the current path, in order.
+            pending = [iter(neighbors[start])]  # Unexplored neighbors for each path cell.
+            while pending:
+                for nxt in pending[-1]:
+                    bit = bits[nxt]
+                    if not mask & bit:
+                        # "Recurse" into the neighbor.
+                        mask |= bit
+                        current_path_gold += values[nxt]
+                        if current_path_gold > max_gold_collected:
+                            max_gold_collected = current_path_gold
+                        path.append(nxt)
+                        pending.append(iter(neighbors[nxt]))
+                        break
+                else:
+                    # All neighbors explored: backtrack out of the top cell.
+                    pending.pop()
+                    cell = path.pop()
+                    mask ^= bits[cell]
+                    current_path_gold -= values[cell]
+
+        return max_gold_collected
+
+    def getMaximumGoldPruned(self, grid: list[list[int]]) -> int:
+        """
+        Same result as `getMaximumGold`, using component decomposition and branch-and-bound.
+
+        Algorithm Steps:
+        1. Flatten the grid with `build_gold_graph` and split it into connected
+           components with `gold_components`. Paths never cross components.
+        2. Visit components by decreasing total gold. A component whose total gold
+           cannot beat the best value found so far is skipped without any search.
+        3. Inside a component, drop cut points from the start cells (see
+           `articulation_points`): an optimal path never ends on one. Start cells are
+           tried by decreasing gold so a good path is found early.
+        4. Search each start with `search_component`, which prunes any partial path whose
+           gold plus the gold still reachable from its head cannot beat the best.
+
+        Args:
+            grid: A list of lists of integers, same constraints as `getMaximumGold`.
+                  The grid is only read.
+
+        Returns:
+            The maximum amount of gold that can be collected.
+
+        Time Complexity: Still exponential in the worst case, but most subtrees are cut
+            off by the bound, and tree-like components are solved from their leaves only.
+        Space Complexity: O(G) where G is the number of gold cells.
+        """
+        _, values, neighbors = build_gold_graph(grid)
+        components = gold_components(neighbors)
+        totals = [sum(values[cell] for cell in component) for component in components]
+
+        max_gold_collected = 0
+        for component_gold, component in sorted(zip(totals, components), reverse=True):
+            if component_gold <= max_gold_collected:
+                break  # Sorted by total gold, so no later component can do better.
+            cut_points = articulation_points(component, neighbors)
+            starts = sorted((cell for cell in component if cell not in cut_points),
+                            key=values.__getitem__, reverse=True)
+            max_gold_collected = search_component(values, neighbors, starts, component_gold,
+                                                  max_gold_collected)
+        return max_gold_collected
+
+    def getMaximumGoldParallel(self, grid: list[list[int]], workers: int | None = None,
+                               min_gold_cells: int = 30) -> int:
+        """
+        Same result as `getMaximumGold`, with the start cells spread over a process pool.
+
+        Each (component, start cell) pair of `getMaximumGoldPruned` becomes one task of a
+        `concurrent.futures.ProcessPoolExecutor`. The workers share the best value found
+        so far through a `multiprocessing.Value`: every task reads it before searching,
+        prunes against it, and publishes any improvement. Tasks are submitted with the
+        richest components and start cells first so a strong bound is found early.
+
+        Args:
+            grid: A list of lists of integers, same constraints as `getMaximumGold`.
+                  The grid is only read.
+            workers: Number of worker processes. Defaults to `os.cpu_count()`.
+            min_gold_cells: Grids with fewer gold cells than this are solved serially
+                            with `getMaximumGoldPruned`, since spawning the pool would
+                            cost more than the whole search.
+
+        Returns:
+            The maximum amount of gold that can be collected.
+
+        Time Complexity: Same search as `getMaximumGoldPruned`, divided over `workers`
+            processes, plus the cost of starting the pool.
+        Space Complexity: O(G) per worker, where G is the number of gold cells.
+        """
+        workers = workers or os.cpu_count() or 1
+        _, values, neighbors = build_gold_graph(grid)
+        if workers == 1 or len(values) < min_gold_cells:
+            return self.getMaximumGoldPruned(grid)
+
+        # Only grids big enough for the pool pay for importing it.
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        tasks: list[tuple[int, int]] = []
+        for component in gold_components(neighbors):
+            component_gold = sum(values[cell] for cell in component)
+            cut_points = articulation_points(component, neighbors)
+            tasks.extend((values[cell], component_gold, cell) for cell in component if cell not in cut_points)
+        tasks.sort(key=lambda task: (task[1], task[0]), reverse=True)
+
+        shared_best = multiprocessing.Value('q', 0)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_gold_worker,
+                                 initargs=(values, neighbors, shared_best)) as pool:
+            futures = [pool.submit(_search_start_task, cell, component_gold)
+                       for _, component_gold, cell in tasks]
+            return max((future.result() for future in futures), default=0)
+
+    def getMaximumGoldAnytime(self, grid: list[list[int]], time_budget: float | None = None,
+                              node_budget: int | None = None,
+                              on_improvement: Callable[[int, list[tuple[int, int]]], None] | None = None,
+                              seed_starts: int = 8) -> tuple[int, list[tuple[int, int]], int]:
+        """
+        Anytime solver for grids far beyond the 15x15 limit (e.g. 100x100 and larger).
+
+        Instead of running until the exact answer is known, it can be stopped by a time
+        or node budget and still return the best path found so far together with a
+        proven upper bound on the optimum.
+
+        Algorithm Steps:
+        1. Flatten the grid and split it into components (`build_gold_graph`,
+           `gold_components`). Components are handled by decreasing total gold, and a
+           component whose total cannot beat the best path is proven without search.
+        2. Seeding: for every component, `greedy_gold_path` builds paths from up to
+           `seed_starts` start cells (dead ends first) and improves them locally. The
+           walk is O(G), but the detours of `improve_gold_path` can take O(G^2) per seed.
+           Seeds usually land close to the optimum on dense grids.
+        3. Exact phase: the branch-and-bound DFS of `search_component`, but also keeping
+           the path, counting expanded nodes and checking the budget. A component whose
+           search finishes is proven, and its total no longer counts towards the bound.
+        4. Every strictly better path found in steps 2-3 is streamed to `on_improvement`.
+
+        Args:
+            grid: A list of lists of integers (any size). The grid is only read.
+            time_budget: Seconds after which the search stops. `None` means no limit.
+            node_budget: Number of DFS nodes after which the exact phase stops.
+                         `None` means no limit.
+            on_improvement: Optional callback `(gold, path)` called on each improvement,
+                            where `path` is the list of `(row, col)` cells in walk order.
+            seed_starts: Maximum number of greedy seeds per component.
+
+        Returns:
+            A tuple `(gold, path, upper_bound)`. `gold` is the best gold found, `path` the
+            cells of that path, and `upper_bound` a proven bound on the optimum:
+            `gold == upper_bound` means the answer is exact.
+
+        Time Complexity: O(G^2 * seed_starts) for the seeding (not covered by the budgets),
+            then bounded by the budgets.
+        Space Complexity: O(G) where G is the number of gold cells.
+        """
+        cells, values, neighbors = build_gold_graph(grid)
+        components = gold_components(neighbors)
+        totals = [sum(values[cell] for cell in component) for component in components]
+        order = sorted(range(len(components)), key=totals.__getitem__, reverse=True)
+        proven = [False] * len(components)
+
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        node_limit = float('inf') if node_budget is None else node_budget
+        nodes = 0
+        best_gold = 0
+        best_path: list[tuple[int, int]] = []
+
+        def improve(gold: int, path: list[int]):
+            nonlocal best_gold, best_path
+            best_gold = gold
+            best_path = [cells[cell] for cell in path]
+            if on_improvement is not None:
+                on_improvement(best_gold, best_path)
+
+        def out_of_time() -> bool:
+            return deadline is not None and time.perf_counter() >= deadline
+
+        def upper_bound() -> int:
+            return max([best_gold] + [totals[k] for k in range(len(components)) if not proven[k]])
+
+        # Phase 1: greedy seeds, so there is a good answer even with a tiny budget.
+        starts_by_component = []
+        for k in order:
+            cut_points = articulation_points(components[k], neighbors)
+            starts = sorted((cell for cell in components[k] if cell not in cut_points),
+                            key=lambda cell: (len(neighbors[cell]), -values[cell]))
+            starts_by_component.append(starts)
+            for start in starts[:seed_starts]:
+                if totals[k] <= best_gold or out_of_time():
+                    break
+                path = greedy_gold_path(start, values, neighbors)
+                gold = sum(values[cell] for cell in path)
+                if gold > best_gold:
+                    improve(gold, path)
+
+        # Phase 2: exact branch-and-bound, component by component, within the budget.
+        bits = [1 << i for i in range(len(values))]
+        for k, starts in zip(order, starts_by_component):
+            for start in sorted(starts, key=values.__getitem__, reverse=True):
+                if totals[k] <= best_gold:
+                    break
+                mask = bits[start]
+                current_path_gold = values[start]
+                if current_path_gold > best_gold:
+                    improve(current_path_gold, [start])
+                path = [start]
+                pending = [iter(neighbors[start])]
+                while pending:
+                    # The clock is read on every node: a node can cost a flood over the
+                    # whole component, which dwarfs the cost of `perf_counter`.
+                    nodes += 1
+                    if nodes >= node_limit or out_of_time():
+                        return best_gold, best_path, upper_bound()
+
+                    for nxt in pending[-1]:
+                        bit = bits[nxt]
+                        if mask & bit:
+                            continue
+                        gold = current_path_gold + values[nxt]
+                        bound = gold
+                        seen = mask | bit
+                        flood = [nxt]
+                        while flood and bound <= best_gold:
+                            for cell in neighbors[flood.pop()]:
+                                cell_bit = bits[cell]
+                                if not seen & cell_bit:
+                                    seen |= cell_bit
+                                    bound += values[cell]
+                                    flood.append(cell)
+                        if bound <= best_gold:
+                            continue
+
+                        mask |= bit
+                        current_path_gold = gold
+                        path.append(nxt)
+                        pending.append(iter(neighbors[nxt]))
+                        if gold > best_gold:
+                            improve(gold, path)
+                        break
+                    else:
+                        pending.pop()
+                        cell = path.pop()
+                        mask ^= bits[cell]
+                        current_path_gold -= values[cell]
+            proven[k] = True
+
+        return best_gold, best_path, upper_bound()
+
+    def getMaximumGoldWithPath(self, grid: list[list[int]]) -> tuple[int, list[tuple[int, int]]]:
+        """
+        Maximum gold together with the cells of one optimal path.
+
+        Each component is reduced to its canonical shape (`canonical_component`) and
+        solved through the LRU cache of `solve_canonical_component`, so identical
+        components (also translated, rotated or mirrored) are only searched once per
+        process. As in `getMaximumGoldPruned`, components are visited by decreasing
+        total gold and skipped once their total cannot beat the best path.
+
+        Args:
+            grid: A list of lists of integers, same constraints as `getMaximumGold`.
+                  The grid is only read.
+
+        Returns:
+            A tuple `(gold, path)` where `path` lists the `(row, col)` cells of an optimal
+            path in walk order (empty if the grid has no gold).
+        """
+        cells, values, neighbors = build_gold_graph(grid)
+        components = gold_components(neighbors)
+        totals = [sum(values[cell] for cell in component) for component in components]
+
+        best_gold, best_path = 0, []
+        for component_gold, component in sorted(zip(totals, components), reverse=True):
+            if component_gold <= best_gold:
+                break
+            shape, to_original = canonical_component([cells[cell] for cell in component],
+                                                     [values[cell] for cell in component])
+            gold, path = solve_canonical_component(shape)
+            if gold > best_gold:
+                best_gold, best_path = gold, [to_original[cell] for cell in path]
+        return best_gold, best_path
+
+    def getMaximumGoldBatch(self, grids: Iterable[list[list[int]]]) -> list[tuple[int, list[tuple[int, int]]]]:
+        """
+        Runs `getMaximumGoldWithPath` over many grids, sharing its component cache.
+
+        Args:
+            grids: Any iterable of grids.
+
+        Returns:
+            One `(gold, path)` tuple per grid, in input order.
+        """
+        return [self.getMaximumGoldWithPath(grid) for grid in grids]
+
+
+def random_gold_grid(rows: int, cols: int, gold_cells: int, seed: int) -> list[list[int]]:
+    """
+    Builds a seeded random grid with `gold_cells` cells of gold (values 1..100).
+
+    The gold cells are grown as one connected blob from the center, which is the
+    worst case for the search (every cell is reachable from every other one).
+    """
+    rng = random.Random(seed)
+    grid = [[0] * cols for _ in range(rows)]
+    frontier = [(rows // 2, cols // 2)]
+    placed = 0
+    while frontier and placed < gold_cells:
+        r, c = frontier.pop(rng.randrange(len(frontier)))
+        if grid[r][c]:
+            continue
+        grid[r][c] = rng.randint(1, 100)
+        placed += 1
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and not grid[nr][nc]:
+                frontier.append((nr, nc))
+    return grid
+
+
+def run_benchmarks(sizes: tuple[int, ...] = (12, 16, 20, 25), large_sizes: tuple[int, ...] = (30, 35, 40),
+                   dense_sizes: tuple[int, ...] = (150, 200, 225), dense_budget: float = 1.0,
+                   repeats: int = 3):
+    """
+    Times the engines on seeded 15x15 grids and prints one table per comparison.
+
+    Dense grids (`dense_sizes` gold cells, up to all 225) are only given to the
+    anytime engine, stopped after `dense_budget` seconds, so every table finishes.
+
+    Run with: python k_smallest_sum_pairs.py --bench
+    """
+    sol = Solution()
+
+    def best_time(method, grid):
+        best, result = float('inf'), None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = method([row[:] for row in grid])
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    engines = [("recursive", sol.getMaximumGold), ("iterative", sol.getMaximumGoldIterative),
+               ("pruned", sol.getMaximumGoldPruned)]
+    print(f"{'gold cells':>10} | " + " | ".join(f"{name + ' (s)':>13}" for name, _ in engines))
+    for gold_cells in sizes:
+        grid = random_gold_grid(15, 15, gold_cells, seed=gold_cells)
+        timings = [best_time(method, grid) for _, method in engines]
+        assert len({result for _, result in timings}) == 1, f"Engines disagree on {gold_cells} cells"
+        print(f"{gold_cells:>10} | " + " | ".join(f"{elapsed:>13.4f}" for elapsed, _ in timings))
+
+    # The exhaustive engines are too slow on these sizes; only the pruning ones are timed.
+    workers = os.cpu_count() or 1
+    print(f"\n{'gold cells':>10} | {'pruned (s)':>13} | {f'parallel x{workers} (s)':>16} | {'max gold':>8}")
+    for gold_cells in large_sizes:
+        grid = random_gold_grid(15, 15, gold_cells, seed=gold_cells)
+        t_pruned, result = best_time(sol.getMaximumGoldPruned, grid)
+        t_parallel, parallel_result = best_time(lambda g: sol.getMaximumGoldParallel(g, workers, 0), grid)
+        assert result == parallel_result, f"Engines disagree on {gold_cells} cells"
+        print(f"{gold_cells:>10} | {t_pruned:>13.4f} | {t_parallel:>16.4f} | {result:>8}")
+
+    # Dense grids: the exact engines would have to rule out every other long path, so
+    # only the anytime engine runs, under a time budget. gold == bound means proven.
+    print(f"\n{'gold cells':>10} | {'anytime (s)':>11} | {'best gold':>9} | {'upper bound':>11}")
+    for gold_cells in dense_sizes:
+        grid = random_gold_grid(15, 15, gold_cells, seed=gold_cells)
+        start = time.perf_counter()
+        gold, _, bound = sol.getMaximumGoldAnytime(grid, time_budget=dense_budget)
+        elapsed = time.perf_counter() - start
+        print(f"{gold_cells:>10} | {elapsed:>11.4f} | {gold:>9} | {bound:>11}")
+
+    # Batch mode: 2000 grids built from 50 distinct components, randomly moved, rotated and mirrored.
+    rng = random.Random(0)
+    shapes = [random_gold_grid(5, 5, 14, seed) for seed in range(50)]
+    batch = []
+    for _ in range(2000):
+        a, b, c, d = rng.choice(SYMMETRIES)
+        shape = rng.choice(shapes)
+        moved = {(a * r + b * col, c * r + d * col): v
+                 for r, row in enumerate(shape) for col, v in enumerate(row) if v}
+        min_r, min_c = min(r for r, _ in moved), min(col for _, col in moved)
+        off_r, off_c = rng.randrange(10), rng.randrange(10)
+        grid = [[0] * 15 for _ in range(15)]
+        for (r, col), v in moved.items():
+            grid[r - min_r + off_r][col - min_c + off_c] = v
+        batch.append(grid)
+    solve_canonical_component.cache_clear()
+    start = time.perf_counter()
+    batch_results = sol.getMaximumGoldBatch(batch)
+    t_batch = time.perf_counter() - start
+    start = time.perf_counter()
+    loop_results = [sol.getMaximumGoldPruned(grid) for grid in batch]
+    t_loop = time.perf_counter() - start
+    assert [gold for gold, _ in batch_results] == loop_results
+    print(f"\n{'grids':>6} | {'pruned loop (s)':>15} | {'batch (s)':>9} | cache")
+    print(f"{len(batch):>6} | {t_loop:>15.4f} | {t_batch:>9.4f} | {solve_canonical_component.cache_info()}")
+
+    # Anytime mode on grids where no exact engine finishes: quality reached per budget.
+    print(f"\n{'grid':>9} | {'gold cells':>10} | {'budget (s)':>10} | {'best gold':>9} | {'upper bound':>11}")
+    for size, budget in ((100, 0.5), (100, 2.0), (200, 2.0)):
+        grid = random_gold_grid(size, size, size * size // 2, seed=size)
+        gold, _, bound = sol.getMaximumGoldAnytime(grid, time_budget=budget)
+        print(f"{f'{size}x{size}':>9} | {size * size // 2:>10} | {budget:>10.1f} | {gold:>9} | {bound:>11}")
+
 
 if __name__ == '__main__':
-    # Using unittest.main() to run tests.
-    # argv=['first-arg-is-ignored'] and exit=False are used to allow
-    # the script to run tests without trying to parse command-line arguments
-    # and without exiting the program immediately after tests, which is useful
-    # in some interactive environments or when integrating with other code.
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
\ No newline at end of file
+    if '--bench' in sys.argv[1:]:
+        run_benchmarks()
+    else:
+        # Using unittest.main() to run tests.
+        # argv=['first-arg-is-ignored'] and exit=False are used to allow
+        # the script to run tests without trying to parse command-line arguments
+        # and without exiting the program immediately after tests, which is useful
+        # in some interactive environments or when integrating with other code.
+        # The tests live in test_k_smallest_sum_pairs.py, so the solver never imports unittest.
+        import unittest
+        unittest.main(module='test_k_smallest_sum_pairs', argv=['first-arg-is-ignored'], exit=False)
\ No newline at end of file
@@ -1,7 +1,205 @@
+import array
+import collections
+import itertools
+import operator
+import os
 import sys
+from typing import Iterable, Iterator, Sequence
+
+# Helpers shared by several problem files live in `problems/`, which is not a package.
+_PROBLEMS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROBLEMS_DIR not in sys.path:
+    sys.path.append(_PROBLEMS_DIR)
+from buffer_views import numpy_matrix, numpy_required, optional_numpy, typed_view
+
+
+def read_packed_ints(path: str | os.PathLike, typecode: str = 'i', chunk_size: int = 1 << 20) -> Iterator[array.array]:
+    """
+    Reads a binary file of packed native-endian integers as a stream of `array` chunks.
+
+    Each chunk is filled in place with `readinto` through a `memoryview`, so no Python
+    `int` list and no `bytes` copy is ever built, and at most `chunk_size` values are held
+    in memory at once whatever the file size.
+
+    Args:
+        path: Path of the binary file.
+        typecode: `array` typecode of the values, e.g. 'i' (int32) or 'q' (int64).
+        chunk_size: Number of values per chunk.
+
+    Raises:
+        ValueError: If the file size is not a multiple of the item size.
+    """
+    buffer = array.array(typecode, [0]) * chunk_size
+    view = memoryview(buffer).cast('B')
+    with open(path, 'rb') as f:
+        while True:
+            read = f.readinto(view)
+            if not read:
+                return
+            if read % buffer.itemsize:
+                raise ValueError(f"Trailing {read % buffer.itemsize} bytes in {path!r}: "
+                                 f"file size is not a multiple of {buffer.itemsize}")
+            # The last chunk is shorter; slicing copies only that final partial chunk.
+            yield buffer if read == len(view) else buffer[:read // buffer.itemsize]
+
+
+# A segment summary is `(total, best_prefix, best_suffix, best)`: the sum of the segment,
+# the best sum of a non-empty prefix, of a non-empty suffix, and of any non-empty subarray.
+Summary = tuple[int, int, int, int]
+
+
+def segment_summary(nums: Sequence[int], start: int = 0, stop: int | None = None) -> Summary:
+    """
+    Summary of `nums[start:stop]` (non-empty) in one pass, without copying the slice.
+
+    With prefix sums P0 = 0, P1, ..., Pn of the segment:
+    best_prefix = max(P1..Pn), best_suffix = Pn - min(P0..Pn-1), and
+    best = max over j of (Pj - min(P0..Pj-1)), which is Kadane's answer.
+    """
+    stop = len(nums) if stop is None else stop
+    total = 0
+    min_prefix = 0
+    min_before_last = 0
+    best_prefix = best = nums[start]
+    # `islice` would step through the first `start` items to reach the shard, making
+    # the last shards of a parallel run cost O(N) each; index the shard instead.
+    values = itertools.islice(nums, stop) if start == 0 else map(nums.__getitem__, range(start, stop))
+    for num in values:
+        total += num
+        if total - min_prefix > best:
+            best = total - min_prefix
+        if total > best_prefix:
+            best_prefix = total
+        min_before_last = min_prefix
+        if total < min_prefix:
+            min_prefix = total
+    return total, best_prefix, total - min_before_last, best
+
+
+def numpy_segment_summary(shard) -> Summary:
+    """
+    Vectorized `segment_summary` of a non-empty 1D NumPy array, using cumulative sums.
+    """
+    np = optional_numpy()
+    prefix = np.cumsum(shard, dtype=np.int64)
+    before = np.empty_like(prefix)  # P0..Pn-1
+    before[0] = 0
+    before[1:] = prefix[:-1]
+    total = int(prefix[-1])
+    best = int((prefix - np.minimum.accumulate(before)).max())
+    return total, int(prefix.max()), total - int(before.min()), best
+
+
+def numpy_int64_array(nums):
+    """
+    `nums` as a 1D int64 NumPy array, or `None` if an int64 prefix sum of it could
+    overflow (`numpy_segment_summary` would then be wrong where Python ints are not).
+
+    The bound is conservative: N * max|x| < 2**63.
+    """
+    np = optional_numpy()
+    data = np.asarray(nums)
+    if data.dtype.kind not in 'iu' or data.ndim != 1:
+        return None
+    if len(data) * max(abs(int(data.min())), abs(int(data.max()))) >= 1 << 63:
+        return None
+    return data.astype(np.int64, copy=False)
+
+
+def merge_summaries(left: Summary, right: Summary) -> Summary:
+    """
+    Summary of the concatenation of two adjacent segments. The merge is associative,
+    so shard summaries can be combined in any grouping (but in order).
+    """
+    left_total, left_prefix, left_suffix, left_best = left
+    right_total, right_prefix, right_suffix, right_best = right
+    return (left_total + right_total,
+            max(left_prefix, left_total + right_prefix),
+            max(right_suffix, right_total + left_suffix),
+            max(left_best, right_best, left_suffix + right_prefix))
+
+
+# Input of the parallel engine inside a worker process, set once by `_init_shared_nums`
+# (the pool initializer). With `fork` the initializer arguments are inherited, not
+# pickled, so shards are read in place. The parent process never assigns it, so
+# concurrent `maxSubArrayParallel` calls cannot see each other's input.
+_shared_nums: Sequence[int] = ()
+
+
+def _init_shared_nums(nums: Sequence[int]) -> None:
+    global _shared_nums
+    _shared_nums = nums
+
+
+def _summarize_shared_shard(start: int, stop: int) -> Summary:
+    return segment_summary(_shared_nums, start, stop)
+
+
+def matrix_lines(matrix, shape: tuple[int, int] | None = None,
+                 transpose: bool = False) -> tuple[list[Sequence[int]], int]:
+    """
+    Rows (or columns, with `transpose=True`) of a 2D input as zero-copy sequences.
+
+    Accepted inputs:
+    - A list of lists: rows are used as they are (columns are built with `zip`).
+    - Any buffer-protocol object (`array`, `bytes`, `mmap`, NumPy array, 2D
+      `memoryview`...): it is viewed as a flat typed `memoryview`, rows are slices
+      and columns strided slices of it, so no element is copied (except for strided
+      2D buffers, which `typed_view` copies once). 1D buffers need `shape=(rows, cols)`.
+
+    Returns:
+        A tuple `(lines, length)` with the list of lines and the length of each line.
+    """
+    if isinstance(matrix, list):
+        rows, cols = len(matrix), len(matrix[0]) if matrix else 0
+        if transpose:
+            return [list(column) for column in zip(*matrix)], rows
+        return matrix, cols
+
+    view = memoryview(matrix)
+    if view.ndim == 2:
+        rows, cols = view.shape
+        view = typed_view(view)
+    elif shape is not None:
+        rows, cols = shape
+    else:
+        raise ValueError("1D buffers need shape=(rows, cols)")
+    if len(view) != rows * cols:
+        raise ValueError(f"Buffer of {len(view)} items does not match shape {(rows, cols)}")
+    if transpose:
+        return [view[c::cols] for c in range(cols)], rows
+    return [view[r * cols:(r + 1) * cols] for r in range(rows)], cols
+
+
+def numpy_rows_kadane(data) -> tuple:
+    """
+    Kadane's algorithm on every row of a 2D NumPy array at once.
+
+    The loop runs over the columns; each step updates the state of all rows with one
+    vectorized operation, with the same restart/tie rule as `maxSubArrayStream`.
+
+    Returns:
+        Three 1D arrays `(best, start, end)`, one entry per row.
+    """
+    np = optional_numpy()
+    current = data[:, 0].astype(np.int64)
+    best = current.copy()
+    current_start = np.zeros(len(data), dtype=np.int64)
+    best_start = np.zeros(len(data), dtype=np.int64)
+    best_end = np.zeros(len(data), dtype=np.int64)
+    for j in range(1, data.shape[1]):
+        restart = current < 0
+        current = np.where(restart, data[:, j], current + data[:, j])
+        current_start = np.where(restart, j, current_start)
+        better = current > best
+        best = np.where(better, current, best)
+        best_start = np.where(better, current_start, best_start)
+        best_end = np.where(better, j, best_end)
+    return best, best_start, best_end
+
 
 class Solution:
-    def maxSubArray(self, nums: list[int]) -> int:
+    def maxSubArray(self, nums: list[int], typecode: str | None = None) -> int:
         """
         Finds the contiguous subarray within a given integer array `nums` that has the largest sum.
         
@@ -25,10 +223,18 @@ class Solution:
         non-empty. Therefore, both `max_current` and `max_global` can be safely initialized
         with the first element of the array (`nums[0]`).
 
+        Buffer inputs (`array`, `bytes`, `mmap`, NumPy arrays, `memoryview`...) are read
+        in place through `typed_view` (multi-dimensional ones in row-major order), with
+        no conversion to a list, and summarized by `segment_summary`, the same prefix-sum
+        formulation of Kadane's algorithm that the parallel engine uses. Lists and other
+        sequences take the loop below unchanged.
+
         Args:
             nums: A list of integers. Representing the input array.
                   Constraints: 1 <= nums.length <= 10^5
                                -10^4 <= nums[i] <= 10^4
+            typecode: `array` typecode of the values when `nums` is raw bytes (`bytes`,
+                      `mmap`...), e.g. 'q' for packed int64. Typed buffers need none.
 
         Returns:
             An integer representing the maximum sum of any contiguous subarray within `nums`.
@@ -45,6 +251,11 @@ class Solution:
             No additional data structures that grow with the input size are allocated.
         """
         
+        if not isinstance(nums, list):
+            view = typed_view(nums, typecode)
+            if view is not None:
+                return segment_summary(view)[3]
+
         # Initialize max_current and max_global with the first element of the array.
         # This is safe due to the problem constraints guaranteeing a non-empty array.
         max_current: int = nums[0]  # Maximum sum of a subarray ending at the current position
@@ -67,6 +278,492 @@ class Solution:
             
         return max_global
 
+    def maxSubArrayStream(self, source: Iterable[int] | str | os.PathLike, typecode: str = 'i',
+                          chunk_size: int = 1 << 20) -> tuple[int, int, int]:
+        """
+        Constant-memory Kadane over any iterable of integers or a binary file of packed integers.
+
+        Same recurrence (and tie-breaking) as `maxSubArray`, but the input is consumed
+        one element at a time, so it never needs to be a materialized list:
+        - Any iterable (generator, `array`, `memoryview`, file reader...) is used as is.
+        - A `str`/`os.PathLike` is a path to a file of packed native-endian integers of
+          type `typecode`, read in chunks of `chunk_size` values by `read_packed_ints`.
+
+        Besides the sums, the start of the subarray ending at the current element is
+        tracked, so the result also says where the best subarray lies.
+
+        Args:
+            source: An iterable of integers, or the path of a binary file.
+            typecode: `array` typecode for files: 'i' for int32, 'q' for int64.
+            chunk_size: Number of values read from a file at once.
+
+        Returns:
+            A tuple `(best_sum, start, end)` where `start` and `end` are the 0-based,
+            inclusive offsets (in elements) of the first subarray reaching `best_sum`.
+
+        Raises:
+            ValueError: If the input is empty.
+
+        Time Complexity: O(N)
+        Space Complexity: O(1) for iterables, O(chunk_size) for files.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            values = itertools.chain.from_iterable(read_packed_ints(source, typecode, chunk_size))
+        else:
+            values = iter(source)
+
+        try:
+            max_current: int = next(values)
+        except StopIteration:
+            raise ValueError("Input cannot be empty. (Problem constraints: nums.length >= 1)") from None
+        max_global: int = max_current
+        current_start = best_start = best_end = 0
+
+        for i, num in enumerate(values, 1):
+            # Same choice as `max(num, max_current + num)`: restart only if the running
+            # sum is negative, which keeps the first-found subarray on ties.
+            if max_current < 0:
+                max_current = num
+                current_start = i
+            else:
+                max_current += num
+            if max_current > max_global:
+                max_global = max_current
+                best_start, best_end = current_start, i
+
+        return max_global, best_start, best_end
+
+
+    def maxSubArrayParallel(self, nums: Sequence[int], workers: int | None = None,
+                            min_shard_size: int = 1 << 16) -> int:
+        """
+        Same result as `maxSubArray`, computed by divide and conquer over shards.
+
+        Kadane's loop is serial, but the maximum subarray problem has an associative
+        formulation: each shard is reduced to a `(total, best_prefix, best_suffix, best)`
+        summary, and `merge_summaries` combines adjacent summaries exactly. So the shards
+        can be summarized independently:
+        - With NumPy installed, each shard is summarized in this process by
+          `numpy_segment_summary`: the vectorized cumulative sums replace the pool,
+          and no worker is started. Inputs whose int64 prefix sums could overflow
+          (see `numpy_int64_array`) take the pure Python path below instead.
+        - Otherwise the shards go to a process pool running `segment_summary`. On
+          platforms with `fork`, workers get the input through the pool initializer
+          and inherit it from the parent, so no shard is pickled; elsewhere the shards
+          are sent as slices.
+        Inputs shorter than `2 * min_shard_size`, or `workers=1`, are summarized serially.
+
+        Args:
+            nums: A non-empty sequence of integers (list, `array`, NumPy array...).
+            workers: Number of worker processes. Defaults to `os.cpu_count()`.
+            min_shard_size: Minimum number of elements per shard.
+
+        Returns:
+            The maximum sum of any contiguous subarray, identical to `maxSubArray`.
+
+        Raises:
+            ValueError: If `nums` is empty.
+
+        Time Complexity: O(N / workers + workers)
+        Space Complexity: O(workers) summaries (plus O(shard) temporaries for NumPy).
+        """
+        n = len(nums)
+        if n == 0:
+            raise ValueError("Input cannot be empty. (Problem constraints: nums.length >= 1)")
+        workers = workers or os.cpu_count() or 1
+        shards = max(1, min(workers * 4, n // min_shard_size))
+        bounds = [(n * k // shards, n * (k + 1) // shards) for k in range(shards)]
+
+        data = numpy_int64_array(nums) if optional_numpy() is not None else None
+        if data is not None:
+            summaries = [numpy_segment_summary(data[start:stop]) for start, stop in bounds]
+        elif workers == 1 or shards == 1:
+            summaries = [segment_summary(nums, start, stop) for start, stop in bounds]
+        else:
+            # Only inputs big enough for the pool pay for importing it.
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            if 'fork' in multiprocessing.get_all_start_methods():
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                         initializer=_init_shared_nums, initargs=(nums,)) as pool:
+                    summaries = list(pool.map(_summarize_shared_shard, *zip(*bounds)))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    summaries = list(pool.map(segment_summary, [nums[start:stop] for start, stop in bounds]))
+
+        result = summaries[0]
+        for summary in summaries[1:]:
+            result = merge_summaries(result, summary)
+        return result[3]
+
+
+    def maxSubArrayOfSizeK(self, nums: list[int], k: int) -> int:
+        """
+        Maximum sum of any contiguous subarray of exactly `k` elements.
+
+        For many values of `k` over the same array, build one `WindowSumIndex` and call
+        `maxExactlyMany` instead, so the prefix sums are computed once.
+
+        Time Complexity: O(N)
+        Space Complexity: O(N) for the prefix sums.
+        """
+        return WindowSumIndex(nums).maxExactly(k)
+
+
+    def maxSubArrayRows(self, matrix, shape: tuple[int, int] | None = None) -> list[tuple[int, int, int]]:
+        """
+        `maxSubArrayStream` applied to every row of a 2D input, in one call.
+
+        With NumPy installed the rows are processed together by `numpy_rows_kadane`
+        (vectorized along the row axis). Without it, each row is a zero-copy view from
+        `matrix_lines` streamed through `maxSubArrayStream`.
+
+        Args:
+            matrix: A list of lists, a 2D buffer-protocol object or NumPy array, or a
+                    flat buffer together with `shape`.
+            shape: `(rows, cols)` for flat buffers.
+
+        Returns:
+            One `(best_sum, start, end)` tuple per row, with inclusive column offsets.
+
+        Time Complexity: O(R * C)
+        Space Complexity: O(R) (NumPy state vectors), O(1) per row otherwise.
+        """
+        np = optional_numpy() if not isinstance(matrix, list) else None
+        if np is not None:
+            data = numpy_matrix(matrix, shape)
+            best, start, end = numpy_rows_kadane(data)
+            return list(zip(best.tolist(), start.tolist(), end.tolist()))
+        lines, _ = matrix_lines(matrix, shape)
+        return [self.maxSubArrayStream(line) for line in lines]
+
+    def maxSubMatrix(self, matrix, shape: tuple[int, int] | None = None) -> tuple[int, int, int, int, int]:
+        """
+        Maximum-sum submatrix (2D Kadane), reusing the batched row kernel.
+
+        For each first line `top` of the shorter dimension, the running sums of lines
+        `top..bottom` for every `bottom` form a compressed matrix whose row `bottom - top`
+        is the column-sum vector of that band. One `maxSubArrayRows` call then solves
+        all bands starting at `top` at once. If there are more rows than columns the
+        input is processed transposed (through strided views for buffers), so the
+        number of bands is quadratic in the smaller side.
+
+        Args:
+            matrix: Same inputs as `maxSubArrayRows`. Must be non-empty.
+            shape: `(rows, cols)` for flat buffers.
+
+        Returns:
+            A tuple `(best_sum, top, left, bottom, right)` with inclusive coordinates.
+
+        Time Complexity: O(min(R, C)^2 * max(R, C))
+        Space Complexity: O(R * C) for the compressed matrix of one `top`.
+        """
+        np = optional_numpy() if not isinstance(matrix, list) else None
+        if np is not None:
+            data = numpy_matrix(matrix, shape)
+            transposed = data.shape[0] > data.shape[1]
+            lines = data.T if transposed else data
+        else:
+            lines, cols = matrix_lines(matrix, shape)
+            transposed = len(lines) > cols
+            if transposed:
+                lines, _ = matrix_lines(matrix, shape, transpose=True)
+
+        # Only the compressed matrix of the current `top` is alive at any time.
+        best = None
+        for top in range(len(lines)):
+            if isinstance(lines, list):
+                compressed = [list(lines[top])]
+                for line in lines[top + 1:]:
+                    compressed.append(list(map(operator.add, compressed[-1], line)))
+            else:
+                compressed = np.cumsum(lines[top:], axis=0, dtype=np.int64)
+            for offset, (total, start, end) in enumerate(self.maxSubArrayRows(compressed)):
+                if best is None or total > best[0]:
+                    best = (total, top, start, top + offset, end)
+
+        total, top, start, bottom, end = best
+        if transposed:
+            return total, start, top, end, bottom
+        return total, top, start, bottom, end
+
+
+class WindowSumIndex:
+    """
+    Maximum window sums for many window sizes `k` over the same array.
+
+    The prefix sums P0 = 0, P1, ..., Pn are built once in the constructor; every query
+    then works on them only:
+    - Exactly k elements: max over i of `P[i + k] - P[i]`. This is one vectorized pass:
+      NumPy array differences when NumPy is installed, otherwise `map(operator.sub)`
+      over two list views, which runs the loop in C.
+    - At most k elements: max over j of `P[j] - min(P[j - k .. j - 1])`. The sliding
+      minimum is kept in a monotonic deque of prefix positions, so each position is
+      pushed and popped once: O(N) per k.
+
+    Example:
+        >>> index = WindowSumIndex([2, 1, 5, 1, 3, 2])
+        >>> index.maxExactlyMany([1, 2, 3])
+        [5, 6, 9]
+        >>> index.maxAtMost(2)
+        6
+    """
+    def __init__(self, nums: Iterable[int]):
+        self.prefix: list[int] = list(itertools.accumulate(nums, initial=0))
+        self.n = len(self.prefix) - 1
+        if self.n == 0:
+            raise ValueError("Input cannot be empty. (Problem constraints: nums.length >= 1)")
+        np = optional_numpy()
+        self._prefix_np = np.array(self.prefix, dtype=np.int64) if np is not None else None
+
+    def maxExactly(self, k: int) -> int:
+        """
+        Maximum sum of a window of exactly `k` elements. O(N - k).
+
+        Raises:
+            ValueError: If `k` is not in `1..N`.
+        """
+        if not 1 <= k <= self.n:
+            raise ValueError(f"k must be between 1 and {self.n}, got {k}")
+        if self._prefix_np is not None:
+            return int((self._prefix_np[k:] - self._prefix_np[:-k]).max())
+        return max(map(operator.sub, itertools.islice(self.prefix, k, None), self.prefix))
+
+    def maxAtMost(self, k: int) -> int:
+        """
+        Maximum sum of a non-empty window of at most `k` elements. O(N).
+        With `k >= N` this is the unconstrained answer of `maxSubArray`.
+
+        Raises:
+            ValueError: If `k < 1`.
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        prefix = self.prefix
+        window = collections.deque()  # Positions i in [j - k, j - 1], with increasing P[i].
+        best = prefix[1] - prefix[0]
+        for j in range(1, self.n + 1):
+            i = j - 1
+            while window and prefix[window[-1]] >= prefix[i]:
+                window.pop()
+            window.append(i)
+            if window[0] < j - k:
+                window.popleft()
+            if prefix[j] - prefix[window[0]] > best:
+                best = prefix[j] - prefix[window[0]]
+        return best
+
+    def maxExactlyMany(self, ks: Iterable[int]) -> list[int]:
+        """
+        `maxExactly` for every `k` in `ks`, in order.
+        """
+        return [self.maxExactly(k) for k in ks]
+
+    def maxAtMostMany(self, ks: Iterable[int]) -> list[int]:
+        """
+        `maxAtMost` for every `k` in `ks`, in order.
+        """
+        return [self.maxAtMost(k) for k in ks]
+
+
+class MaxSubarrayTree:
+    """
+    Updatable index answering maximum-subarray queries over any range of a series.
+
+    It is a segment tree over the same `(total, best_prefix, best_suffix, best)`
+    summaries as `maxSubArrayParallel`, extended with the positions where the best
+    prefix ends, the best suffix starts and the best subarray lies. Both point updates
+    and range queries touch O(log N) nodes.
+
+    The tree is a flat, iterative (bottom-up) segment tree: node `i` has children `2i`
+    and `2i + 1`, and leaf `k` is node `size + k` where `size` is the next power of two.
+    Each field is stored in its own `array('q')` instead of one object per node, which
+    keeps it at 64 bytes per node. Unused leaves hold an "empty" summary whose sums are
+    `_EMPTY` (far below any real sum), so they never win a comparison.
+
+    Example:
+        >>> tree = MaxSubarrayTree([-2, 1, -3, 4, -1, 2, 1, -5, 4])
+        >>> tree.query(0, 8)
+        (6, 3, 6)
+        >>> tree.update(7, 5)
+        >>> tree.query(0, 8)
+        (15, 3, 8)
+    """
+    _EMPTY = -(1 << 62)
+
+    def __init__(self, nums: Iterable[int]):
+        """
+        Bulk build in O(N): fills the leaves, then merges every inner node once.
+        """
+        values = nums if isinstance(nums, (list, array.array)) else list(nums)
+        self.n = len(values)
+        self.size = 1
+        while self.size < max(self.n, 1):
+            self.size *= 2
+        nodes = 2 * self.size
+
+        empty = array.array('q', [self._EMPTY]) * nodes
+        self.total = array.array('q', [0]) * nodes
+        self.prefix, self.suffix, self.best = array.array('q', empty), array.array('q', empty), empty
+        self.prefix_end = array.array('q', [0]) * nodes
+        self.suffix_start = array.array('q', self.prefix_end)
+        self.best_start = array.array('q', self.prefix_end)
+        self.best_end = array.array('q', self.prefix_end)
+
+        for k, value in enumerate(values):
+            self._set_leaf(self.size + k, k, value)
+        for i in range(self.size - 1, 0, -1):
+            self._store(i, self._merge(self._node(2 * i), self._node(2 * i + 1)))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _set_leaf(self, i: int, k: int, value: int):
+        self.total[i] = self.prefix[i] = self.suffix[i] = self.best[i] = value
+        self.prefix_end[i] = self.suffix_start[i] = self.best_start[i] = self.best_end[i] = k
+
+    def _node(self, i: int) -> tuple[int, ...]:
+        return (self.total[i], self.prefix[i], self.prefix_end[i], self.suffix[i], self.suffix_start[i],
+                self.best[i], self.best_start[i], self.best_end[i])
+
+    def _store(self, i: int, node: tuple[int, ...]):
+        (self.total[i], self.prefix[i], self.prefix_end[i], self.suffix[i], self.suffix_start[i],
+         self.best[i], self.best_start[i], self.best_end[i]) = node
+
+    @staticmethod
+    def _merge(left: tuple[int, ...] | None, right: tuple[int, ...] | None) -> tuple[int, ...] | None:
+        """
+        `merge_summaries` with positions. On ties the leftmost candidate wins.
+        `None` stands for an empty range (used by the query accumulators).
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        l_total, l_prefix, l_prefix_end, l_suffix, l_suffix_start, l_best, l_best_start, l_best_end = left
+        r_total, r_prefix, r_prefix_end, r_suffix, r_suffix_start, r_best, r_best_start, r_best_end = right
+
+        if l_prefix >= l_total + r_prefix:
+            prefix, prefix_end = l_prefix, l_prefix_end
+        else:
+            prefix, prefix_end = l_total + r_prefix, r_prefix_end
+        if r_suffix > r_total + l_suffix:
+            suffix, suffix_start = r_suffix, r_suffix_start
+        else:
+            suffix, suffix_start = r_total + l_suffix, l_suffix_start
+
+        best, best_start, best_end = l_best, l_best_start, l_best_end
+        if l_suffix + r_prefix > best:
+            best, best_start, best_end = l_suffix + r_prefix, l_suffix_start, r_prefix_end
+        if r_best > best:
+            best, best_start, best_end = r_best, r_best_start, r_best_end
+
+        # Keep padding sums pinned at the sentinel instead of drifting below it.
+        return (l_total + r_total, max(prefix, MaxSubarrayTree._EMPTY), prefix_end,
+                max(suffix, MaxSubarrayTree._EMPTY), suffix_start,
+                max(best, MaxSubarrayTree._EMPTY), best_start, best_end)
+
+    def update(self, index: int, val: int):
+        """
+        Sets `nums[index] = val` and refreshes the O(log N) ancestors of its leaf.
+        """
+        if not 0 <= index < self.n:
+            raise IndexError(f"index {index} out of range for {self.n} elements")
+        i = self.size + index
+        self._set_leaf(i, index, val)
+        i //= 2
+        while i:
+            self._store(i, self._merge(self._node(2 * i), self._node(2 * i + 1)))
+            i //= 2
+
+    def query(self, left: int, right: int) -> tuple[int, int, int]:
+        """
+        Maximum subarray of `nums[left..right]` (both inclusive), in O(log N).
+
+        Returns:
+            A tuple `(best_sum, start, end)` with inclusive absolute positions.
+
+        Raises:
+            IndexError: If the range is empty or out of bounds.
+        """
+        if not 0 <= left <= right < self.n:
+            raise IndexError(f"invalid range [{left}, {right}] for {self.n} elements")
+        lo, hi = left + self.size, right + self.size + 1
+        left_acc = right_acc = None
+        while lo < hi:
+            if lo & 1:
+                left_acc = self._merge(left_acc, self._node(lo))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right_acc = self._merge(self._node(hi), right_acc)
+            lo //= 2
+            hi //= 2
+        node = self._merge(left_acc, right_acc)
+        return node[5], node[6], node[7]
+
+    def updateMany(self, updates: Iterable[tuple[int, int]]):
+        """
+        Applies `(index, val)` updates in order.
+        """
+        for index, val in updates:
+            self.update(index, val)
+
+    def queryMany(self, ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int, int]]:
+        """
+        Answers `(left, right)` inclusive range queries, in order.
+        """
+        return [self.query(left, right) for left, right in ranges]
+
+
+def run_benchmarks(n: int = 100_000, operations: int = 2000, seed: int = 0):
+    """
+    Times `MaxSubarrayTree` against slicing plus `maxSubArray` on a mixed workload
+    of point updates and random range queries, and prints one table.
+
+    Run with: python maximum_subarray_sum_of_size_k.py --bench
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    nums = [rng.randint(-10**4, 10**4) for _ in range(n)]
+    ops = []
+    for _ in range(operations):
+        if rng.random() < 0.5:
+            ops.append(('update', rng.randrange(n), rng.randint(-10**4, 10**4)))
+        else:
+            left = rng.randrange(n)
+            ops.append(('query', left, rng.randrange(left, n)))
+
+    solver = Solution()
+    start = time.perf_counter()
+    series = nums[:]
+    expected = []
+    for op, a, b in ops:
+        if op == 'update':
+            series[a] = b
+        else:
+            expected.append(solver.maxSubArray(series[a:b + 1]))
+    t_slice = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree = MaxSubarrayTree(nums)
+    t_build = time.perf_counter() - start
+    got = []
+    for op, a, b in ops:
+        if op == 'update':
+            tree.update(a, b)
+        else:
+            got.append(tree.query(a, b)[0])
+    t_tree = time.perf_counter() - start
+    assert got == expected, "MaxSubarrayTree disagrees with maxSubArray"
+
+    print(f"N={n}, {operations} operations (50% updates, 50% range queries)")
+    print(f"{'slice + maxSubArray (s)':>24} | {'tree incl. build (s)':>20} | {'build (s)':>9} | {'speedup':>7}")
+    print(f"{t_slice:>24.4f} | {t_tree:>20.4f} | {t_build:>9.4f} | {t_slice / t_tree:>6.1f}x")
+
 
 # --- Test Cases and Execution Framework ---
 def run_tests():
@@ -74,7 +771,17 @@ def run_tests():
     Executes a suite of test cases for the `maxSubArray` function.
     Prints detailed results for each test and provides a summary.
     """
+    import mmap
+    import random
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    np = optional_numpy()
     solver = Solution()
+    all_passed = True
+    if np is None and numpy_required():
+        print("NumPy kernels required (REQUIRE_NUMPY=1) but NumPy is not installed -- FAILED")
+        all_passed = False
     
     # Each test case is defined as a tuple: (input_nums, expected_output, description)
     test_cases = [
@@ -98,7 +805,6 @@ def run_tests():
     ]
 
     print("\n--- Running maxSubArray Test Suite ---\n")
-    all_passed = True
     for i, (nums, expected, description) in enumerate(test_cases):
         try:
             result = solver.maxSubArray(nums)
@@ -118,6 +824,212 @@ def run_tests():
             
         print("-"*60)
 
+    print("\n--- Running maxSubArrayStream Test Suite ---\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (nums, _, description) in enumerate(test_cases):
+            path = os.path.join(tmp, f"case_{i}.bin")
+            with open(path, 'wb') as f:
+                array.array('q', nums).tofile(f)
+            try:
+                expected = solver.maxSubArray(nums)
+                results = {
+                    "generator": solver.maxSubArrayStream(x for x in nums),
+                    "int64 file": solver.maxSubArrayStream(path, typecode='q', chunk_size=2),
+                }
+                for source, (best, start, end) in results.items():
+                    ok = best == expected and sum(nums[start:end + 1]) == best
+                    status = "PASSED" if ok else "FAILED"
+                    print(f"Test {i+1} [{description}] via {source}\n  Got: {(best, start, end)} -- {status}")
+                    if not ok:
+                        all_passed = False
+                        print("  " + "!"*50)
+            except Exception as e:
+                all_passed = False
+                print(f"Test {i+1} [{description}]\n  ERROR: An unexpected exception occurred: {e}")
+                print("  " + "!"*50)
+
+        try:
+            solver.maxSubArrayStream([])
+            all_passed = False
+            print("Empty input did not raise ValueError -- FAILED")
+        except ValueError:
+            print("Empty input raises ValueError -- PASSED")
+    print("-"*60)
+
+    print("\n--- Running maxSubArrayParallel Test Suite ---\n")
+    rng = random.Random(7)
+    parallel_cases = [(nums, description) for nums, _, description in test_cases]
+    parallel_cases += [([rng.randint(-100, 100) for _ in range(rng.randint(1, 300))], f"Random array #{k}")
+                       for k in range(20)]
+    for i, (nums, description) in enumerate(parallel_cases):
+        try:
+            expected = solver.maxSubArray(nums)
+            result = solver.maxSubArrayParallel(nums, workers=2, min_shard_size=1)
+            status = "PASSED" if result == expected else "FAILED"
+            print(f"Test {i+1} [{description}]\n  Expected: {expected}, Got: {result} -- {status}")
+            if result != expected:
+                all_passed = False
+                print("  " + "!"*50)
+        except Exception as e:
+            all_passed = False
+            print(f"Test {i+1} [{description}]\n  ERROR: An unexpected exception occurred: {e}")
+            print("  " + "!"*50)
+    inputs = [[rng.randint(-100, 100) for _ in range(2000)] for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as threads:
+        results = list(threads.map(lambda nums: solver.maxSubArrayParallel(nums, workers=2, min_shard_size=100),
+                                   inputs))
+    ok = results == [solver.maxSubArray(nums) for nums in inputs]
+    print(f"Concurrent calls from 4 threads keep their own input -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    nums = inputs[0]
+    ok = all(segment_summary(nums, start, start + 50) == segment_summary(nums[start:start + 50])
+             for start in range(0, 1950, 97))
+    print(f"segment_summary of an offset shard matches the sliced shard -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    huge = [2**62, 2**62, -1, 2**62] * 8  # prefix sums far beyond int64
+    ok = solver.maxSubArrayParallel(huge, workers=2, min_shard_size=2) == solver.maxSubArray(huge) == 24 * 2**62 - 8
+    print(f"Sums beyond int64 stay exact -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    if np is None:
+        print("numpy_segment_summary -- SKIPPED (NumPy not installed)")
+    else:
+        ok = True
+        for k in range(20):
+            nums = [rng.randint(-100, 100) for _ in range(rng.randint(1, 300))]
+            ok = ok and numpy_segment_summary(np.array(nums, dtype=np.int64)) == segment_summary(nums)
+            ok = ok and solver.maxSubArrayParallel(np.array(nums), min_shard_size=1) == solver.maxSubArray(nums)
+        print(f"numpy_segment_summary matches segment_summary on 20 random arrays -- {'PASSED' if ok else 'FAILED'}")
+        all_passed = all_passed and ok
+    print("-"*60)
+
+    print("\n--- Running WindowSumIndex Test Suite ---\n")
+    for k_case in range(10):
+        nums = [rng.randint(-50, 50) for _ in range(rng.randint(1, 40))]
+        index = WindowSumIndex(nums)
+        ks = list(range(1, len(nums) + 1))
+        exact = [max(sum(nums[i:i + k]) for i in range(len(nums) - k + 1)) for k in ks]
+        at_most = [max(sum(nums[i:j]) for i in range(len(nums)) for j in range(i + 1, min(i + k, len(nums)) + 1))
+                   for k in ks]
+        ok = index.maxExactlyMany(ks) == exact and index.maxAtMostMany(ks) == at_most
+        ok = ok and solver.maxSubArrayOfSizeK(nums, len(nums)) == sum(nums)
+        ok = ok and index.maxAtMost(len(nums) + 5) == solver.maxSubArray(nums)
+        print(f"Random array #{k_case+1} (n={len(nums)}, every k) -- {'PASSED' if ok else 'FAILED'}")
+        if not ok:
+            all_passed = False
+            print("  " + "!"*50)
+    print("-"*60)
+
+    print("\n--- Running maxSubArrayRows / maxSubMatrix Test Suite ---\n")
+    for k_case in range(8):
+        rows, cols = rng.randint(1, 7), rng.randint(1, 7)
+        matrix = [[rng.randint(-20, 20) for _ in range(cols)] for _ in range(rows)]
+        flat = array.array('q', [v for row in matrix for v in row])
+        brute = max(sum(matrix[r][c] for r in range(top, bottom + 1) for c in range(left, right + 1))
+                    for top in range(rows) for bottom in range(top, rows)
+                    for left in range(cols) for right in range(left, cols))
+        ok = True
+        # Every other row of a (2 * rows, cols) buffer: a strided view, copied once.
+        padded = array.array('q', [v for row in matrix for v in row + [99] * cols])
+        strided = memoryview(padded).cast('B').cast('q', (2 * rows, cols))[::2]
+        for source, kwargs in ((matrix, {}), (flat, {'shape': (rows, cols)}),
+                               (memoryview(flat).cast('B').cast('q', (rows, cols)), {}), (strided, {})):
+            row_results = solver.maxSubArrayRows(source, **kwargs)
+            ok = ok and [best for best, _, _ in row_results] == [solver.maxSubArray(row) for row in matrix]
+            ok = ok and all(sum(row[start:end + 1]) == best for row, (best, start, end) in zip(matrix, row_results))
+            total, top, left, bottom, right = solver.maxSubMatrix(source, **kwargs)
+            region = sum(matrix[r][c] for r in range(top, bottom + 1) for c in range(left, right + 1))
+            ok = ok and total == brute == region
+        print(f"Random {rows}x{cols} matrix #{k_case+1} (list, flat array, 2D and strided memoryview) -- "
+              f"{'PASSED' if ok else 'FAILED'}")
+        if not ok:
+            all_passed = False
+            print("  " + "!"*50)
+    # Raw bytes are unsigned bytes on every path, also in a file mapping.
+    byte_matrix = [[rng.randrange(256) for _ in range(5)] for _ in range(3)]
+    packed = bytes(v for row in byte_matrix for v in row)
+    expected = (solver.maxSubArrayRows(byte_matrix), solver.maxSubMatrix(byte_matrix))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "matrix.bin")
+        with open(path, 'wb') as f:
+            f.write(packed)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ok = all((solver.maxSubArrayRows(source, shape=(3, 5)), solver.maxSubMatrix(source, shape=(3, 5)))
+                     == expected for source in (packed, bytearray(packed), mapped))
+    print(f"3x5 byte matrix from bytes, bytearray and mmap with shape -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    print("-"*60)
+
+    print("\n--- Running MaxSubarrayTree Test Suite ---\n")
+    for k in range(10):
+        nums = [rng.randint(-50, 50) for _ in range(rng.randint(1, 60))]
+        tree = MaxSubarrayTree(nums)
+        mismatches = []
+        for _ in range(100):
+            if rng.random() < 0.3:
+                index, val = rng.randrange(len(nums)), rng.randint(-50, 50)
+                nums[index] = val
+                tree.update(index, val)
+            else:
+                left = rng.randrange(len(nums))
+                right = rng.randrange(left, len(nums))
+                best, start, end = tree.query(left, right)
+                expected = solver.maxSubArray(nums[left:right + 1])
+                if best != expected or not left <= start <= end <= right or sum(nums[start:end + 1]) != best:
+                    mismatches.append(((left, right), (best, start, end), expected))
+        status = "PASSED" if not mismatches else "FAILED"
+        print(f"Random tree #{k+1} (n={len(nums)}, 100 mixed operations) -- {status}")
+        if mismatches:
+            all_passed = False
+            print(f"  First mismatch (range, got, expected): {mismatches[0]}")
+            print("  " + "!"*50)
+    tree = MaxSubarrayTree([-2, 1, -3, 4, -1, 2, 1, -5, 4])
+    batch_ok = tree.queryMany([(0, 8), (0, 2), (7, 7)]) == [(6, 3, 6), (1, 1, 1), (-5, 7, 7)]
+    tree.updateMany([(7, 5), (0, 10)])
+    batch_ok = batch_ok and tree.queryMany([(0, 8)]) == [(23, 0, 8)]
+    print(f"queryMany / updateMany -- {'PASSED' if batch_ok else 'FAILED'}")
+    all_passed = all_passed and batch_ok
+    print("-"*60)
+
+    print("\n--- maxSubArray Buffer Input Test Suite ---\n")
+    for i, (nums, _, description) in enumerate(test_cases):
+        expected = solver.maxSubArray(nums)  # buffers must match the list path exactly
+        packed = array.array('q', nums)
+        results = {
+            "array('q')": solver.maxSubArray(packed),
+            "bytes as 'q'": solver.maxSubArray(packed.tobytes(), typecode='q'),
+            "memoryview": solver.maxSubArray(memoryview(array.array('i', nums))),
+        }
+        if np is not None:
+            results["numpy int64"] = solver.maxSubArray(np.array(nums, dtype=np.int64))
+        ok = all(result == expected for result in results.values())
+        print(f"Buffer Test {i+1} [{description}] -- {'PASSED' if ok else 'FAILED'}")
+        if not ok:
+            all_passed = False
+            print(f"  Expected: {expected}, Got: {results}")
+            print("  " + "!"*50)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nums.bin")
+        with open(path, 'wb') as f:
+            array.array('q', [-2, 1, -3, 4, -1, 2, 1, -5, 4]).tofile(f)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ok = solver.maxSubArray(mapped, typecode='q') == 6
+    print(f"Buffer Test mmap int64 file -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    # 2D buffers are read row by row: 6 from [4, -1, 2, 1]; column order would give 9.
+    flat = [-2, 1, -3, 4, -1, 2, 1, -5, 4, 0, 0, 0]
+    grids = [memoryview(array.array('q', flat)).cast('B').cast('q', (3, 4))]
+    if np is not None:
+        grids.append(np.array(flat, dtype=np.int64).reshape(3, 4))
+    ok = all(solver.maxSubArray(grid) == 6 for grid in grids)
+    print(f"Buffer Test 2D buffer (row-major) -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    padded = array.array('q', [v for k in range(0, 12, 4) for v in flat[k:k + 4] + [-99] * 4])
+    strided = memoryview(padded).cast('B').cast('q', (6, 4))[::2]  # same rows, not C-contiguous
+    ok = solver.maxSubArray(strided) == 6 and typed_view(strided).tolist() == flat
+    print(f"Buffer Test strided 2D buffer (copied once) -- {'PASSED' if ok else 'FAILED'}")
+    all_passed = all_passed and ok
+    print("-"*60)
+
     if all_passed:
         print("\nAll 🚀 test cases passed successfully! The solution is robust.")
     else:
@@ -125,4 +1037,7 @@ def run_tests():
         sys.exit(1) # Exit with a non-zero status code to indicate test failures
 
 if __name__ == "__main__":
-    run_tests()
+    if '--bench' in sys.argv[1:]:
+        run_benchmarks()
+    else:
+        run_tests()
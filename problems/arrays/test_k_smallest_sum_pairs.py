@@ -0,0 +1,284 @@
+import array
+import os
+import sys
+import time
+import unittest
+
+# Tests of k_smallest_sum_pairs.py, kept apart so that loading the solver does not
+# import unittest. Loaded by path (as tools/test_runner.py does), this module does
+# not have its own directory on `sys.path`, so it is added here.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+from k_smallest_sum_pairs import (Solution, articulation_points, build_gold_graph, gold_components,
+                                  random_gold_grid, solve_canonical_component)
+
+
+class TestSolution(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_example_1(self):
+        grid = [[0,6,0],[5,8,7],[0,9,0]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 24)
+        # Expected path example: 9 -> 8 -> 7 (or 7 -> 8 -> 9), sum = 24.
+
+    def test_example_2(self):
+        grid = [[1,0,7],[2,0,6],[3,4,5],[0,3,0],[9,0,20]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 28)
+        # Expected path example: 1->2->3->4->5->6->7 (sum = 28)
+
+    def test_single_cell_grid(self):
+        grid = [[7]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 7)
+
+    def test_no_gold(self):
+        grid = [[0,0,0],[0,0,0],[0,0,0]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 0)
+
+    def test_isolated_gold_cells(self):
+        grid = [[1,0,10],[0,0,0],[100,0,1]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 100)
+        # The maximum gold comes from collecting from the single cell with 100 gold.
+
+    def test_simple_linear_path(self):
+        grid = [[1,1,1]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 3)
+
+    def test_forking_paths_complex(self):
+        grid = [[1,2,3],[0,10,0],[4,5,6]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 26)
+        # Path example: 3 -> 2 -> 10 -> 5 -> 6 (sum = 26)
+
+    def test_path_hitting_boundary_in_small_grid(self):
+        grid = [[1,2],[3,4]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 10)
+        # Path example: 1 -> 3 -> 4 -> 2 (sum = 10)
+
+    def test_all_zeros_except_one_path_segment(self):
+        grid = [[0,0,0,0],
+                [0,1,2,3],
+                [0,0,0,0]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 6) # Path: 1->2->3
+
+    def test_complex_grid_with_zeros_blocking(self):
+        grid = [[1,1,1,1,1],
+                [1,0,1,0,1],
+                [1,1,1,1,1]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 8)
+        # Path example: (0,0) -> (0,1) -> (0,2) -> (1,2) -> (2,2) -> (2,1) -> (2,0) -> (1,0) (sum = 8)
+
+    def test_large_grid_single_path(self):
+        grid = [[1,1,1,1,1],
+                [0,0,0,0,1],
+                [0,0,0,0,1],
+                [0,0,0,0,1],
+                [0,0,0,0,1]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 9)
+        # Path example: (0,0) -> (0,1) -> (0,2) -> (0,3) -> (0,4) -> (1,4) -> (2,4) -> (3,4) -> (4,4)
+
+    def test_15x15_serpentine_under_default_recursion_limit(self):
+        # The module no longer raises the recursion limit at import: a 15x15 path is at
+        # most 225 frames deep. This 127-cell serpentine recurses through every cell.
+        grid = [[1] * 15 if r % 2 == 0 else [0] * 15 for r in range(15)]
+        for r in range(1, 15, 2):
+            grid[r][14 if r % 4 == 1 else 0] = 1
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(1000)
+        try:
+            self.assertEqual(self.sol.getMaximumGold(grid), 127)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_disconnected_components(self):
+        grid = [[1,0,0,0,2],
+                [0,0,0,0,0],
+                [3,0,0,0,4]]
+        self.assertEqual(self.sol.getMaximumGold(grid), 4) # Max of {1, 2, 3, 4} (isolated cells)
+
+class TestIterativeEngine(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_matches_recursive_on_fixed_grids(self):
+        grids = [
+            [[0,6,0],[5,8,7],[0,9,0]],
+            [[1,0,7],[2,0,6],[3,4,5],[0,3,0],[9,0,20]],
+            [[7]],
+            [[0,0,0],[0,0,0]],
+            [[1,2,3],[0,10,0],[4,5,6]],
+            [[1,2],[3,4]],
+        ]
+        for grid in grids:
+            self.assertEqual(self.sol.getMaximumGoldIterative(grid),
+                             self.sol.getMaximumGold([row[:] for row in grid]))
+
+    def test_matches_recursive_on_random_grids(self):
+        for seed in range(10):
+            grid = random_gold_grid(6, 6, 12, seed)
+            self.assertEqual(self.sol.getMaximumGoldIterative(grid),
+                             self.sol.getMaximumGold([row[:] for row in grid]))
+
+    def test_does_not_mutate_grid(self):
+        grid = [[0,6,0],[5,8,7],[0,9,0]]
+        snapshot = [row[:] for row in grid]
+        self.sol.getMaximumGoldIterative(grid)
+        self.assertEqual(grid, snapshot)
+
+    def test_does_not_touch_recursion_limit(self):
+        limit = sys.getrecursionlimit()
+        # A 1 x 1200 corridor is deeper than the default recursion limit.
+        self.assertEqual(self.sol.getMaximumGoldIterative([[1] * 1200]), 1200)
+        self.assertEqual(sys.getrecursionlimit(), limit)
+
+class TestPrunedEngine(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_matches_recursive_on_random_grids(self):
+        for seed in range(20):
+            grid = random_gold_grid(6, 6, 14, seed)
+            self.assertEqual(self.sol.getMaximumGoldPruned(grid),
+                             self.sol.getMaximumGold([row[:] for row in grid]))
+
+    def test_examples(self):
+        self.assertEqual(self.sol.getMaximumGoldPruned([[0,6,0],[5,8,7],[0,9,0]]), 24)
+        self.assertEqual(self.sol.getMaximumGoldPruned([[1,0,7],[2,0,6],[3,4,5],[0,3,0],[9,0,20]]), 28)
+        self.assertEqual(self.sol.getMaximumGoldPruned([[0,0],[0,0]]), 0)
+        self.assertEqual(self.sol.getMaximumGoldPruned([[1,0,0,0,2],[0,0,0,0,0],[3,0,0,0,4]]), 4)
+
+    def test_cut_point_never_needed_as_start(self):
+        # Plus shape: the center is a cut point, the best path goes leaf -> center -> leaf.
+        grid = [[0,5,0],[1,9,7],[0,3,0]]
+        _, values, neighbors = build_gold_graph(grid)
+        self.assertEqual(articulation_points(gold_components(neighbors)[0], neighbors), {2})
+        self.assertEqual(self.sol.getMaximumGoldPruned(grid), 21)
+
+    def test_dense_block_collects_everything(self):
+        grid = [[1] * 6 for _ in range(6)]
+        self.assertEqual(self.sol.getMaximumGoldPruned(grid), 36)
+
+class TestParallelEngine(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_matches_pruned_with_pool(self):
+        for seed in range(3):
+            grid = random_gold_grid(7, 7, 20, seed)
+            self.assertEqual(self.sol.getMaximumGoldParallel(grid, workers=2, min_gold_cells=0),
+                             self.sol.getMaximumGoldPruned(grid))
+
+    def test_several_components_with_pool(self):
+        grid = [[1,0,7],[2,0,6],[3,4,5],[0,3,0],[9,0,20]]
+        self.assertEqual(self.sol.getMaximumGoldParallel(grid, workers=2, min_gold_cells=0), 28)
+
+    def test_serial_fallback_for_small_grids(self):
+        self.assertEqual(self.sol.getMaximumGoldParallel([[0,6,0],[5,8,7],[0,9,0]], workers=4), 24)
+        self.assertEqual(self.sol.getMaximumGoldParallel([[0,0],[0,0]], workers=2, min_gold_cells=0), 0)
+
+class TestAnytimeEngine(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def assertValidPath(self, grid, gold, path):
+        self.assertEqual(len(set(path)), len(path))
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+        self.assertTrue(all(grid[r][c] > 0 for r, c in path))
+        self.assertEqual(sum(grid[r][c] for r, c in path), gold)
+
+    def test_exact_without_budget(self):
+        for seed in range(10):
+            grid = random_gold_grid(6, 6, 14, seed)
+            gold, path, bound = self.sol.getMaximumGoldAnytime(grid)
+            self.assertEqual(gold, self.sol.getMaximumGoldPruned(grid))
+            self.assertEqual(bound, gold)
+            self.assertValidPath(grid, gold, path)
+
+    def test_no_gold(self):
+        self.assertEqual(self.sol.getMaximumGoldAnytime([[0,0],[0,0]]), (0, [], 0))
+
+    def test_budgeted_large_grid_streams_improvements(self):
+        grid = random_gold_grid(60, 60, 1800, seed=1)
+        seen = []
+        gold, path, bound = self.sol.getMaximumGoldAnytime(
+            grid, node_budget=2000, on_improvement=lambda g, p: seen.append((g, list(p))))
+        self.assertValidPath(grid, gold, path)
+        self.assertLessEqual(gold, bound)
+        self.assertLessEqual(bound, sum(map(sum, grid)))
+        self.assertEqual(seen[-1], (gold, path))
+        self.assertEqual([g for g, _ in seen], sorted({g for g, _ in seen}))
+
+    def test_time_budget_is_respected(self):
+        grid = random_gold_grid(60, 60, 1800, seed=2)
+        start = time.perf_counter()
+        gold, path, bound = self.sol.getMaximumGoldAnytime(grid, time_budget=0.2)
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertValidPath(grid, gold, path)
+
+class TestBatchEngine(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+        solve_canonical_component.cache_clear()
+
+    def test_with_path_returns_optimal_path(self):
+        grid = [[1,0,7],[2,0,6],[3,4,5],[0,3,0],[9,0,20]]
+        gold, path = self.sol.getMaximumGoldWithPath(grid)
+        self.assertEqual(gold, 28)
+        self.assertEqual(sum(grid[r][c] for r, c in path), 28)
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+
+    def test_symmetric_components_share_cache_entry(self):
+        grid = [[0,6,0],[5,8,7],[0,9,0]]
+        rotated = [list(row) for row in zip(*grid[::-1])]
+        mirrored = [row[::-1] for row in grid]
+        shifted = [[0,0,0,0]] + [[0] + row for row in grid]
+        results = self.sol.getMaximumGoldBatch([grid, rotated, mirrored, shifted])
+        self.assertEqual([gold for gold, _ in results], [24] * 4)
+        for g, (gold, path) in zip([grid, rotated, mirrored, shifted], results):
+            self.assertEqual(sum(g[r][c] for r, c in path), gold)
+        info = solve_canonical_component.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 3))
+
+    def test_batch_matches_pruned(self):
+        grids = [random_gold_grid(6, 6, 12, seed) for seed in range(8)] + [[[0]]]
+        self.assertEqual([gold for gold, _ in self.sol.getMaximumGoldBatch(grids)],
+                         [self.sol.getMaximumGoldPruned(grid) for grid in grids])
+
+class TestBufferInputs(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_buffers_match_list_path(self):
+        for seed in range(15):
+            grid = random_gold_grid(5, 6, 4 + seed, seed)
+            expected = self.sol.getMaximumGold([row[:] for row in grid])
+            flat = array.array('i', [value for row in grid for value in row])
+            self.assertEqual(self.sol.getMaximumGold(flat, shape=(5, 6)), expected)
+            self.assertEqual(self.sol.getMaximumGold(bytes(flat.tolist()), shape=(5, 6)), expected)
+            self.assertEqual(self.sol.getMaximumGold(memoryview(flat).cast('B').cast('i', (5, 6))), expected)
+            self.assertEqual(self.sol.getMaximumGold(tuple(map(tuple, grid))), expected)
+
+    def test_strided_2d_buffer_is_accepted(self):
+        grid = [[0, 6, 0], [5, 8, 7], [0, 9, 0]]
+        # Every other row of a 6x3 buffer: a 3x3 view that is not C-contiguous.
+        padded = array.array('i', [value for row in grid for value in (row + [100] * 3)])
+        strided = memoryview(padded).cast('B').cast('i', (6, 3))[::2]
+        self.assertFalse(strided.c_contiguous)
+        self.assertEqual(self.sol.getMaximumGold(strided), 24)
+
+    def test_read_only_buffer_is_not_written(self):
+        data = bytes([0, 6, 0, 5, 8, 7, 0, 9, 0])
+        self.assertEqual(self.sol.getMaximumGold(data, shape=(3, 3)), 24)
+        self.assertEqual(data, bytes([0, 6, 0, 5, 8, 7, 0, 9, 0]))
+
+    def test_flat_buffer_needs_matching_shape(self):
+        with self.assertRaises(ValueError):
+            self.sol.getMaximumGold(bytes(9))
+        with self.assertRaises(ValueError):
+            self.sol.getMaximumGold(bytes(9), shape=(2, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
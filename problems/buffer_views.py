@@ -0,0 +1,86 @@
+"""
+Buffer helpers shared by the problem files that accept buffer-protocol inputs.
+
+The `problems` tree is not a package: problem files import this module after adding
+the `problems` directory to `sys.path`.
+"""
+
+import functools
+import os
+
+
+def typed_view(data, typecode: str | None = None) -> memoryview | None:
+    """
+    1D typed `memoryview` over a buffer-protocol object, without copying it when possible.
+
+    `array`, NumPy arrays and typed `memoryview`s keep their own format; raw bytes
+    (`bytes`, `bytearray`, `mmap`...) are reinterpreted as `typecode` values, e.g. 'q'
+    for packed int64. Multi-dimensional buffers are flattened in row-major order, so
+    a `(rows, cols)` buffer reads like its rows concatenated.
+
+    Strided buffers (a transposed or sliced NumPy array, `view[::2]`...) cannot be
+    flattened or reinterpreted in place: those are copied once, in row-major order.
+    A strided 1D buffer that needs neither is returned as it is.
+
+    Returns:
+        The view, or `None` for objects without the buffer protocol (lists, tuples...).
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    if typecode is None or typecode == view.format:
+        if view.ndim == 1:
+            return view
+        typecode = view.format
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast('B').cast(typecode)
+
+
+@functools.cache
+def optional_numpy():
+    """
+    The `numpy` module, or `None` if it is not installed (the pure Python kernels are
+    then used). NumPy takes longer to import than a whole solver module, so the NumPy
+    kernels call this on first use instead of importing it at the top of the file.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def numpy_required() -> bool:
+    """
+    Whether the environment promises NumPy (`REQUIRE_NUMPY=1`, e.g. a CI job that
+    installs it): the self-tests then fail instead of skipping the NumPy kernels.
+    """
+    return os.environ.get('REQUIRE_NUMPY') == '1'
+
+
+def numpy_matrix(matrix, shape: tuple[int, int] | None = None):
+    """
+    2D NumPy array over `matrix`, with the item type of the buffer. NumPy must be installed.
+
+    NumPy arrays and lists go through `np.asarray`. Other buffers are read through
+    `typed_view` and `np.frombuffer` (`np.asarray` turns `bytes` into a 0-d string
+    array), so raw bytes are read as unsigned bytes, as in the pure Python paths.
+    1D buffers need `shape=(rows, cols)`.
+    """
+    np = optional_numpy()
+    view = None if isinstance(matrix, np.ndarray) else typed_view(matrix)
+    if view is None:
+        data = np.asarray(matrix)
+    else:
+        if memoryview(matrix).ndim == 2:
+            shape = memoryview(matrix).shape
+        elif shape is None:
+            raise ValueError("1D buffers need shape=(rows, cols)")
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes()).cast(view.format)
+        data = np.frombuffer(view, dtype=view.format)
+    if data.ndim == 1 and shape is not None:
+        data = data.reshape(shape)
+    return data
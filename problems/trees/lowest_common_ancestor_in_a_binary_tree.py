@@ -1,7 +1,165 @@
+import array
+import bisect
 import collections
+import mmap
+import os
+import sys
+from typing import Sequence
+
+# Helpers shared by several problem files live in `problems/`, which is not a package.
+_PROBLEMS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROBLEMS_DIR not in sys.path:
+    sys.path.append(_PROBLEMS_DIR)
+from buffer_views import numpy_matrix, numpy_required, optional_numpy, typed_view
+
+
+def find_pivot(nums: Sequence[int]) -> int:
+    """
+    Index of the minimum of a non-empty rotated sorted array of unique values.
+
+    Same binary search as `Solution.findMin`, but returning the position instead of the
+    value. It works on any sequence (list, `array`, `memoryview`...).
+
+    Time Complexity: O(log n)
+    """
+    left, right = 0, len(nums) - 1
+    if nums[left] <= nums[right]:
+        return left
+    while left < right:
+        mid = left + (right - left) // 2
+        if nums[mid] > nums[right]:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+class RotatedSortedIndex:
+    """
+    Query index over one rotated sorted array of unique values.
+
+    The rotation pivot (position of the minimum) is found once with `find_pivot` and
+    cached. The array is then two sorted runs, `nums[pivot:]` followed by the larger
+    values `nums[:pivot]`, so every query is one or two C-level `bisect` calls with
+    `lo`/`hi` bounds on the stored array (no copy of either run):
+    - `findMin` / `findMax`: O(1).
+    - `search(x)`: index of `x` or -1, O(log n).
+    - `rank(x)`: number of values `< x`, O(log n).
+    - `countRange(low, high)`: number of values in `[low, high]`, O(log n).
+
+    Values are kept compactly in an `array` (or as a typed `memoryview` over a
+    memory-mapped file, see `fromFile`).
+
+    Example:
+        >>> index = RotatedSortedIndex([4, 5, 6, 7, 0, 1, 2])
+        >>> index.findMin(), index.findMax(), index.pivot
+        (0, 7, 4)
+        >>> index.search(6), index.search(3)
+        (2, -1)
+        >>> index.rank(5), index.countRange(1, 5)
+        (4, 4)
+    """
+    def __init__(self, nums: Sequence[int], typecode: str = 'q'):
+        """
+        Args:
+            nums: The rotated sorted array. `array` and `memoryview` inputs are used
+                  as they are; anything else is packed into an `array(typecode)`.
+            typecode: `array` typecode used to pack other inputs.
+
+        Raises:
+            ValueError: If `nums` is empty.
+        """
+        if not len(nums):
+            raise ValueError("Input array cannot be empty. (Problem constraints: nums.length >= 1)")
+        self.nums = nums if isinstance(nums, (array.array, memoryview)) else array.array(typecode, nums)
+        self.pivot = find_pivot(self.nums)
+        self._mmap = None
+
+    @classmethod
+    def fromFile(cls, path: str | os.PathLike, typecode: str = 'i') -> 'RotatedSortedIndex':
+        """
+        Builds an index over a binary file of packed native-endian values, memory-mapped
+        read-only, so only the O(log n) pages touched by the searches are ever read.
+        Call `close()` (or use the index as a context manager) to release the mapping.
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        index = cls(memoryview(mapped).cast(typecode))
+        index._mmap = mapped
+        return index
+
+    def close(self):
+        if self._mmap is not None:
+            self.nums.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'RotatedSortedIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.nums)
+
+    def __contains__(self, x: int) -> bool:
+        return self.search(x) != -1
+
+    def findMin(self) -> int:
+        return self.nums[self.pivot]
+
+    def findMax(self) -> int:
+        return self.nums[self.pivot - 1]
+
+    def search(self, x: int) -> int:
+        """
+        Index of `x` in the original (rotated) array, or -1 if it is absent.
+        """
+        n = len(self.nums)
+        # `x` can only be in the high run `nums[:pivot]` if it is >= its first value.
+        if self.pivot and x >= self.nums[0]:
+            lo, hi = 0, self.pivot
+        else:
+            lo, hi = self.pivot, n
+        i = bisect.bisect_left(self.nums, x, lo, hi)
+        return i if i < hi and self.nums[i] == x else -1
+
+    def rank(self, x: int) -> int:
+        """
+        Number of values strictly less than `x`.
+        """
+        n = len(self.nums)
+        return (bisect.bisect_left(self.nums, x, self.pivot, n) - self.pivot
+                + bisect.bisect_left(self.nums, x, 0, self.pivot))
+
+    def countRange(self, low: int, high: int) -> int:
+        """
+        Number of values `v` with `low <= v <= high` (0 if `low > high`).
+        """
+        if low > high:
+            return 0
+        return sum(bisect.bisect_right(self.nums, high, lo, hi) - bisect.bisect_left(self.nums, low, lo, hi)
+                   for lo, hi in ((0, self.pivot), (self.pivot, len(self.nums))))
+
+
+def gallop_for_other_value(nums: Sequence[int], lo: int, hi: int, value: int) -> int | None:
+    """
+    Probes `nums[hi - 1], nums[hi - 2], nums[hi - 4], ...` (positions strictly between
+    `lo` and `hi`) and returns the first probed position whose value differs from
+    `value`, or `None`. This skips over a long run of equal values in O(log n) probes
+    instead of stepping through it one element at a time.
+    """
+    step = 1
+    while hi - step > lo:
+        if nums[hi - step] != value:
+            return hi - step
+        step *= 2
+    return None
+
 
 class Solution:
-    def findMin(self, nums: list[int]) -> int:
+    def findMin(self, nums: list[int], typecode: str | None = None) -> int:
         """
         Finds the minimum element in a rotated sorted array.
 
@@ -22,6 +180,11 @@ class Solution:
                                -5000 <= nums[i] <= 5000
                                All the integers of nums are unique.
                                nums is sorted and rotated at some pivot.
+                  Buffers (`array`, `bytes`, `mmap`, NumPy arrays...) are searched in
+                  place through `typed_view` (multi-dimensional ones in row-major
+                  order); the O(log n) probes never need the whole array as a list.
+            typecode: `array` typecode of the values when `nums` is raw bytes (`bytes`,
+                      `mmap`...), e.g. 'i' for packed int32. Typed buffers need none.
 
         Returns:
             The minimum element in the array.
@@ -42,6 +205,11 @@ class Solution:
             >>> Solution().findMin([11,13,15,17])
             11
         """
+        if not isinstance(nums, list):
+            view = typed_view(nums, typecode)
+            if view is not None:
+                nums = view
+
         if not nums:
             raise ValueError("Input array cannot be empty. (Problem constraints: nums.length >= 1)")
             
@@ -88,8 +256,216 @@ class Solution:
         # This pointer will be at the index of the minimum element.
         return nums[left]
 
+    def findMinBatch(self, matrix, shape: tuple[int, int] | None = None) -> list[tuple[int, int]]:
+        """
+        `findMin` for many equal-length rotated rows at once, e.g. per-shard ring buffers.
+
+        With NumPy installed, the `nums[mid] > nums[right]` bisection runs in lockstep on
+        all rows: `left`, `right` and `mid` are vectors with one entry per row, and
+        every step is a handful of vectorized operations over the whole batch. Rows that
+        have converged are masked out, and after ceil(log2(n)) + 1 steps all have.
+
+        Without NumPy there is nothing to vectorize, so this is a plain loop running the
+        `findMin` search (`find_pivot`) on each row: list rows directly, buffer rows as
+        slices of one flat typed `memoryview` (no conversion to lists).
+
+        Args:
+            matrix: A list of lists, a 2D buffer (NumPy array, 2D `memoryview`...), or a
+                    flat buffer with `shape=(rows, cols)`. Every row is a rotated sorted
+                    array of unique values.
+            shape: `(rows, cols)` for flat buffers.
+
+        Returns:
+            One `(min_value, pivot_index)` tuple per row.
+
+        Time Complexity: O(R * log n), as O(log n) vectorized steps with NumPy.
+        Space Complexity: O(R)
+        """
+        np = optional_numpy()
+        if np is not None:
+            data = numpy_matrix(matrix, shape)
+            rows = np.arange(data.shape[0])
+            left = np.zeros(data.shape[0], dtype=np.int64)
+            right = np.full(data.shape[0], data.shape[1] - 1, dtype=np.int64)
+            while True:
+                active = left < right
+                if not active.any():
+                    break
+                mid = left + (right - left) // 2
+                go_right = data[rows, mid] > data[rows, right]
+                left = np.where(active & go_right, mid + 1, left)
+                right = np.where(active & ~go_right, mid, right)
+            return list(zip(data[rows, left].tolist(), left.tolist()))
+
+        if isinstance(matrix, list):
+            lines = matrix
+        else:
+            view = memoryview(matrix)
+            if view.ndim == 2:
+                shape = view.shape
+                view = typed_view(view)
+            elif shape is None:
+                raise ValueError("1D buffers need shape=(rows, cols)")
+            cols = shape[1]
+            lines = [view[base:base + cols] for base in range(0, shape[0] * cols, cols)]
+        result = []
+        for line in lines:
+            pivot = find_pivot(line)
+            result.append((line[pivot], pivot))
+        return result
+
+    def findMinWithDuplicates(self, nums: Sequence[int]) -> tuple[int, int, str]:
+        """
+        Minimum of a rotated sorted array that may contain duplicates.
+
+        With duplicates, `findMin`'s rule breaks when `nums[mid] == nums[right]`: the
+        minimum can be on either side. The textbook fix (`right -= 1`) degrades to
+        O(n) Python steps on long equal runs. This version narrows the ambiguity:
+        1. Window `[left, right]` with `nums[left] < nums[right]` is sorted: done.
+        2. `nums[mid] > nums[right]`: the minimum is right of `mid` (as in `findMin`).
+        3. `nums[mid] < nums[right]`, or `nums[mid] == nums[right] < nums[left]`: `mid`
+           is past the rotation point, so the minimum is at or left of `mid`.
+        4. Only `nums[left] == nums[mid] == nums[right] == v` is truly ambiguous. Then
+           `gallop_for_other_value` probes each half with exponentially growing steps
+           for a value `w != v`. Since values before the rotation point are >= v and
+           values after it are <= v, a witness tells which side the minimum is on, and
+           every case at least halves the window.
+        5. If the probes only see `v`, a dip may hide between them and no comparison
+           can rule it out (all-equal-with-one-dip inputs need Omega(n) reads). The
+           remaining window is then scanned linearly at C speed (`min` over a slice,
+           or `argmin` for NumPy arrays).
+
+        Args:
+            nums: A non-empty rotated sorted sequence, duplicates allowed.
+
+        Returns:
+            A tuple `(min_value, index, strategy)` where `nums[index] == min_value` and
+            `strategy` is "bisect" (no ambiguous step), "gallop" (ambiguous steps all
+            resolved by probing) or "scan" (fell back to the linear scan).
+
+        Raises:
+            ValueError: If `nums` is empty.
+
+        Time Complexity: O(log^2 n) probes while every ambiguous step finds a witness,
+            O(n) at C speed in the fallback.
+        Space Complexity: O(1), plus the scanned slice in the fallback.
+        """
+        if not len(nums):
+            raise ValueError("Input array cannot be empty. (Problem constraints: nums.length >= 1)")
+
+        left, right = 0, len(nums) - 1
+        strategy = "bisect"
+        while left < right and nums[left] >= nums[right]:
+            mid = left + (right - left) // 2
+            value = nums[right]
+            if nums[mid] > value:
+                left = mid + 1
+            elif nums[mid] < value or nums[left] > value:
+                right = mid
+            else:
+                witness = gallop_for_other_value(nums, mid, right, value)
+                if witness is not None:
+                    if nums[witness] < value:
+                        left, right = mid + 1, witness
+                    else:
+                        left = witness + 1
+                else:
+                    witness = gallop_for_other_value(nums, left, mid, value)
+                    if witness is None:
+                        window = nums[left:right + 1]
+                        if hasattr(window, 'argmin'):  # NumPy array
+                            index = left + int(window.argmin())
+                        else:
+                            if isinstance(window, memoryview):
+                                window = window.tolist()
+                            index = left + window.index(min(window))
+                        return nums[index], index, "scan"
+                    if nums[witness] < value:
+                        right = witness
+                    else:
+                        left, right = witness + 1, mid
+                strategy = "gallop"
+        return nums[left], left, strategy
+
+
+def run_benchmarks(rows: int = 20000, cols: int = 256, seed: int = 0):
+    """
+    Times `findMinBatch` on one 2D buffer against calling `findMin` on every row.
+
+    Run with: python lowest_common_ancestor_in_a_binary_tree.py --bench
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    flat = array.array('q')
+    for _ in range(rows):
+        shift = rng.randrange(cols)
+        row = list(range(cols))
+        flat.extend(row[shift:] + row[:shift])
+    solver = Solution()
+
+    def best_time(call, repeats=5):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = call()
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    # Baselines: what callers do today (convert each row of the buffer to a list), and
+    # the per-row `findMin` loop on lists or on zero-copy rows of the buffer.
+    t_convert, lists = best_time(lambda: [flat[r * cols:(r + 1) * cols].tolist() for r in range(rows)])
+    t_loop, expected = best_time(lambda: [solver.findMin(row) for row in lists])
+    view = memoryview(flat)
+    t_view_loop, _ = best_time(lambda: [solver.findMin(view[r * cols:(r + 1) * cols]) for r in range(rows)])
+    t_batch, got = best_time(lambda: solver.findMinBatch(flat, shape=(rows, cols)))
+    assert [value for value, _ in got] == expected, "findMinBatch disagrees with findMin"
+
+    kernel = "NumPy lockstep" if optional_numpy() is not None else "per-row loop (NumPy not installed)"
+    print(f"{rows} rows x {cols} columns, findMinBatch kernel: {kernel}")
+    print(f"{'tolist + findMin (s)':>20} | {'findMin on lists (s)':>20} | {'findMin on buffer rows (s)':>26} | "
+          f"{'findMinBatch (s)':>16}")
+    print(f"{t_convert + t_loop:>20.4f} | {t_loop:>20.4f} | {t_view_loop:>26.4f} | {t_batch:>16.4f}")
+
+    def min_with_linear_fix(nums):
+        # The textbook duplicate fix: step `right` back by one on every tie.
+        left, right = 0, len(nums) - 1
+        while left < right:
+            mid = left + (right - left) // 2
+            if nums[mid] > nums[right]:
+                left = mid + 1
+            elif nums[mid] < nums[right]:
+                right = mid
+            else:
+                right -= 1
+        return nums[left]
+
+    # Adversarial inputs: n equal values with a single smaller one.
+    print(f"\n{'n':>9} | {'right -= 1 (s)':>14} | {'findMinWithDuplicates (s)':>25} | strategy")
+    for n in (10**4, 10**5, 10**6):
+        for dip in (n // 3, n - 2):
+            nums = [5] * n
+            nums[dip] = 1
+            start = time.perf_counter()
+            expected = min_with_linear_fix(nums)
+            t_linear = time.perf_counter() - start
+            start = time.perf_counter()
+            value, _, strategy = solver.findMinWithDuplicates(nums)
+            t_new = time.perf_counter() - start
+            assert value == expected == 1
+            print(f"{n:>9} | {t_linear:>14.4f} | {t_new:>25.4f} | {strategy} (dip at {dip})")
+
 # Test Cases
 if __name__ == "__main__":
+    if '--bench' in sys.argv[1:]:
+        run_benchmarks()
+        sys.exit(0)
+
+    import random
+    import tempfile
+
+    np = optional_numpy()
     solver = Solution()
 
     def run_test(name, nums, expected):
@@ -120,5 +496,125 @@ if __name__ == "__main__":
     run_test("TC11 (Rotated 1 time)", [5,1,2,3,4], 1)
     run_test("TC12 (Minimum at end, large array)", [10,20,30,40,50,0,1,2,3,4,5,6,7,8,9], 0)
 
+    def run_index_test(name, nums):
+        # Checks every RotatedSortedIndex query against a brute-force answer.
+        index = RotatedSortedIndex(nums)
+        probes = range(min(nums) - 2, max(nums) + 3)
+        ok = (index.findMin() == min(nums) and index.findMax() == max(nums)
+              and all(index.search(x) == (nums.index(x) if x in nums else -1) for x in probes)
+              and all(index.rank(x) == sum(v < x for v in nums) for x in probes)
+              and all(index.countRange(lo, hi) == sum(lo <= v <= hi for v in nums)
+                      for lo in probes for hi in probes))
+        print(f"{'PASS' if ok else 'FAIL'}: {name} - Input: {nums}, Pivot: {index.pivot}")
+
+    print("\n--- RotatedSortedIndex Tests ---")
+    run_index_test("TC14 (Index, mid rotation)", [3,4,5,1,2])
+    run_index_test("TC15 (Index, not rotated)", [1,2,3,4,5])
+    run_index_test("TC16 (Index, single element)", [7])
+    run_index_test("TC17 (Index, two elements rotated)", [2,1])
+    rng = random.Random(11)
+    for k in range(5):
+        values = sorted(rng.sample(range(-50, 50), rng.randint(1, 20)))
+        shift = rng.randrange(len(values))
+        run_index_test(f"TC{18 + k} (Index, random rotation)", values[shift:] + values[:shift])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rotated.bin")
+        with open(path, 'wb') as f:
+            array.array('i', [40, 50, 60, -30, -20, 0, 10]).tofile(f)
+        with RotatedSortedIndex.fromFile(path) as index:
+            ok = (index.findMin(), index.findMax(), index.search(0), 55 in index, index.rank(45)) == (-30, 60, 5, False, 5)
+        print(f"{'PASS' if ok else 'FAIL'}: TC23 (Index, memory-mapped int32 file)")
+
+    print("\n--- findMinBatch Tests ---")
+    batch = [[3,4,5,1,2], [1,2,3,4,5], [5,1,2,3,4], [2,3,4,5,1]]
+    expected = [(1, 3), (1, 0), (1, 1), (1, 4)]
+    flat = array.array('q', [v for row in batch for v in row])
+    # Every other row of an 8x5 buffer: the batch again, as a view that is not C-contiguous.
+    padded = array.array('q', [v for row in batch for v in row + [0] * 5])
+    padded_rows = memoryview(padded).cast('B').cast('q', (8, 5))
+    for name, source, kwargs in (("TC24 (Batch, list of lists)", batch, {}),
+                                 ("TC25 (Batch, flat buffer)", flat, {'shape': (4, 5)}),
+                                 ("TC26 (Batch, 2D memoryview)", memoryview(flat).cast('B').cast('q', (4, 5)), {}),
+                                 ("TC43 (Batch, strided 2D memoryview)", padded_rows[::2], {})):
+        result = solver.findMinBatch(source, **kwargs)
+        print(f"{'PASS' if result == expected else 'FAIL'}: {name} - Result: {result}")
+    # Raw bytes are rows of unsigned bytes: the batch shifted to 200..204.
+    packed = bytes(v + 199 for row in batch for v in row)
+    byte_expected = [(value + 199, index) for value, index in expected]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "batch.bin")
+        with open(path, 'wb') as f:
+            f.write(packed)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            result = [solver.findMinBatch(source, shape=(4, 5)) for source in (packed, mapped)]
+    ok = result == [byte_expected, byte_expected]
+    print(f"{'PASS' if ok else 'FAIL'}: TC45 (Batch, bytes and mmap with shape) - Result: {result}")
+    if np is None and numpy_required():
+        print("FAIL: TC41 (Batch, NumPy lockstep kernel) - REQUIRE_NUMPY=1 but NumPy is not installed")
+    elif np is None:
+        print("SKIP: TC41 (Batch, NumPy lockstep kernel) - NumPy not installed")
+    else:
+        rng = random.Random(12)
+        ok = True
+        for cols in (1, 2, 7, 64):
+            rows = []
+            for _ in range(50):
+                shift = rng.randrange(cols)
+                rows.append(list(range(cols))[shift:] + list(range(cols))[:shift])
+            expected = [(row[find_pivot(row)], find_pivot(row)) for row in rows]
+            ok = ok and solver.findMinBatch(np.array(rows, dtype=np.int64)) == expected
+            ok = ok and solver.findMinBatch(np.array(rows, dtype=np.int32).ravel(), shape=(50, cols)) == expected
+        print(f"{'PASS' if ok else 'FAIL'}: TC41 (Batch, NumPy lockstep kernel on random rotations)")
+
+    print("\n--- findMinWithDuplicates Tests ---")
+    def run_duplicates_test(name, nums, expected_strategy=None):
+        value, index, strategy = solver.findMinWithDuplicates(nums)
+        ok = value == min(nums) and nums[index] == value
+        ok = ok and (expected_strategy is None or strategy == expected_strategy)
+        print(f"{'PASS' if ok else 'FAIL'}: {name} - Input: {nums}, Result: {(value, index, strategy)}")
+
+    run_duplicates_test("TC27 (Duplicates, unique values)", [4,5,6,7,0,1,2], "bisect")
+    run_duplicates_test("TC28 (Duplicates, all equal)", [3,3,3,3,3], "scan")
+    run_duplicates_test("TC29 (Duplicates, dip found by galloping)", [2,2,2,2,2,2,2,0,2], "gallop")
+    run_duplicates_test("TC30 (Duplicates, dip next to the right end)", [2,2,2,2,2,2,2,2,0,2])
+    run_duplicates_test("TC31 (Duplicates, rotated with ties)", [10,1,10,10,10])
+    run_duplicates_test("TC32 (Duplicates, dip hidden between probes)", [2,2,2,2,0] + [2] * 11, "scan")
+    rng = random.Random(13)
+    all_ok = True
+    for _ in range(2000):
+        values = sorted(rng.choice(range(4)) for _ in range(rng.randint(1, 12)))
+        shift = rng.randrange(len(values))
+        nums = values[shift:] + values[:shift]
+        value, index, _ = solver.findMinWithDuplicates(nums)
+        all_ok = all_ok and value == min(nums) and nums[index] == value
+    print(f"{'PASS' if all_ok else 'FAIL'}: TC33 (Duplicates, 2000 random rotations with heavy duplication)")
+
+    print("\n--- Buffer Input Tests ---")
+    cases = [[3,4,5,1,2], [4,5,6,7,0,1,2], [11,13,15,17], [2,1], [1], [-5000,5000]]
+    for k, nums in enumerate(cases):
+        packed = array.array('i', nums)
+        inputs = [packed, memoryview(packed), packed.tobytes()]
+        if np is not None:
+            inputs.append(np.array(nums, dtype=np.int64))
+        results = [solver.findMin(source, typecode='i' if isinstance(source, bytes) else None) for source in inputs]
+        ok = all(result == solver.findMin(nums) and type(result) is int for result in results)
+        print(f"{'PASS' if ok else 'FAIL'}: TC{34 + k} (Buffers, {nums}) - Results: {results}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rotated.bin")
+        with open(path, 'wb') as f:
+            array.array('q', [40, 50, 60, -30, -20, 0, 10]).tofile(f)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            result = solver.findMin(mapped, typecode='q')
+        print(f"{'PASS' if result == -30 else 'FAIL'}: TC40 (Buffers, memory-mapped int64 file) - Result: {result}")
+
+    # A 2D buffer is searched as its rows concatenated: [4, 5, 6, 7, 0, 1, 2, 3].
+    grid = memoryview(array.array('i', [4, 5, 6, 7, 0, 1, 2, 3])).cast('B').cast('i', (2, 4))
+    result = solver.findMin(grid)
+    print(f"{'PASS' if result == 0 else 'FAIL'}: TC42 (Buffers, 2D int32 buffer in row-major order) - Result: {result}")
+    result = solver.findMin(grid[::2])  # strided: only the first row, [4, 5, 6, 7], copied once
+    print(f"{'PASS' if result == 4 else 'FAIL'}: TC44 (Buffers, strided 2D int32 buffer) - Result: {result}")
+
     print("\n--- Error Handling Test ---")
     run_test("TC13 (Empty array)", [], ValueError("Input array cannot be empty."))
\ No newline at end of file
@@ -1,6 +1,114 @@
+import array
 import collections
-import unittest
-from typing import Dict, DefaultDict
+import heapq
+import itertools
+import mmap
+import os
+import random
+import re
+import sys
+import time
+from typing import Dict, DefaultDict, Iterable, Iterator
+
+def min_window_span(data: bytes | bytearray | memoryview | mmap.mmap, target: bytes,
+                    start: int = 0, stop: int | None = None) -> tuple[int, int] | None:
+    """
+    Core of `Solution.minWindowFast`: minimum window of `data[start:stop]` holding `target`.
+
+    Counts are kept in two 256-entry lists indexed by byte value, and a compiled regex
+    character class (searched with `pos`/`endpos`, so `data` is never sliced) yields the
+    positions of target bytes. Both pointers then only walk those positions. On ties
+    the first window wins, as in `minWindow`.
+
+    Returns:
+        Absolute `(start, stop)` offsets of the window, or `None` if there is none.
+    """
+    stop = len(data) if stop is None else stop
+    need = [0] * 256
+    for code in target:
+        need[code] += 1
+    required = sum(1 for count in need if count)
+    pattern = re.compile(b'[' + b''.join(re.escape(bytes([code])) for code in range(256) if need[code]) + b']')
+    positions = [match.start() for match in pattern.finditer(data, start, stop)]
+
+    have = [0] * 256
+    formed = 0
+    left = 0
+    min_len = stop - start + 1
+    best = None
+    for pos in positions:
+        code = data[pos]
+        have[code] += 1
+        if have[code] == need[code]:
+            formed += 1
+        while formed == required:
+            window_start = positions[left]
+            if pos - window_start + 1 < min_len:
+                min_len = pos - window_start + 1
+                best = (window_start, pos + 1)
+            code = data[window_start]
+            have[code] -= 1
+            if have[code] < need[code]:
+                formed -= 1
+            left += 1
+    return best
+
+
+def typed_bytes_view(data) -> memoryview | None:
+    """
+    Zero-copy byte `memoryview` of a buffer with 1-byte items (`bytes`, `bytearray`,
+    `mmap`, `array('B')`...), or `None` for other objects, including `str`, lists and
+    buffers of wider items (those are not text).
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    return view.cast('B') if view.itemsize == 1 and view.c_contiguous else None
+
+
+def iter_min_window_spans(data: str | bytes | bytearray | memoryview | mmap.mmap, target: str | bytes,
+                          start: int = 0, stop: int | None = None) -> Iterator[tuple[int, int]]:
+    """
+    Lazily yields every minimal window of `data[start:stop]` holding `target`.
+
+    A window is minimal when dropping its first or last character breaks it; these are
+    the windows `minWindow` compares (the shortest one ending at each position). They
+    are yielded as absolute `(start, stop)` offsets in scan order, as soon as the right
+    pointer completes them.
+
+    The right and left pointers are two independent regex iterators over the target
+    positions, so no position list is kept: memory is O(|t|) whatever the text size.
+    Works on `str` (any characters) and on `bytes`-like data with a `bytes` target.
+    """
+    stop = len(data) if stop is None else stop
+    need = collections.Counter(target)
+    if not need:
+        return
+    if isinstance(target, str):
+        pattern = re.compile('[' + ''.join(map(re.escape, need)) + ']')
+    else:
+        pattern = re.compile(b'[' + b''.join(re.escape(bytes([code])) for code in need) + b']')
+    have = dict.fromkeys(need, 0)
+    missing = len(need)
+    lefts = pattern.finditer(data, start, stop)
+    for match in pattern.finditer(data, start, stop):
+        pos = match.start()
+        key = data[pos]
+        have[key] += 1
+        if have[key] == need[key]:
+            missing -= 1
+        if missing:
+            continue
+        while True:
+            left = next(lefts).start()
+            key = data[left]
+            have[key] -= 1
+            if have[key] < need[key]:
+                missing += 1
+                break
+        yield left, pos + 1
+
 
 class Solution:
     """
@@ -26,14 +134,22 @@ class Solution:
         track character occurrences and validate window contents.
 
         Args:
-            s: The main string in which to search for the window.
+            s: The main string in which to search for the window. Byte buffers (`bytes`,
+               `bytearray`, `mmap`, byte `memoryview`s...) are scanned in place by
+               `min_window_span`, without converting them to `str`; the window is then
+               returned as a slice of `s` (an empty slice if there is none, or if `s`
+               or `t` is empty).
             t: The target string defining the characters and their required frequencies
-               that must be present in the window.
+               that must be present in the window (`bytes` for byte buffers; a `str` is
+               taken as Latin-1).
 
         Returns:
             The smallest substring of `s` that contains all characters of `t`.
             Returns an empty string ("") if no such window is found.
 
+        Raises:
+            ValueError: `s` is a byte buffer and `t` a `str` that is not Latin-1.
+
         Time Complexity: O(|s| + |t|)
         - Initializing `target_counts` takes O(|t|) time.
         - Both `left` and `right` pointers traverse `s` at most once. Each character
@@ -52,6 +168,21 @@ class Solution:
         - As `k` is a constant value independent of the input string lengths, 
           the space complexity can be considered O(1).
         """
+        # Byte buffers skip the per-character loop below: it would index them one item
+        # at a time, while `min_window_span` scans them in place. This comes before the
+        # empty checks so that a byte buffer always gets a slice of itself back.
+        if not isinstance(s, str):
+            view = typed_bytes_view(s)
+            if view is not None:
+                if isinstance(t, str):
+                    try:
+                        t = t.encode('latin-1')
+                    except UnicodeEncodeError:
+                        raise ValueError(f"t={t!r} is not Latin-1 text, so it cannot match bytes; "
+                                         f"pass t encoded like s") from None
+                span = min_window_span(view, bytes(t)) if t else None
+                return s[span[0]:span[1]] if span else s[:0]
+
         # Handle edge cases where `t` or `s` are empty.
         # If t is empty, any window (including empty) satisfies the condition,
         # but problem constraints usually imply t is non-empty or specify "" as default.
@@ -120,112 +251,404 @@ class Solution:
             # Return the substring corresponding to the minimum valid window.
             return s[min_window_start : min_window_start + min_len]
 
-class TestMinWindow(unittest.TestCase):
-    def setUp(self):
-        self.sol = Solution()
-
-    # --- Basic Examples from Problem / Common Cases ---
-    def test_example_1(self):
-        s = "ADOBECODEBANC"
-        t = "ABC"
-        self.assertEqual(self.sol.minWindow(s, t), "BANC")
-
-    def test_example_2(self):
-        s = "a"
-        t = "a"
-        self.assertEqual(self.sol.minWindow(s, t), "a")
-
-    def test_example_3(self):
-        s = "a"
-        t = "aa"
-        self.assertEqual(self.sol.minWindow(s, t), "")
-
-    def test_example_4(self):
-        s = "ADOBECODEBANC"
-        t = "AABC"
-        self.assertEqual(self.sol.minWindow(s, t), "ADOBECODEBA")
-
-    def test_example_5(self):
-        s = "ab"
-        t = "b"
-        self.assertEqual(self.sol.minWindow(s, t), "b")
-
-    # --- Edge Cases ---
-    def test_t_is_empty(self):
-        self.assertEqual(self.sol.minWindow("any_string", ""), "")
-
-    def test_s_is_empty(self):
-        self.assertEqual(self.sol.minWindow("", "abc"), "")
-        self.assertEqual(self.sol.minWindow("", ""), "")
-
-    def test_no_valid_window(self):
-        self.assertEqual(self.sol.minWindow("abc", "xyz"), "")
-        self.assertEqual(self.sol.minWindow("ab", "c"), "")
-
-    def test_t_longer_than_s(self):
-        self.assertEqual(self.sol.minWindow("a", "abc"), "")
-        self.assertEqual(self.sol.minWindow("hello", "helloworld"), "")
-
-    def test_s_has_only_one_char(self):
-        self.assertEqual(self.sol.minWindow("x", "x"), "x")
-        self.assertEqual(self.sol.minWindow("x", "y"), "")
-
-    def test_t_has_only_one_char(self):
-        self.assertEqual(self.sol.minWindow("banana", "a"), "a")
-        # Corrected: for t="l", the shortest window containing 'l' is just "l" itself.
-        self.assertEqual(self.sol.minWindow("hello", "l"), "l")
-
-    def test_s_and_t_are_same(self):
-        self.assertEqual(self.sol.minWindow("hello", "hello"), "hello")
-
-    def test_all_chars_identical(self):
-        self.assertEqual(self.sol.minWindow("aaaaa", "aa"), "aa")
-        self.assertEqual(self.sol.minWindow("bbbbbb", "bbb"), "bbb")
-
-    def test_window_at_start(self):
-        self.assertEqual(self.sol.minWindow("abracadabra", "abc"), "abr")
-
-    def test_window_at_end(self):
-        self.assertEqual(self.sol.minWindow("hello", "ol"), "llo")
-        self.assertEqual(self.sol.minWindow("xyzabc", "abc"), "abc")
-
-    # --- More Comprehensive Tests ---
-    def test_mixed_case(self):
-        self.assertEqual(self.sol.minWindow("aBcdeFg", "BCF"), "BcdeF")
-        self.assertEqual(self.sol.minWindow("aBcDeFgHij", "BCH"), "BcDeFgHi")
-
-    def test_target_with_duplicates_sparse_s(self):
-        self.assertEqual(self.sol.minWindow("abccba", "aa"), "abccba")
-        self.assertEqual(self.sol.minWindow("figeha__ch_e", "aei"), "igeha")
-        self.assertEqual(self.sol.minWindow("AYZABXAPPS", "AAB"), "AYZAB")
-
-    def test_target_with_duplicates_compact_s(self):
-        self.assertEqual(self.sol.minWindow("ADOBECODEBANC", "BCC"), "CODEBANC")
-        self.assertEqual(self.sol.minWindow("ADOBECODEBANC", "AABC"), "ADOBECODEBA")
-
-    def test_s_contains_t_exactly_once(self):
-        self.assertEqual(self.sol.minWindow("abcdefg", "cde"), "cde")
-
-    def test_t_is_single_char_repeated(self):
-        self.assertEqual(self.sol.minWindow("banana", "nn"), "nan")
-
-    def test_complex_long_string(self):
-        s = "THISISATESTSTRINGWITHMANYCHARACTERSANDTHEDESIREDWINDOWISHERE"
-        t = "TESTWINDOW"
-        self.assertEqual(self.sol.minWindow(s, t), "TESTSTRINGWITHMANYCHARACTERSANDTHEDESIREDWINDOW")
-
-    def test_no_match_at_all(self):
-        self.assertEqual(self.sol.minWindow("abcdef", "xyz"), "")
-
-    def test_all_s_is_window(self):
-        self.assertEqual(self.sol.minWindow("hello", "hol"), "hello")
-
-    def test_long_string_many_options(self):
-        s = "abcabcadcba"
-        t = "abc"
-        self.assertEqual(self.sol.minWindow(s, t), "abc")
-
-    def test_long_string_sparse_t(self):
-        s = "aaaaaaaaaaaaabcc"
-        t = "abc"
-        self.assertEqual(self.sol.minWindow(s, t), "abcc")
+    def minWindowFast(self, s: str | bytes, t: str | bytes) -> str | bytes:
+        """
+        Same result as `minWindow`, with array counters and a pre-filtered scan.
+
+        Two costs of `minWindow` are removed for ASCII `str` and for `bytes`-like input:
+        1. Counts live in two fixed-size lists of 256 integers indexed by byte value,
+           instead of `Counter`/`defaultdict` hashing on every character.
+        2. `s` is first reduced to the positions of the characters that occur in `t`,
+           found by a compiled regex character class (the scan runs in C). Both
+           pointers then only walk those positions; characters outside `t` can never
+           change a count, so they are skipped entirely.
+
+        The windows compared are the same as in `minWindow` (the shortest window ending
+        at each target position, first one wins on ties), so results are identical.
+        Non-ASCII strings fall back to `minWindow`.
+
+        Args:
+            s: The text, as `str`, `bytes`, `bytearray`, `memoryview` or `mmap`.
+            t: The target characters, same kind as `s`.
+
+        Returns:
+            The minimum window as a slice of `s` (same type), or an empty one.
+
+        Time Complexity: O(|s|) in C for the filter, plus O(P + |t|) in Python,
+            where P is the number of positions of `s` holding a character of `t`.
+        Space Complexity: O(P) for the filtered positions.
+        """
+        if not t or not len(s):
+            return s[:0]
+        if isinstance(s, str):
+            if not (s.isascii() and t.isascii()):
+                return self.minWindow(s, t)
+            data, target = s.encode('ascii'), t.encode('ascii')
+        else:
+            data, target = s, bytes(t)
+
+        span = min_window_span(data, target)
+        if span is None:
+            return s[:0]
+        return s[span[0]:span[1]]
+
+    def minWindowParallel(self, s: str | bytes, t: str | bytes, workers: int | None = None,
+                          min_shard_size: int = 1 << 20) -> str | bytes:
+        """
+        Same result as `minWindow`, with `s` split into shards solved in a process pool.
+
+        The text is copied once into a `multiprocessing.shared_memory` block; workers
+        attach to it by name and run `min_window_span` on their byte range through
+        `pos`/`endpos`, so no shard is ever pickled.
+
+        Windows crossing a shard boundary are handled by a second parallel round:
+        1. Round 1 solves every shard on its own. Let L be the shortest window found.
+        2. A window crossing boundary `b` (holding bytes `b - 1` and `b`) that is no
+           longer than L lies inside `[b - L + 1, b + L - 1)`. Round 2 solves exactly
+           these overlap regions, so the overlap is sized from the data itself.
+        3. The answer is the candidate with the smallest `(length, start)`, which is the
+           first shortest window, as in the serial scan.
+        If no shard holds a window, or L exceeds the shard size (a window could span
+        three shards), the serial `minWindowFast` is used instead. Small inputs,
+        `workers=1` and non-ASCII strings also run serially.
+
+        Args:
+            s: The text (`str` or `bytes`-like).
+            t: The target characters.
+            workers: Number of worker processes. Defaults to `os.cpu_count()`.
+            min_shard_size: Minimum number of bytes per shard.
+
+        Returns:
+            The minimum window as a slice of `s`, or an empty one.
+        """
+        workers = workers or os.cpu_count() or 1
+        if not t or isinstance(s, str) and not (s.isascii() and t.isascii()):
+            return self.minWindowFast(s, t)
+        n = len(s)
+        shards = min(workers * 4, n // min_shard_size)
+        if workers == 1 or shards < 2:
+            return self.minWindowFast(s, t)
+
+        # Only inputs big enough for the pool pay for importing it.
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        target = t.encode('ascii') if isinstance(t, str) else bytes(t)
+        shared = shared_memory.SharedMemory(create=True, size=n)
+        try:
+            shared.buf[:n] = s.encode('ascii') if isinstance(s, str) else s
+            bounds = [n * k // shards for k in range(shards + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                def solve(ranges):
+                    starts, stops = zip(*ranges)
+                    return [span for span in pool.map(_shared_min_window_span, itertools.repeat(shared.name),
+                                                      itertools.repeat(target), starts, stops) if span]
+
+                candidates = solve(list(zip(bounds, bounds[1:])))
+                best_len = min((stop - start for start, stop in candidates), default=None)
+                if best_len is None or best_len > n // shards:
+                    return self.minWindowFast(s, t)
+                candidates += solve([(max(0, b - best_len + 1), min(n, b + best_len - 1)) for b in bounds[1:-1]])
+        finally:
+            shared.close()
+            shared.unlink()
+
+        start, stop = min(candidates, key=lambda span: (span[1] - span[0], span[0]))
+        return s[start:stop]
+
+    def minWindowSpans(self, s: str | bytes, t: str | bytes, k: int | None = None) -> Iterator[tuple[int, int]]:
+        """
+        Lazily yields windows of `s` holding `t` as `(start, end)` offsets, without slicing.
+
+        Two modes:
+        - `k=None`: every minimum-length window, left to right. A first pass over
+          `iter_min_window_spans` finds the minimum length, a second one yields the
+          windows of that length as it reaches them, so callers can stop early.
+        - `k=n`: the `n` shortest minimal windows (see `iter_min_window_spans`), ordered
+          by `(length, start)`. They are selected with a bounded heap (`heapq.nsmallest`)
+          during a single pass, so they are only yielded once the scan is done.
+        Both modes keep O(|t|) memory, plus O(k) for the heap. The first window yielded
+        is always the one `minWindow` returns.
+
+        Args:
+            s: The text (`str`, `bytes`, `bytearray`, `memoryview` or `mmap`).
+            t: The target characters, `str` for a `str` text and `bytes` otherwise.
+            k: Number of shortest windows to yield, or `None` for all minimum ones.
+
+        Yields:
+            `(start, end)` offsets such that `s[start:end]` is a window.
+
+        Time Complexity: O(|s|) per pass, plus O(W log k) in top-k mode, where W is
+            the number of minimal windows.
+        """
+        if k is None:
+            shortest = min((stop - start for start, stop in iter_min_window_spans(s, t)), default=None)
+            if shortest is not None:
+                yield from ((start, stop) for start, stop in iter_min_window_spans(s, t) if stop - start == shortest)
+        elif k > 0:
+            yield from heapq.nsmallest(k, iter_min_window_spans(s, t), key=lambda span: (span[1] - span[0], span[0]))
+
+
+def _shared_min_window_span(name: str, target: bytes, start: int, stop: int) -> tuple[int, int] | None:
+    """
+    Process-pool task of `minWindowParallel`: `min_window_span` over a byte range of
+    the shared-memory block `name`.
+    """
+    from multiprocessing import shared_memory
+
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        return min_window_span(shared.buf, target, start, stop)
+    finally:
+        shared.close()
+
+
+class MinWindowStream:
+    """
+    Incremental minimum window over an append-only byte stream (growing logs, big files).
+
+    Keeps the sliding-window state of `minWindowFast` between calls instead of
+    re-scanning the whole text on every append:
+    - `append(chunk)` consumes the next bytes. Only positions holding a byte of `t`
+      are visited (regex scan in C), and each is pushed and popped once, so the cost is
+      amortized O(1) per appended byte.
+    - `bestWindow()` returns the current best window as absolute offsets `(start, stop)`
+      (half-open) into everything appended so far.
+    - The text itself is never stored. The only state is a deque of target positions
+      in the current window; positions at its left end whose byte is in surplus are
+      dropped eagerly (a window starting there can never be minimal), so memory is
+      bounded by the current window, not by the size of the stream.
+
+    Example:
+        >>> stream = MinWindowStream("ABC")
+        >>> stream.append(b"ADOBEC")
+        >>> stream.bestWindow()
+        (0, 6)
+        >>> stream.append(b"ODEBANC")
+        >>> stream.bestWindow()
+        (9, 13)
+    """
+    def __init__(self, t: str | bytes):
+        target = t.encode('ascii') if isinstance(t, str) else bytes(t)
+        if not target:
+            raise ValueError("t cannot be empty")
+        self._need = [0] * 256
+        for code in target:
+            self._need[code] += 1
+        self._required = sum(1 for count in self._need if count)
+        self._pattern = re.compile(b'[' + b''.join(re.escape(bytes([code])) for code in range(256)
+                                                   if self._need[code]) + b']')
+        self._have = [0] * 256
+        self._formed = 0
+        self._window: collections.deque[tuple[int, int]] = collections.deque()  # (offset, byte)
+        self._best: tuple[int, int] | None = None
+        self.position = 0  # Number of bytes appended so far.
+
+    def append(self, chunk: bytes | bytearray | memoryview | mmap.mmap):
+        """
+        Consumes the next bytes of the stream.
+        """
+        need, have, window = self._need, self._have, self._window
+        required, formed = self._required, self._formed
+        best_len = self._best[1] - self._best[0] if self._best else float('inf')
+        base = self.position
+
+        for match in self._pattern.finditer(chunk):
+            pos = base + match.start()
+            code = chunk[match.start()]
+            window.append((pos, code))
+            have[code] += 1
+            if have[code] == need[code]:
+                formed += 1
+            while formed == required:
+                start, code = window[0]
+                if pos - start + 1 < best_len:
+                    best_len = pos - start + 1
+                    self._best = (start, pos + 1)
+                window.popleft()
+                have[code] -= 1
+                if have[code] < need[code]:
+                    formed -= 1
+            while window and have[window[0][1]] > need[window[0][1]]:
+                have[window.popleft()[1]] -= 1
+
+        self._formed = formed
+        self.position += len(chunk)
+
+    def appendFile(self, path: str | os.PathLike, chunk_size: int = 1 << 20):
+        """
+        Appends a whole file, memory-mapped read-only and fed in `chunk_size` views,
+        so the file is never loaded into one `bytes` object.
+        """
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, len(view), chunk_size):
+                    with view[offset:offset + chunk_size] as part:
+                        self.append(part)
+
+    def bestWindow(self) -> tuple[int, int] | None:
+        """
+        Absolute `(start, stop)` offsets of the minimum window so far, or `None`.
+        """
+        return self._best
+
+
+CacheInfo = collections.namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class MinWindowIndex:
+    """
+    Index over one text `s` answering `minWindow(s, t)` for many different `t`.
+
+    Built once in O(|s|): for every distinct character of `s`, the sorted positions
+    where it occurs, stored as an `array('q')` and filled in one pass over `s`.
+    A query for `t` then never touches the rest of `s`:
+    1. If some character of `t` occurs fewer times in `s` than in `t`, there is no
+       window: answered from the array lengths alone.
+    2. Otherwise the position arrays of the characters of `t` are merged (`sorted` on
+       concatenated sorted runs, which Timsort merges in linear time), and the same
+       two-pointer scan as `minWindowFast` runs over the merged positions only.
+
+    Queries are memoized per index in an LRU dict of at most `cache_size` entries, keyed
+    by the multiset of `t` (its sorted character counts), so `t` strings that are
+    anagrams of each other share one entry.
+
+    Example:
+        >>> index = MinWindowIndex("ADOBECODEBANC")
+        >>> index.query("ABC"), index.minWindow("CAB")
+        ((9, 13), 'BANC')
+        >>> index.queryMany(["AABC", "XYZ"])
+        [(0, 11), None]
+    """
+    def __init__(self, s: str | bytes, cache_size: int = 1024):
+        self.s = s
+        # Keys are characters for `str` and byte values for `bytes`, as `s[pos]` returns.
+        positions: DefaultDict[str | int, array.array] = collections.defaultdict(lambda: array.array('q'))
+        for pos, ch in enumerate(s):
+            positions[ch].append(pos)
+        self._positions = dict(positions)
+        # A plain dict in least-recently-used order (an `lru_cache` around the bound
+        # `self._solve` would keep the index alive through a reference cycle).
+        self.cache_size = cache_size
+        self.hits = self.misses = 0
+        self._cache: dict[tuple, tuple[int, int] | None] = {}
+
+    @staticmethod
+    def canonical(t: str | bytes) -> tuple:
+        """
+        Cache key of `t`: its characters with their counts, sorted.
+        """
+        return tuple(sorted(collections.Counter(t).items()))
+
+    def _solve(self, multiset: tuple) -> tuple[int, int] | None:
+        need = dict(multiset)
+        if not need or any(len(self._positions.get(ch, ())) < count for ch, count in need.items()):
+            return None
+        positions = sorted(itertools.chain.from_iterable(self._positions[ch] for ch in need))
+
+        s = self.s
+        have = dict.fromkeys(need, 0)
+        required, formed = len(need), 0
+        left = 0
+        best = None
+        min_len = len(s) + 1
+        for pos in positions:
+            ch = s[pos]
+            have[ch] += 1
+            if have[ch] == need[ch]:
+                formed += 1
+            while formed == required:
+                start = positions[left]
+                if pos - start + 1 < min_len:
+                    min_len = pos - start + 1
+                    best = (start, pos + 1)
+                ch = s[start]
+                have[ch] -= 1
+                if have[ch] < need[ch]:
+                    formed -= 1
+                left += 1
+        return best
+
+    def _query_multiset(self, multiset: tuple) -> tuple[int, int] | None:
+        if multiset in self._cache:
+            self.hits += 1
+            self._cache[multiset] = self._cache.pop(multiset)  # Now the most recently used.
+            return self._cache[multiset]
+        self.misses += 1
+        best = self._cache[multiset] = self._solve(multiset)
+        if len(self._cache) > self.cache_size:
+            del self._cache[next(iter(self._cache))]
+        return best
+
+    def query(self, t: str | bytes) -> tuple[int, int] | None:
+        """
+        `(start, stop)` offsets of the minimum window of `s` containing `t`, or `None`.
+        """
+        return self._query_multiset(self.canonical(t))
+
+    def minWindow(self, t: str | bytes) -> str | bytes:
+        """
+        Same result as `Solution().minWindow(s, t)`.
+        """
+        best = self.query(t)
+        return self.s[best[0]:best[1]] if best else self.s[:0]
+
+    def queryMany(self, ts: Iterable[str | bytes]) -> list[tuple[int, int] | None]:
+        """
+        `query` for every `t`, in order. Distinct multisets are solved once each, in
+        this process: the scans are CPU-bound, so threads would only take turns on the
+        GIL, and worker processes would each need a copy of the index.
+        """
+        keys = [self.canonical(t) for t in ts]
+        answers = {key: self._query_multiset(key) for key in dict.fromkeys(keys)}
+        return [answers[key] for key in keys]
+
+    def cacheInfo(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.cache_size, len(self._cache))
+
+
+def random_text(length: int, alphabet: str, seed: int, planted: str = "") -> str:
+    """
+    Seeded random text over `alphabet`, with the characters of `planted` scattered in it.
+    """
+    rng = random.Random(seed)
+    chars = [rng.choice(alphabet) for _ in range(length)]
+    for ch in planted:
+        chars[rng.randrange(length)] = ch
+    return "".join(chars)
+
+
+def run_benchmarks(length: int = 1_000_000, repeats: int = 3):
+    """
+    Times `minWindowFast` against `minWindow` on long texts where few characters belong to `t`.
+
+    Run with: python maximum_path_sum_in_binary_tree.py --bench
+    """
+    sol = Solution()
+    print(f"{'|s|':>9} | {'t':>8} | {'target share':>12} | {'minWindow (s)':>13} | {'minWindowFast (s)':>17} | {'speedup':>7}")
+    for t, planted in (("XYZ", "XYZ" * 5), ("XYZ", "XYZ" * 5000), ("abc", "")):
+        s = random_text(length, "abcdefghijklmnopqrstuvwxyz", seed=len(planted), planted=planted)
+        timings = []
+        for method in (sol.minWindow, sol.minWindowFast):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                result = method(s, t)
+                best = min(best, time.perf_counter() - start)
+            timings.append((best, result))
+        (t_old, r_old), (t_new, r_new) = timings
+        assert r_old == r_new, "minWindowFast disagrees with minWindow"
+        share = sum(s.count(ch) for ch in set(t)) / length
+        print(f"{length:>9} | {t:>8} | {share:>12.4%} | {t_old:>13.4f} | {t_new:>17.4f} | {t_old / t_new:>6.1f}x")
+
+
+if __name__ == '__main__':
+    if '--bench' in sys.argv[1:]:
+        run_benchmarks()
+    else:
+        # The tests live in test_maximum_path_sum_in_binary_tree.py, so the solver never
+        # imports unittest.
+        import unittest
+        unittest.main(module='test_maximum_path_sum_in_binary_tree', argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,343 @@
+import collections
+import gc
+import mmap
+import os
+import random
+import sys
+import unittest
+import weakref
+
+# Tests of maximum_path_sum_in_binary_tree.py, kept apart so that loading the solver does not
+# import unittest. Loaded by path (as tools/test_runner.py does), this module does
+# not have its own directory on `sys.path`, so it is added here.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+from maximum_path_sum_in_binary_tree import (MinWindowIndex, MinWindowStream, Solution, iter_min_window_spans,
+                                             random_text)
+
+
+class TestMinWindow(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    # --- Basic Examples from Problem / Common Cases ---
+    def test_example_1(self):
+        s = "ADOBECODEBANC"
+        t = "ABC"
+        self.assertEqual(self.sol.minWindow(s, t), "BANC")
+
+    def test_example_2(self):
+        s = "a"
+        t = "a"
+        self.assertEqual(self.sol.minWindow(s, t), "a")
+
+    def test_example_3(self):
+        s = "a"
+        t = "aa"
+        self.assertEqual(self.sol.minWindow(s, t), "")
+
+    def test_example_4(self):
+        s = "ADOBECODEBANC"
+        t = "AABC"
+        self.assertEqual(self.sol.minWindow(s, t), "ADOBECODEBA")
+
+    def test_example_5(self):
+        s = "ab"
+        t = "b"
+        self.assertEqual(self.sol.minWindow(s, t), "b")
+
+    # --- Edge Cases ---
+    def test_t_is_empty(self):
+        self.assertEqual(self.sol.minWindow("any_string", ""), "")
+
+    def test_s_is_empty(self):
+        self.assertEqual(self.sol.minWindow("", "abc"), "")
+        self.assertEqual(self.sol.minWindow("", ""), "")
+
+    def test_no_valid_window(self):
+        self.assertEqual(self.sol.minWindow("abc", "xyz"), "")
+        self.assertEqual(self.sol.minWindow("ab", "c"), "")
+
+    def test_t_longer_than_s(self):
+        self.assertEqual(self.sol.minWindow("a", "abc"), "")
+        self.assertEqual(self.sol.minWindow("hello", "helloworld"), "")
+
+    def test_s_has_only_one_char(self):
+        self.assertEqual(self.sol.minWindow("x", "x"), "x")
+        self.assertEqual(self.sol.minWindow("x", "y"), "")
+
+    def test_t_has_only_one_char(self):
+        self.assertEqual(self.sol.minWindow("banana", "a"), "a")
+        # Corrected: for t="l", the shortest window containing 'l' is just "l" itself.
+        self.assertEqual(self.sol.minWindow("hello", "l"), "l")
+
+    def test_s_and_t_are_same(self):
+        self.assertEqual(self.sol.minWindow("hello", "hello"), "hello")
+
+    def test_all_chars_identical(self):
+        self.assertEqual(self.sol.minWindow("aaaaa", "aa"), "aa")
+        self.assertEqual(self.sol.minWindow("bbbbbb", "bbb"), "bbb")
+
+    def test_window_at_start(self):
+        self.assertEqual(self.sol.minWindow("abracadabra", "abc"), "abr")
+
+    def test_window_at_end(self):
+        self.assertEqual(self.sol.minWindow("hello", "ol"), "llo")
+        self.assertEqual(self.sol.minWindow("xyzabc", "abc"), "abc")
+
+    # --- More Comprehensive Tests ---
+    def test_mixed_case(self):
+        self.assertEqual(self.sol.minWindow("aBcdeFg", "BCF"), "BcdeF")
+        self.assertEqual(self.sol.minWindow("aBcDeFgHij", "BCH"), "BcDeFgHi")
+
+    def test_target_with_duplicates_sparse_s(self):
+        self.assertEqual(self.sol.minWindow("abccba", "aa"), "abccba")
+        self.assertEqual(self.sol.minWindow("figeha__ch_e", "aei"), "igeha")
+        self.assertEqual(self.sol.minWindow("AYZABXAPPS", "AAB"), "AYZAB")
+
+    def test_target_with_duplicates_compact_s(self):
+        self.assertEqual(self.sol.minWindow("ADOBECODEBANC", "BCC"), "CODEBANC")
+        self.assertEqual(self.sol.minWindow("ADOBECODEBANC", "AABC"), "ADOBECODEBA")
+
+    def test_s_contains_t_exactly_once(self):
+        self.assertEqual(self.sol.minWindow("abcdefg", "cde"), "cde")
+
+    def test_t_is_single_char_repeated(self):
+        self.assertEqual(self.sol.minWindow("banana", "nn"), "nan")
+
+    def test_complex_long_string(self):
+        s = "THISISATESTSTRINGWITHMANYCHARACTERSANDTHEDESIREDWINDOWISHERE"
+        t = "TESTWINDOW"
+        self.assertEqual(self.sol.minWindow(s, t), "TESTSTRINGWITHMANYCHARACTERSANDTHEDESIREDWINDOW")
+
+    def test_no_match_at_all(self):
+        self.assertEqual(self.sol.minWindow("abcdef", "xyz"), "")
+
+    def test_all_s_is_window(self):
+        self.assertEqual(self.sol.minWindow("hello", "hol"), "hello")
+
+    def test_long_string_many_options(self):
+        s = "abcabcadcba"
+        t = "abc"
+        self.assertEqual(self.sol.minWindow(s, t), "abc")
+
+    def test_long_string_sparse_t(self):
+        s = "aaaaaaaaaaaaabcc"
+        t = "abc"
+        self.assertEqual(self.sol.minWindow(s, t), "abcc")
+
+class TestMinWindowFast(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_matches_min_window_on_examples(self):
+        cases = [("ADOBECODEBANC", "ABC"), ("a", "a"), ("a", "aa"), ("ADOBECODEBANC", "AABC"),
+                 ("ab", "b"), ("any_string", ""), ("", "abc"), ("abc", "xyz"), ("aaaaa", "aa"),
+                 ("figeha__ch_e", "aei"), ("a.b*c[d]", "*[]"), ("banana", "nn")]
+        for s, t in cases:
+            self.assertEqual(self.sol.minWindowFast(s, t), self.sol.minWindow(s, t))
+
+    def test_matches_min_window_on_random_texts(self):
+        rng = random.Random(5)
+        for seed in range(50):
+            s = random_text(rng.randint(1, 60), "abcde", seed)
+            t = "".join(rng.choice("abcdef") for _ in range(rng.randint(1, 4)))
+            self.assertEqual(self.sol.minWindowFast(s, t), self.sol.minWindow(s, t))
+
+    def test_bytes_input(self):
+        self.assertEqual(self.sol.minWindowFast(b"ADOBECODEBANC", b"ABC"), b"BANC")
+        self.assertEqual(self.sol.minWindowFast(bytearray(b"ADOBECODEBANC"), b"ABC"), bytearray(b"BANC"))
+        self.assertEqual(self.sol.minWindowFast(b"abc", b"xyz"), b"")
+
+    def test_non_ascii_falls_back(self):
+        self.assertEqual(self.sol.minWindowFast("héllo wörld", "öl"), self.sol.minWindow("héllo wörld", "öl"))
+
+class TestMinWindowStream(unittest.TestCase):
+    def test_matches_min_window_across_random_chunks(self):
+        rng = random.Random(9)
+        sol = Solution()
+        for seed in range(40):
+            s = random_text(rng.randint(1, 80), "abcde", seed)
+            t = "".join(rng.choice("abcdef") for _ in range(rng.randint(1, 4)))
+            stream = MinWindowStream(t)
+            data = s.encode()
+            cut = 0
+            while cut < len(data):
+                step = rng.randint(1, 10)
+                stream.append(memoryview(data)[cut:cut + step])
+                cut += step
+            best = stream.bestWindow()
+            self.assertEqual(s[best[0]:best[1]] if best else "", sol.minWindow(s, t))
+            self.assertEqual(stream.position, len(data))
+
+    def test_window_state_stays_bounded(self):
+        stream = MinWindowStream("ab")
+        for _ in range(100):
+            stream.append(b"a" * 1000)
+        self.assertEqual(len(stream._window), 1)
+        stream.append(b"xb")
+        self.assertEqual(stream.bestWindow(), (99999, 100002))
+
+    def test_append_file(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "log.txt")
+            with open(path, "wb") as f:
+                f.write(b"ADOBECODEBANC")
+            stream = MinWindowStream(b"ABC")
+            stream.appendFile(path, chunk_size=4)
+            self.assertEqual(stream.bestWindow(), (9, 13))
+            stream.append(b"")
+            self.assertEqual(stream.position, 13)
+
+class TestMinWindowIndex(unittest.TestCase):
+    def test_matches_min_window(self):
+        rng = random.Random(21)
+        sol = Solution()
+        for seed in range(10):
+            s = random_text(rng.randint(1, 80), "abcde", seed)
+            index = MinWindowIndex(s)
+            byte_index = MinWindowIndex(s.encode())
+            for _ in range(10):
+                t = "".join(rng.choice("abcdef") for _ in range(rng.randint(1, 4)))
+                self.assertEqual(index.minWindow(t), sol.minWindow(s, t))
+                self.assertEqual(byte_index.minWindow(t.encode()), sol.minWindow(s, t).encode())
+
+    def test_anagrams_share_cache_entry(self):
+        index = MinWindowIndex("ADOBECODEBANC")
+        self.assertEqual(index.queryMany(["ABC", "CBA", "BAC", "AABC", "XYZ"]),
+                         [(9, 13), (9, 13), (9, 13), (0, 11), None])
+        self.assertEqual(index.cacheInfo().misses, 3)
+        self.assertEqual(index.query("ACB"), (9, 13))
+        self.assertEqual(index.cacheInfo().hits, 1)
+
+    def test_cache_evicts_least_recently_used(self):
+        index = MinWindowIndex("ADOBECODEBANC", cache_size=2)
+        index.query("ABC")
+        index.query("XYZ")
+        index.query("CAB")  # Hit: "ABC" becomes the most recently used entry.
+        index.query("AABC")  # Evicts "XYZ".
+        self.assertEqual(index.cacheInfo(), (1, 3, 2, 2))
+        index.query("ZYX")
+        self.assertEqual(index.cacheInfo().misses, 4)
+
+    def test_index_is_freed_without_gc(self):
+        index = MinWindowIndex("ADOBECODEBANC")
+        index.queryMany(["ABC", "XYZ"])
+        ref = weakref.ref(index)
+        gc.disable()
+        try:
+            del index
+            self.assertIsNone(ref())  # No reference cycle through the cache.
+        finally:
+            gc.enable()
+
+    def test_empty_target(self):
+        self.assertIsNone(MinWindowIndex("abc").query(""))
+        self.assertEqual(MinWindowIndex("abc").minWindow(""), "")
+
+class TestMinWindowParallel(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_matches_serial_with_many_shards(self):
+        rng = random.Random(17)
+        for seed in range(6):
+            s = random_text(400, "abcdefgh", seed, planted="XYZ" * 3)
+            for t in ("XYZ", "abc", "aXb", "hhh"):
+                self.assertEqual(self.sol.minWindowParallel(s, t, workers=2, min_shard_size=50),
+                                 self.sol.minWindow(s, t))
+
+    def test_window_crossing_boundary(self):
+        s = "x" * 99 + "AB" + "x" * 99 + "ABC"
+        self.assertEqual(self.sol.minWindowParallel(s, "AB", workers=2, min_shard_size=50), "AB")
+        self.assertEqual(self.sol.minWindowParallel(s.encode(), b"AB", workers=2, min_shard_size=50), b"AB")
+
+    def test_long_window_falls_back_to_serial(self):
+        s = "A" + "x" * 300 + "B"
+        self.assertEqual(self.sol.minWindowParallel(s, "AB", workers=2, min_shard_size=50), s)
+        self.assertEqual(self.sol.minWindowParallel(s, "AQ", workers=2, min_shard_size=50), "")
+
+class TestMinWindowSpans(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    @staticmethod
+    def brute_force_minimal(s, t):
+        need = collections.Counter(t)
+        def holds(i, j):
+            return not need - collections.Counter(s[i:j])
+        return [(i, j) for i in range(len(s)) for j in range(i + 1, len(s) + 1)
+                if holds(i, j) and not holds(i + 1, j) and not holds(i, j - 1)]
+
+    def test_all_minimum_windows(self):
+        self.assertEqual(list(self.sol.minWindowSpans("abcab", "ab")), [(0, 2), (3, 5)])
+        self.assertEqual(list(self.sol.minWindowSpans("ADOBECODEBANC", "ABC")), [(9, 13)])
+        self.assertEqual(list(self.sol.minWindowSpans("abc", "xyz")), [])
+        self.assertEqual(list(self.sol.minWindowSpans("abc", "")), [])
+
+    def test_matches_brute_force_on_random_texts(self):
+        rng = random.Random(18)
+        for seed in range(40):
+            s = random_text(rng.randint(1, 30), "abcd", seed)
+            t = "".join(rng.choice("abcde") for _ in range(rng.randint(1, 3)))
+            minimal = self.brute_force_minimal(s, t)
+            self.assertEqual(sorted(iter_min_window_spans(s, t)), minimal)
+            shortest = min((j - i for i, j in minimal), default=None)
+            self.assertEqual(list(self.sol.minWindowSpans(s, t)), [(i, j) for i, j in minimal if j - i == shortest])
+            top = list(self.sol.minWindowSpans(s, t, k=3))
+            self.assertEqual(top, sorted(minimal, key=lambda span: (span[1] - span[0], span[0]))[:3])
+            if minimal:
+                i, j = top[0]
+                self.assertEqual(s[i:j], self.sol.minWindow(s, t))
+
+    def test_early_stop_and_bytes(self):
+        spans = self.sol.minWindowSpans(b"ab" * 1000, b"ab")
+        self.assertEqual(next(spans), (0, 2))
+        self.assertEqual(next(spans), (1, 3))
+        self.assertEqual(list(self.sol.minWindowSpans("héllo wörld", "öl", k=2)), [(7, 10), (3, 8)])
+        self.assertEqual(list(self.sol.minWindowSpans("abc", "a", k=0)), [])
+
+class TestMinWindowBuffers(unittest.TestCase):
+    def setUp(self):
+        self.sol = Solution()
+
+    def test_buffers_match_str_path(self):
+        for seed in range(20):
+            text = random_text(200, "abcdef", seed)
+            for t in ("a", "abc", "ffe", "aaz"):
+                expected = self.sol.minWindow(text, t).encode()
+                data = text.encode()
+                self.assertEqual(self.sol.minWindow(data, t.encode()), expected)
+                self.assertEqual(self.sol.minWindow(bytearray(data), t), bytearray(expected))
+                self.assertEqual(bytes(self.sol.minWindow(memoryview(data), t)), expected)
+
+    def test_mmap_is_scanned_in_place(self):
+        import tempfile
+
+        with tempfile.TemporaryFile() as f:
+            f.write(b"x" * 5000 + b"ADOBECODEBANC" + b"x" * 5000)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(self.sol.minWindow(mapped, b"ABC"), b"BANC")
+                self.assertEqual(self.sol.minWindow(mapped, b"Q"), b"")
+
+    def test_non_byte_sequences_keep_item_semantics(self):
+        self.assertEqual(self.sol.minWindow(["a", "b", "c"], "ac"), ["a", "b", "c"])
+
+    def test_empty_byte_inputs_return_bytes(self):
+        self.assertEqual(self.sol.minWindow(b"", b"a"), b"")
+        self.assertEqual(self.sol.minWindow(b"abc", b""), b"")
+        self.assertEqual(self.sol.minWindow(bytearray(), "a"), bytearray())
+        self.assertIsInstance(self.sol.minWindow(b"", ""), bytes)
+
+    def test_non_latin1_target_on_bytes_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.sol.minWindow(b"abc", "a€")
+        self.assertEqual(self.sol.minWindow(b"caf\xe9", "\xe9"), b"\xe9")
+
+
+if __name__ == '__main__':
+    unittest.main()
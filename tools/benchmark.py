@@ -0,0 +1,337 @@
+"""
+Benchmark harness for the four problem solvers, with baseline regression gating.
+
+Every solver is timed on seeded inputs at several scales. For each case the
+harness records the best wall time over a few repeats, the throughput in the
+solver's own unit (gold cells, array elements, calls or text characters), and
+the peak memory allocated during one extra run traced by `tracemalloc`.
+
+Results are printed as a table and can be written to JSON. With `--baseline`
+they are compared against a stored run, and the exit status is 1 when any
+case is slower or allocates more than the baseline by more than `--threshold`.
+Baselines are machine-specific: record one with `--update-baseline` on the
+machine that will do the gating.
+
+Run with:
+    python tools/benchmark.py                              # all solvers, all scales
+    python tools/benchmark.py --solvers minWindow --scales small medium
+    python tools/benchmark.py --output bench.json --baseline tools/benchmark_baseline.json
+    python tools/benchmark.py --update-baseline            # rewrite the stored baseline
+    python tools/benchmark.py --buffers                    # buffer inputs vs converting to lists
+
+`--buffers` compares, on large inputs, passing `array` / `bytes` data straight to
+each solver against the usual conversion to `list` / `str` before the call: the
+conversion is timed with the call, and the peak includes the converted copy.
+"""
+
+import argparse
+import array
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from registry import load_problem
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'benchmark_baseline.json'
+SCALES = ('small', 'medium', 'large')
+
+# Peak-memory differences below this many bytes are never reported as regressions
+# (allocator noise on small cases would otherwise dominate the ratio).
+MEMORY_SLACK = 64 * 1024
+
+
+class Case(NamedTuple):
+    """One benchmark input: the call arguments and the work they represent."""
+    args: tuple
+    ops: int
+
+
+class SolverSpec(NamedTuple):
+    """
+    A solver entry point and its seeded input generator.
+
+    `make_case(module, scale, seed)` builds the input; `calls` is how many times the
+    method is called per timed run (for solvers too fast to time in one call).
+    """
+    name: str
+    path: str
+    method: str
+    unit: str
+    make_case: Callable[[Any, str, int], Case]
+    calls: int = 1
+
+
+def gold_case(module, scale: str, seed: int) -> Case:
+    """One connected blob of gold cells in a 10x10 grid (the search is exponential in it)."""
+    cells = {'small': 10, 'medium': 16, 'large': 22}[scale]
+    return Case((module.random_gold_grid(10, 10, cells, seed),), cells)
+
+
+def max_subarray_case(module, scale: str, seed: int) -> Case:
+    """Uniform random integers in [-10000, 10000]."""
+    n = {'small': 10_000, 'medium': 100_000, 'large': 1_000_000}[scale]
+    rng = random.Random(seed)
+    return Case(([rng.randint(-10_000, 10_000) for _ in range(n)],), n)
+
+
+def find_min_case(module, scale: str, seed: int) -> Case:
+    """A sorted range of distinct integers rotated at a random pivot."""
+    n = {'small': 1_000, 'medium': 100_000, 'large': 1_000_000}[scale]
+    pivot = random.Random(seed).randrange(n)
+    return Case((list(range(pivot, n)) + list(range(pivot)),), 1)
+
+
+def min_window_case(module, scale: str, seed: int) -> Case:
+    """Random lowercase text with the target characters scattered in it."""
+    n = {'small': 10_000, 'medium': 100_000, 'large': 1_000_000}[scale]
+    s = module.random_text(n, 'abcdefghijklmnopqrstuvwxyz', seed, planted='XYZ' * 50)
+    return Case((s, 'XYZ'), n)
+
+
+SOLVERS = (
+    SolverSpec('getMaximumGold', 'problems/arrays/k_smallest_sum_pairs.py', 'getMaximumGold',
+               'gold cells', gold_case),
+    SolverSpec('maxSubArray', 'problems/arrays/maximum_subarray_sum_of_size_k.py', 'maxSubArray',
+               'elements', max_subarray_case),
+    SolverSpec('findMin', 'problems/trees/lowest_common_ancestor_in_a_binary_tree.py', 'findMin',
+               'calls', find_min_case, calls=1000),
+    SolverSpec('minWindow', 'problems/trees/maximum_path_sum_in_binary_tree.py', 'minWindow',
+               'characters', min_window_case),
+)
+
+
+class BufferCase(NamedTuple):
+    """A buffer-protocol input and the conversion callers needed before the buffer paths."""
+    args: tuple
+    to_lists: Callable[..., tuple]
+
+
+def gold_buffers(module, seed: int) -> BufferCase:
+    """The medium gold grid, flattened into `bytes` and passed with its shape."""
+    grid = module.random_gold_grid(10, 10, 16, seed)
+    flat = bytes(value for row in grid for value in row)
+    return BufferCase((flat, (10, 10)), lambda flat, shape: ([list(flat[r * 10:(r + 1) * 10]) for r in range(10)],))
+
+
+def max_subarray_buffers(module, seed: int) -> BufferCase:
+    """One million random int64 values in an `array('q')`."""
+    rng = random.Random(seed)
+    data = array.array('q', (rng.randint(-10_000, 10_000) for _ in range(1_000_000)))
+    return BufferCase((data,), lambda data: (data.tolist(),))
+
+
+def find_min_buffers(module, seed: int) -> BufferCase:
+    """A rotated range of one million int64 values in an `array('q')`."""
+    n = 1_000_000
+    pivot = random.Random(seed).randrange(n)
+    data = array.array('q', range(pivot, n))
+    data.extend(range(pivot))
+    return BufferCase((data,), lambda data: (data.tolist(),))
+
+
+def min_window_buffers(module, seed: int) -> BufferCase:
+    """The large `minWindow` text as `bytes`, decoded to `str` by the conversion."""
+    text = module.random_text(1_000_000, 'abcdefghijklmnopqrstuvwxyz', seed, planted='XYZ' * 50)
+    return BufferCase((text.encode('latin-1'), b'XYZ'), lambda data, t: (data.decode('latin-1'), t.decode()))
+
+
+BUFFER_CASES = {
+    'getMaximumGold': gold_buffers,
+    'maxSubArray': max_subarray_buffers,
+    'findMin': find_min_buffers,
+    'minWindow': min_window_buffers,
+}
+
+
+def best_time(call: Callable[[], Any], repeats: int, min_time: float) -> tuple[float, int]:
+    """Best seconds per `call()` over `repeats` auto-ranged runs, and the loop count used."""
+    def timed(loops: int) -> float:
+        start = time.perf_counter()
+        for _ in range(loops):
+            call()
+        return time.perf_counter() - start
+
+    gc.collect()
+    loops = 1
+    while timed(loops) < min_time:
+        loops *= 2
+    return min(timed(loops) for _ in range(repeats)) / loops, loops
+
+
+def peak_bytes(call: Callable[[], Any]) -> int:
+    """`tracemalloc` peak of one `call()`, in bytes."""
+    tracemalloc.start()
+    try:
+        call()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(spec: SolverSpec, scale: str, repeats: int = 5, seed: int = 0, min_time: float = 0.05) -> dict:
+    """
+    Benchmarks one solver at one scale.
+
+    As in `timeit.Timer.autorange`, the case is looped until one timed run lasts at
+    least `min_time` seconds, so millisecond cases are not dominated by timer and
+    scheduler noise; the best of `repeats` such runs is kept.
+
+    Returns:
+        A JSON-ready dict with the time of one case in seconds, the throughput in
+        `unit`s per second, and the `tracemalloc` peak in bytes of one more case
+        (traced separately, since tracing slows the code down).
+    """
+    module = load_problem(spec.path)
+    method = getattr(module.Solution(), spec.method)
+    case = spec.make_case(module, scale, seed)
+    ops = case.ops * spec.calls
+
+    def run():
+        for _ in range(spec.calls):
+            method(*case.args)
+
+    best, loops = best_time(run, repeats, min_time)
+    peak = peak_bytes(run)
+    return {'seconds': best, 'ops': ops, 'unit': spec.unit, 'ops_per_sec': ops / best if best else None,
+            'peak_bytes': peak, 'loops': loops}
+
+
+def run_suite(solvers: list[str] | None = None, scales: list[str] | None = None, repeats: int = 5,
+              seed: int = 0) -> dict:
+    """
+    Benchmarks the selected solvers (all by default) at the selected scales.
+
+    Returns:
+        `{'meta': {...}, 'results': {'<solver>/<scale>': measure(...)}}`.
+    """
+    results = {}
+    for spec in SOLVERS:
+        if solvers and spec.name not in solvers:
+            continue
+        for scale in scales or SCALES:
+            results[f'{spec.name}/{scale}'] = measure(spec, scale, repeats, seed)
+    meta = {'python': platform.python_version(), 'machine': platform.machine(), 'repeats': repeats,
+            'seed': seed, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    return {'meta': meta, 'results': results}
+
+
+def measure_buffers(spec: SolverSpec, repeats: int = 5, seed: int = 0, min_time: float = 0.05) -> dict:
+    """
+    Times one solver on a buffer input, passed directly and converted to lists first.
+
+    Both paths must return the same answer. Returns the time and `tracemalloc` peak
+    of each, as `{'buffer': {...}, 'lists': {...}}`.
+    """
+    module = load_problem(spec.path)
+    method = getattr(module.Solution(), spec.method)
+    case = BUFFER_CASES[spec.name](module, seed)
+    direct = method(*case.args)
+    converted = method(*case.to_lists(*case.args))
+    if direct != (converted.encode('latin-1') if isinstance(converted, str) else converted):
+        raise AssertionError(f"{spec.name}: buffer path returned {direct!r}, list path {converted!r}")
+
+    results = {}
+    for path, call in (('buffer', lambda: method(*case.args)), ('lists', lambda: method(*case.to_lists(*case.args)))):
+        seconds, loops = best_time(call, repeats, min_time)
+        results[path] = {'seconds': seconds, 'peak_bytes': peak_bytes(call), 'loops': loops}
+    return results
+
+
+def print_buffer_report(results: dict[str, dict]):
+    print(f"{'solver':<16} | {'lists (s)':>10} | {'buffer (s)':>10} | {'speedup':>7} | "
+          f"{'lists peak (KiB)':>16} | {'buffer peak (KiB)':>17}")
+    for name, result in results.items():
+        lists, buffer = result['lists'], result['buffer']
+        print(f"{name:<16} | {lists['seconds']:>10.6f} | {buffer['seconds']:>10.6f} | "
+              f"{lists['seconds'] / buffer['seconds']:>6.2f}x | {lists['peak_bytes'] / 1024:>16.1f} | "
+              f"{buffer['peak_bytes'] / 1024:>17.1f}")
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.25) -> list[str]:
+    """
+    Lists the regressions of `report` against `baseline`.
+
+    A case regresses when its time exceeds the baseline time by more than
+    `threshold` (0.25 = 25% slower), or its peak memory exceeds the baseline peak by
+    more than `threshold` and by more than `MEMORY_SLACK` bytes. Cases missing from
+    either side are ignored.
+    """
+    regressions = []
+    for key, result in report['results'].items():
+        base = baseline.get('results', {}).get(key)
+        if base is None:
+            continue
+        if result['seconds'] > base['seconds'] * (1 + threshold):
+            regressions.append(f"{key}: {result['seconds']:.6f}s vs baseline {base['seconds']:.6f}s "
+                               f"(+{result['seconds'] / base['seconds'] - 1:.0%})")
+        extra = result['peak_bytes'] - base['peak_bytes']
+        if extra > MEMORY_SLACK and result['peak_bytes'] > base['peak_bytes'] * (1 + threshold):
+            regressions.append(f"{key}: peak {result['peak_bytes']} B vs baseline {base['peak_bytes']} B "
+                               f"(+{extra} B)")
+    return regressions
+
+
+def print_report(report: dict, baseline: dict | None = None):
+    print(f"{'case':<24} | {'time (s)':>10} | {'baseline (s)':>12} | {'ops/sec':>14} | {'unit':<10} | "
+          f"{'peak (KiB)':>10}")
+    for key, result in report['results'].items():
+        base = (baseline or {}).get('results', {}).get(key)
+        base_time = f"{base['seconds']:>12.6f}" if base else f"{'-':>12}"
+        print(f"{key:<24} | {result['seconds']:>10.6f} | {base_time} | {result['ops_per_sec']:>14,.0f} | "
+              f"{result['unit']:<10} | {result['peak_bytes'] / 1024:>10.1f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--solvers', nargs='+', choices=[spec.name for spec in SOLVERS],
+                        help='solvers to run (default: all)')
+    parser.add_argument('--scales', nargs='+', choices=SCALES, help='input scales to run (default: all)')
+    parser.add_argument('--repeats', type=int, default=5, help='timed runs per case; the best one is kept')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the input generators')
+    parser.add_argument('--output', type=Path, help='write the results to this JSON file')
+    parser.add_argument('--baseline', type=Path, help='compare against this JSON baseline and gate on it')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed relative slowdown / memory growth before failing (default: 0.25)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help=f'write the results as the new baseline (default path: {DEFAULT_BASELINE.name})')
+    parser.add_argument('--buffers', action='store_true',
+                        help='compare buffer inputs against converting them to lists (large inputs only)')
+    args = parser.parse_args(argv)
+
+    if args.buffers:
+        results = {spec.name: measure_buffers(spec, args.repeats, args.seed)
+                   for spec in SOLVERS if not args.solvers or spec.name in args.solvers}
+        print_buffer_report(results)
+        if args.output:
+            args.output.write_text(json.dumps({'buffers': results}, indent=2) + '\n')
+        return 0
+
+    report = run_suite(args.solvers, args.scales, args.repeats, args.seed)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    print_report(report, baseline)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+    if args.update_baseline:
+        path = args.baseline or DEFAULT_BASELINE
+        path.write_text(json.dumps(report, indent=2) + '\n')
+        print(f"Baseline written to {path}")
+        return 0
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regression beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Empirical check of the time complexities documented by the solvers.
+
+Each solver is run on input families of growing size, including adversarial ones.
+Work is measured two ways:
+
+- operations: the number of Python lines the solver's module executes (counted
+  with `sys.settrace`). This is deterministic and machine-independent, but blind to
+  work done inside C (slicing, `in` on lists, `sum`, string concatenation).
+- wall time of untraced calls, which sees that hidden C work, but is noisier, so it
+  gets a looser tolerance.
+
+For every family the tool reports the fitted growth exponent `k` of `ops ~ n^k`
+(least squares on log-log points), the best-fitting complexity class among
+`MODELS`, and the residual exponents: the `k` of `ops / documented(n) ~ n^k` and of
+`time / documented(n) ~ n^k`. A residual above its tolerance means the cost grows
+faster than the documented bound, and the family is flagged.
+
+Residuals only bound the growth from above, so against an exponential bound they
+say little. Families built to hit the worst case (e.g. fully golden grids for
+`getMaximumGold`) therefore also name the class their growth is expected to reach.
+A slower best fit is reported as a warning, not flagged: the solver is faster than
+its docstring says (e.g. after an algorithmic speedup), so the docstring or the
+family needs a look, but nothing exceeds a documented bound.
+
+The exit status is 1 when any family is flagged, so the check can gate a build.
+
+Run with:
+    python tools/complexity.py
+    python tools/complexity.py --solvers minWindow --json scaling.json
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from registry import load_problem
+
+# Complexity classes as log f(n) (logs avoid overflowing the exponential ones),
+# in increasing order of growth.
+MODELS = {
+    'O(1)': lambda n: 0.0,
+    'O(log n)': lambda n: math.log(math.log2(n) + 1),
+    'O(n)': lambda n: math.log(n),
+    'O(n log n)': lambda n: math.log(n * math.log2(n + 1)),
+    'O(n^2)': lambda n: 2 * math.log(n),
+    'O(n^3)': lambda n: 3 * math.log(n),
+    'O(2^n)': lambda n: n * math.log(2),
+    'O(n * 3^n)': lambda n: math.log(n) + n * math.log(3),
+}
+
+
+class Family(NamedTuple):
+    """
+    One input family of a solver.
+
+    `make_args(module, n, rng)` builds the arguments for size `n`; `documented` is the
+    key in `MODELS` of the bound the solver's docstring claims for this input, and
+    `grows_as`, if set, the class of `MODELS` the worst case is expected to reach (a
+    slower best fit is reported, not flagged).
+    """
+    solver: str
+    path: str
+    method: str
+    name: str
+    documented: str
+    sizes: tuple[int, ...]
+    make_args: Callable[[Any, int, random.Random], tuple]
+    grows_as: str | None = None
+
+
+def geometric(start: int, count: int = 6, ratio: int = 2) -> tuple[int, ...]:
+    return tuple(start * ratio ** i for i in range(count))
+
+
+def rotated(n: int, pivot: int) -> list[int]:
+    return list(range(pivot, n)) + list(range(pivot))
+
+
+def gold_strip(rows: int, length: int) -> list[list[int]]:
+    """A fully golden `rows x length` strip: every cell reaches every other one."""
+    return [[1 + (r * length + c) % 100 for c in range(length)] for r in range(rows)]
+
+
+def gold_square(cells: int) -> list[list[int]]:
+    """A fully golden, near-square grid of `cells` cells (k x k or k x (k + 1))."""
+    rows = math.isqrt(cells)
+    return gold_strip(rows, cells // rows)
+
+
+FAMILIES = (
+    Family('maxSubArray', 'problems/arrays/maximum_subarray_sum_of_size_k.py', 'maxSubArray', 'random',
+           'O(n)', geometric(500), lambda m, n, rng: ([rng.randint(-100, 100) for _ in range(n)],)),
+    Family('maxSubArray', 'problems/arrays/maximum_subarray_sum_of_size_k.py', 'maxSubArray', 'all negative',
+           'O(n)', geometric(500), lambda m, n, rng: ([-1 - rng.randrange(100) for _ in range(n)],)),
+    Family('maxSubArray', 'problems/arrays/maximum_subarray_sum_of_size_k.py', 'maxSubArray', 'sawtooth',
+           'O(n)', geometric(500), lambda m, n, rng: ([(-1) ** i * (i % 7) for i in range(n)],)),
+    Family('findMin', 'problems/trees/lowest_common_ancestor_in_a_binary_tree.py', 'findMin', 'random pivot',
+           'O(log n)', geometric(64, 8, 4), lambda m, n, rng: (rotated(n, rng.randrange(1, n)),)),
+    Family('findMin', 'problems/trees/lowest_common_ancestor_in_a_binary_tree.py', 'findMin', 'pivot at 1',
+           'O(log n)', geometric(64, 8, 4), lambda m, n, rng: (rotated(n, 1),)),
+    Family('findMin', 'problems/trees/lowest_common_ancestor_in_a_binary_tree.py', 'findMin', 'pivot at n-1',
+           'O(log n)', geometric(64, 8, 4), lambda m, n, rng: (rotated(n, n - 1),)),
+    Family('minWindow', 'problems/trees/maximum_path_sum_in_binary_tree.py', 'minWindow', 'random text',
+           'O(n)', geometric(500), lambda m, n, rng: (m.random_text(n, 'abcdef', n), 'abc')),
+    Family('minWindow', 'problems/trees/maximum_path_sum_in_binary_tree.py', 'minWindow', 'window spans all',
+           'O(n)', geometric(500), lambda m, n, rng: ('a' * (n - 1) + 'b', 'ab')),
+    Family('minWindow', 'problems/trees/maximum_path_sum_in_binary_tree.py', 'minWindow', 'every char a window',
+           'O(n)', geometric(500), lambda m, n, rng: ('ab' * (n // 2), 'ab')),
+    Family('minWindow', 'problems/trees/maximum_path_sum_in_binary_tree.py', 'minWindow', '|t| = |s| / 4',
+           'O(n)', geometric(500), lambda m, n, rng: ('ab' * (n // 2), 'a' * (n // 4))),
+    Family('getMaximumGold', 'problems/arrays/k_smallest_sum_pairs.py', 'getMaximumGold', 'random blob',
+           'O(n * 3^n)', tuple(range(6, 23, 2)), lambda m, n, rng: (m.random_gold_grid(8, 8, n, n),)),
+    Family('getMaximumGold', 'problems/arrays/k_smallest_sum_pairs.py', 'getMaximumGold', '2-row strip',
+           'O(n * 3^n)', tuple(range(6, 23, 2)), lambda m, n, rng: (gold_strip(2, n // 2),)),
+    Family('getMaximumGold', 'problems/arrays/k_smallest_sum_pairs.py', 'getMaximumGold', '3-row strip',
+           'O(n * 3^n)', tuple(range(6, 22, 3)), lambda m, n, rng: (gold_strip(3, n // 3),), 'O(2^n)'),
+    Family('getMaximumGold', 'problems/arrays/k_smallest_sum_pairs.py', 'getMaximumGold', 'full square grid',
+           'O(n * 3^n)', (2, 4, 6, 9, 12, 16, 20), lambda m, n, rng: (gold_square(n),), 'O(2^n)'),
+)
+
+
+def count_operations(filename: str, func: Callable, *args) -> int:
+    """
+    Runs `func(*args)` and counts the lines executed in code from `filename`.
+
+    Nested functions and module helpers are included; library code and C builtins are
+    not, so the count tracks the solver's own Python loops.
+    """
+    count = 0
+
+    def trace_lines(frame, event, arg):
+        nonlocal count
+        if event == 'line':
+            count += 1
+        return trace_lines
+
+    def trace_calls(frame, event, arg):
+        return trace_lines if frame.f_code.co_filename == filename else None
+
+    previous = sys.gettrace()
+    sys.settrace(trace_calls)
+    try:
+        func(*args)
+    finally:
+        sys.settrace(previous)
+    return count
+
+
+def time_call(func: Callable, *args, min_time: float = 0.02, repeats: int = 3) -> float:
+    """Seconds per call of `func(*args)`: best of `repeats` runs looped to `min_time`."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(*args)
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / loops
+
+
+def slope(xs: list[float], ys: list[float]) -> float:
+    """Least-squares slope of `ys` against `xs`."""
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var if var else 0.0
+
+
+def best_model(sizes: list[int], ops: list[int]) -> str:
+    """The class of `MODELS` under which `ops / f(n)` is the most constant."""
+    def spread(model: str) -> float:
+        residuals = [math.log(op) - MODELS[model](n) for n, op in zip(sizes, ops)]
+        mean = sum(residuals) / len(residuals)
+        return sum((r - mean) ** 2 for r in residuals)
+    return min(MODELS, key=spread)
+
+
+def analyze(family: Family, tolerance: float = 0.15, time_tolerance: float = 0.35, seed: int = 0) -> dict:
+    """
+    Measures one family at all its sizes and checks the documented bound.
+
+    Returns:
+        A JSON-ready dict with the per-size operation counts and times, the fitted
+        exponent, the best-fitting class, the residual exponents against the
+        documented class, `flagged` when either residual exceeds its tolerance, and
+        `slower_than_documented` when the best fit is slower than `grows_as`.
+    """
+    module = load_problem(family.path)
+    method = getattr(module.Solution(), family.method)
+    rng = random.Random(seed)
+    ops, seconds = [], []
+    for n in family.sizes:
+        args = family.make_args(module, n, rng)
+        ops.append(max(1, count_operations(module.__file__, method, *args)))
+        seconds.append(time_call(method, *args))
+
+    log_n = [math.log(n) for n in family.sizes]
+    documented = [MODELS[family.documented](n) for n in family.sizes]
+    residual = slope(log_n, [math.log(op) - bound for op, bound in zip(ops, documented)])
+    time_residual = slope(log_n, [math.log(sec) - bound for sec, bound in zip(seconds, documented)])
+    fit = best_model(family.sizes, ops)
+    classes = list(MODELS)
+    slower = family.grows_as is not None and classes.index(fit) < classes.index(family.grows_as)
+    return {'solver': family.solver, 'family': family.name, 'sizes': list(family.sizes), 'ops': ops,
+            'seconds': seconds, 'exponent': slope(log_n, [math.log(op) for op in ops]),
+            'best_fit': fit, 'documented': family.documented, 'grows_as': family.grows_as,
+            'residual_exponent': residual, 'time_residual_exponent': time_residual,
+            'slower_than_documented': slower, 'flagged': residual > tolerance or time_residual > time_tolerance}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--solvers', nargs='+', choices=sorted({family.solver for family in FAMILIES}),
+                        help='solvers to check (default: all)')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='largest operation-count residual exponent accepted (default: 0.15)')
+    parser.add_argument('--time-tolerance', type=float, default=0.35,
+                        help='largest wall-time residual exponent accepted (default: 0.35)')
+    parser.add_argument('--json', type=Path, help='write the analysis to this JSON file')
+    args = parser.parse_args(argv)
+
+    reports = [analyze(family, args.tolerance, args.time_tolerance) for family in FAMILIES
+               if not args.solvers or family.solver in args.solvers]
+    print(f"{'solver':<15} | {'family':<20} | {'documented':<10} | {'best fit':<10} | {'n^k':>5} | "
+          f"{'residual':>8} | {'time res.':>9} | verdict")
+    for report in reports:
+        if report['flagged']:
+            verdict = 'EXCEEDS DOCUMENTED BOUND'
+        elif report['slower_than_documented']:
+            verdict = f"ok, but grows slower than {report['grows_as']}: check the docstring"
+        else:
+            verdict = 'ok'
+        print(f"{report['solver']:<15} | {report['family']:<20} | {report['documented']:<10} | "
+              f"{report['best_fit']:<10} | {report['exponent']:>5.2f} | {report['residual_exponent']:>8.2f} | "
+              f"{report['time_residual_exponent']:>9.2f} | {verdict}")
+    if args.json:
+        args.json.write_text(json.dumps(reports, indent=2) + '\n')
+    return 1 if any(report['flagged'] for report in reports) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
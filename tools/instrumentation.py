@@ -0,0 +1,320 @@
+"""
+Opt-in hot-loop instrumentation for the problem solvers.
+
+The solvers are never modified. `Instrumentation.instrument(name, func)` returns
+a wrapper around a solver callable; only calls made through that wrapper are
+measured, so the default code path has no added checks and costs nothing.
+
+A wrapped call records:
+
+- input sizes taken from the first positional argument, with keyword hints such as
+  `typecode` (`PROBES[name]['inputs']`), e.g. elements of `maxSubArray`, from which
+  throughput is derived. A size that cannot be computed is counted in
+  `input_errors` instead of failing the call;
+- hot-loop counters (`PROBES[name]['lines']` and `['calls']`): a `sys.settrace`
+  hook limited to the solver's own code objects counts how often given source
+  lines run, or given nested functions are entered (e.g. `dfs` for DFS nodes);
+- a latency histogram. While line and call probes are active, the tracing
+  hook slows the call down. Pass `counters=False` to record latency and input
+  sizes only, at the cost of one `perf_counter` pair per call.
+
+`snapshot()` returns the stats as a dict, and `render_prometheus()` returns them in
+the Prometheus text exposition format.
+
+Check the examples with: cd tools && python -m doctest instrumentation.py
+
+Example:
+    >>> from registry import Registry
+    >>> instrumentation = Instrumentation()
+    >>> find_min = instrumentation.instrument('findMin', Registry().load('findMin'))
+    >>> find_min([4, 5, 6, 7, 0, 1, 2])
+    0
+    >>> instrumentation.snapshot()['findMin']['counters']
+    {'iterations': 3}
+"""
+
+import bisect
+import linecache
+import struct
+import sys
+import threading
+import time
+import types
+from typing import Callable
+
+
+def item_count(data, typecode: str | None = None) -> int:
+    """
+    Elements in `data`. Buffers count all their items whatever their shape (raw bytes
+    as `typecode` values when one is given); other sequences count `len(data)`.
+
+    Example:
+        >>> import array
+        >>> item_count(memoryview(array.array('q', range(6))).cast('B').cast('q', (2, 3)))
+        6
+        >>> item_count(bytes(16), typecode='q'), item_count([1, 2, 3])
+        (2, 3)
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return len(data)
+    itemsize = struct.calcsize(typecode) if typecode and typecode != view.format else view.itemsize
+    return view.nbytes // itemsize
+
+
+def cell_count(grid, **options) -> int:
+    """Cells of a grid: a buffer (2D, or flat with `shape`), or a sequence of rows."""
+    try:
+        memoryview(grid)
+    except TypeError:
+        return sum(item_count(row) for row in grid)
+    return item_count(grid)
+
+
+# Per solver: `inputs` are sizes computed from the first positional argument (the
+# call's keyword arguments are passed too, for hints such as `typecode`); `lines`
+# count executions of the source line starting with the given text (inside the
+# solver's method or its nested functions); `calls` count entries into nested
+# functions.
+PROBES = {
+    'getMaximumGold': {
+        'inputs': {'cells': cell_count},
+        'calls': {'dfs_nodes': 'dfs'},
+        'lines': {'neighbor_checks': 'if 0 <= nr < rows'},
+    },
+    'maxSubArray': {
+        'inputs': {'elements': lambda nums, typecode=None, **options: item_count(nums, typecode)},
+    },
+    'findMin': {
+        'inputs': {'elements': lambda nums, typecode=None, **options: item_count(nums, typecode)},
+        'lines': {'iterations': 'mid = left + (right - left) // 2'},
+    },
+    'minWindow': {
+        'inputs': {'characters': lambda s, **options: item_count(s)},
+        'lines': {'right_moves': 'char_r: str = s[right]',
+                  'window_shrinks': 'left += 1',
+                  'best_window_updates': 'min_len = current_window_len'},
+    },
+}
+
+DEFAULT_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+
+def format_sample(value: int | float) -> str:
+    """
+    A sample value as written in the exposition format: integers exactly (counters pass
+    10**6 quickly under tracing), floats as their shortest round-trip `repr`.
+    """
+    if isinstance(value, int):
+        return str(value)
+    if value in (float('inf'), float('-inf')):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram, as in Prometheus: `counts[i]` counts values <= `buckets[i]`."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total, result = 0, []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append(('+Inf' if bound == float('inf') else repr(bound), total))
+        return result
+
+
+class SolverStats:
+    """Everything recorded for one solver name."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.calls = 0
+        self.inputs: dict[str, int] = {}
+        self.input_errors = 0
+        self.counters: dict[str, int] = {}
+        self.duration = Histogram(buckets)
+
+
+def nested_code_objects(code: types.CodeType) -> list[types.CodeType]:
+    """`code` and every function, comprehension or lambda compiled inside it."""
+    found = [code]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            found += nested_code_objects(const)
+    return found
+
+
+def resolve_line_probes(codes: list[types.CodeType], probes: dict[str, str]) -> dict[tuple, str]:
+    """
+    Maps `(code, line number)` to counter names, for lines starting with a probe's text.
+
+    Raises:
+        ValueError: If a probe matches no line, e.g. after the solver was rewritten.
+    """
+    resolved = {}
+    for counter, text in probes.items():
+        for code in codes:
+            for _, _, lineno in code.co_lines():
+                if lineno and linecache.getline(code.co_filename, lineno).strip().startswith(text):
+                    resolved[code, lineno] = counter
+        if counter not in resolved.values():
+            raise ValueError(f"Probe {counter!r}: no line starting with {text!r} in {codes[0].co_name}")
+    return resolved
+
+
+class Instrumentation:
+    """Collects the stats of every solver wrapped by `instrument`."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.stats: dict[str, SolverStats] = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, name: str, func: Callable, counters: bool = True) -> Callable:
+        """
+        Wraps the solver callable `func`, recording its calls under `name`.
+
+        Args:
+            name: The solver name, used as metric label and to look up `PROBES`.
+            func: The solver callable, e.g. `Solution().findMin`.
+            counters: Whether to install the tracing hook for line and call probes.
+
+        Returns:
+            A callable with the same signature as `func`.
+
+        Example (keyword arguments and buffers are sized by their items):
+            >>> import array
+            >>> from registry import Registry
+            >>> instrumentation = Instrumentation()
+            >>> find_min = instrumentation.instrument('findMin', Registry().load('findMin'), counters=False)
+            >>> find_min(array.array('q', [4, 5, 6, 7, 0, 1, 2]).tobytes(), typecode='q')
+            0
+            >>> gold = instrumentation.instrument('getMaximumGold', Registry().load('getMaximumGold'), counters=False)
+            >>> gold(bytes([0, 6, 0, 5, 8, 7, 0, 9, 0]), shape=(3, 3))
+            24
+            >>> PROBES['abs'] = {'inputs': {'items': len}}  # len(-3) fails: recorded, result kept
+            >>> instrumentation.instrument('abs', abs)(-3)
+            3
+            >>> del PROBES['abs']
+            >>> {name: (data['inputs'], data['input_errors']) for name, data in instrumentation.snapshot().items()}
+            {'findMin': ({'elements': 7}, 0), 'getMaximumGold': ({'cells': 9}, 0), 'abs': ({}, 1)}
+        """
+        probes = PROBES.get(name, {})
+        stats = self.stats.setdefault(name, SolverStats(self.buckets))
+        inputs = probes.get('inputs', {})
+        code = getattr(getattr(func, '__func__', func), '__code__', None)
+        codes = nested_code_objects(code) if code else []
+        lines = resolve_line_probes(codes, probes.get('lines', {})) if counters and codes else {}
+        calls = {nested: counter for counter, fn_name in probes.get('calls', {}).items()
+                 for nested in codes if nested.co_name == fn_name} if counters else {}
+        traced = set(codes)
+        for counter in [*probes.get('lines', {}), *probes.get('calls', {})] if counters else ():
+            stats.counters.setdefault(counter, 0)
+
+        def wrapper(*args, **kwargs):
+            counts = dict.fromkeys(stats.counters, 0)
+
+            def trace_lines(frame, event, arg):
+                if event == 'line':
+                    counter = lines.get((frame.f_code, frame.f_lineno))
+                    if counter:
+                        counts[counter] += 1
+                return trace_lines
+
+            def trace_calls(frame, event, arg):
+                if frame.f_code not in traced:
+                    return None
+                counter = calls.get(frame.f_code)
+                if counter:
+                    counts[counter] += 1
+                return trace_lines if lines else None
+
+            previous = sys.gettrace()
+            if lines or calls:
+                sys.settrace(trace_calls)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if lines or calls:
+                    sys.settrace(previous)
+                with self._lock:
+                    stats.calls += 1
+                    stats.duration.observe(elapsed)
+                    for key, size in inputs.items():
+                        try:
+                            stats.inputs[key] = stats.inputs.get(key, 0) + size(*args[:1], **kwargs)
+                        except Exception:
+                            # A size probe must never cost the caller the solver's result.
+                            stats.input_errors += 1
+                    for key, count in counts.items():
+                        stats.counters[key] += count
+
+        wrapper.__wrapped__ = func
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    def snapshot(self) -> dict:
+        """The recorded stats as plain data, with throughput in input units per second."""
+        with self._lock:
+            return {name: {'calls': stats.calls, 'inputs': dict(stats.inputs), 'input_errors': stats.input_errors,
+                           'counters': dict(stats.counters),
+                           'throughput': {key: total / stats.duration.sum if stats.duration.sum else 0.0
+                                          for key, total in stats.inputs.items()},
+                           'duration_seconds': {'sum': stats.duration.sum, 'count': stats.duration.count,
+                                                'buckets': dict(stats.duration.cumulative())}}
+                    for name, stats in self.stats.items()}
+
+    def render_prometheus(self, prefix: str = 'solver') -> str:
+        """
+        The recorded stats in the Prometheus text exposition format.
+
+        Example:
+            >>> instrumentation = Instrumentation()
+            >>> instrumentation.stats['minWindow'] = SolverStats(DEFAULT_BUCKETS)
+            >>> instrumentation.stats['minWindow'].counters['right_moves'] = 1234567
+            >>> [line for line in instrumentation.render_prometheus().splitlines() if 'right_moves' in line]
+            ['solver_operations_total{solver="minWindow",operation="right_moves"} 1234567']
+        """
+        snapshot = self.snapshot()
+        out = []
+
+        def family(metric: str, kind: str, help_text: str, samples: list[tuple[str, dict, float]]):
+            out.append(f"# HELP {prefix}_{metric} {help_text}")
+            out.append(f"# TYPE {prefix}_{metric} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{val}"' for key, val in labels.items())
+                out.append(f"{prefix}_{metric}{suffix}{{{label_text}}} {format_sample(value)}")
+
+        family('calls_total', 'counter', 'Solver invocations.',
+               [('', {'solver': name}, data['calls']) for name, data in snapshot.items()])
+        family('input_units_total', 'counter', 'Input size processed, in the unit given by the label.',
+               [('', {'solver': name, 'unit': key}, value)
+                for name, data in snapshot.items() for key, value in data['inputs'].items()])
+        family('input_size_errors_total', 'counter', 'Calls whose input size could not be computed.',
+               [('', {'solver': name}, data['input_errors']) for name, data in snapshot.items()])
+        family('throughput_per_second', 'gauge', 'Input units processed per second of solver time.',
+               [('', {'solver': name, 'unit': key}, value)
+                for name, data in snapshot.items() for key, value in data['throughput'].items()])
+        family('operations_total', 'counter', 'Hot-loop operations counted by the solver probes.',
+               [('', {'solver': name, 'operation': key}, value)
+                for name, data in snapshot.items() for key, value in data['counters'].items()])
+        samples = []
+        for name, data in snapshot.items():
+            duration = data['duration_seconds']
+            samples += [('_bucket', {'solver': name, 'le': le}, count) for le, count in duration['buckets'].items()]
+            samples += [('_sum', {'solver': name}, duration['sum']), ('_count', {'solver': name}, duration['count'])]
+        family('duration_seconds', 'histogram', 'Solver call latency.', samples)
+        return '\n'.join(out) + '\n'
@@ -0,0 +1,139 @@
+"""
+Load-test client for `tools/server.py`: latency percentiles under concurrency.
+
+`--concurrency` keep-alive connections send `--requests` requests in total, drawn
+at random from a pool of `--distinct` seeded payloads spread over the selected
+solvers. A small pool exercises the server cache, a large one the solvers and
+the batching. The client reports throughput and the p50 / p90 / p99 / max latency
+of each solver, then the server's own `/stats`.
+
+Run with:
+    python tools/server.py --port 8765 &
+    python tools/load_test.py --port 8765 --requests 5000 --concurrency 32 --distinct 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from registry import Registry, load_problem
+
+
+def make_payloads(solvers: list[str], distinct: int, seed: int) -> list[tuple[str, bytes]]:
+    """`distinct` seeded `(solver, JSON body)` pairs, round-robin over `solvers`."""
+    registry = Registry()
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(distinct):
+        name = solvers[i % len(solvers)]
+        if name == 'getMaximumGold':
+            gold = load_problem(registry.problem(name).file)
+            args = [gold.random_gold_grid(8, 8, rng.randint(6, 14), rng.randrange(1 << 30))]
+        elif name == 'maxSubArray':
+            args = [[rng.randint(-1000, 1000) for _ in range(rng.randint(10, 5000))]]
+        elif name == 'findMin':
+            n = rng.randint(10, 5000)
+            pivot = rng.randrange(n)
+            args = [list(range(pivot, n)) + list(range(pivot))]
+        else:
+            text = ''.join(rng.choice('abcdefghij') for _ in range(rng.randint(10, 5000)))
+            args = [text, ''.join(rng.choice('abcdefghij') for _ in range(3))]
+        payloads.append((name, json.dumps({'args': args}).encode()))
+    return payloads
+
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                  body: bytes = b'') -> tuple[int, bytes]:
+    """One HTTP/1.1 keep-alive round trip; returns `(status, body)`."""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+        key, _, value = line.decode('latin-1').partition(':')
+        if key.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run_load(args: argparse.Namespace) -> dict:
+    payloads = make_payloads(args.solvers, args.distinct, args.seed)
+    rng = random.Random(args.seed + 1)
+    schedule = [rng.choice(payloads) for _ in range(args.requests)]
+    latencies: dict[str, list[float]] = {name: [] for name in args.solvers}
+    statuses: dict[int, int] = {}
+
+    async def connect():
+        if args.unix:
+            return await asyncio.open_unix_connection(args.unix)
+        return await asyncio.open_connection(args.host, args.port)
+
+    async def client(share: list[tuple[str, bytes]]):
+        reader, writer = await connect()
+        try:
+            for name, body in share:
+                start = time.perf_counter()
+                status, _ = await request(reader, writer, 'POST', f'/solve/{name}', body)
+                latencies[name].append(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(schedule[i::args.concurrency]) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await connect()
+    _, stats = await request(reader, writer, 'GET', '/stats')
+    writer.close()
+
+    report = {'requests': args.requests, 'seconds': elapsed, 'throughput': args.requests / elapsed,
+              'statuses': statuses, 'server': json.loads(stats), 'latency_ms': {}}
+    for name, values in [*latencies.items(), ('all', [v for values in latencies.values() for v in values])]:
+        if values:
+            values.sort()
+            report['latency_ms'][name] = {key: percentile(values, q) * 1000
+                                          for key, q in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99), ('max', 1.0))}
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='connect to this Unix socket instead of TCP')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--distinct', type=int, default=200, help='size of the payload pool')
+    parser.add_argument('--solvers', nargs='+', default=['getMaximumGold', 'maxSubArray', 'findMin', 'minWindow'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{report['requests']} requests in {report['seconds']:.2f}s = {report['throughput']:.0f} req/s, "
+          f"statuses {report['statuses']}")
+    print(f"{'solver':<16} | {'p50 ms':>8} | {'p90 ms':>8} | {'p99 ms':>8} | {'max ms':>8}")
+    for name, latency in report['latency_ms'].items():
+        print(f"{name:<16} | {latency['p50']:>8.2f} | {latency['p90']:>8.2f} | {latency['p99']:>8.2f} | "
+              f"{latency['max']:>8.2f}")
+    server = report['server']
+    print(f"server: {server['inline']} inline, {server['batches']} batches "
+          f"(mean size {server['mean_batch_size']:.1f}), cache {server['cache']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Registry of the problem solvers, loaded lazily by name.
+
+The file names under `problems/` do not match their contents, so solvers are
+looked up by name instead of by path. The registry is built from two JSON files:
+
+- `problems/manifest.json` maps each solver name to its file, its entry point
+  (`Class.method`), optional aliases and an optional import budget (the
+  milliseconds `check-imports` allows for loading its module);
+- `progress.json` adds the tracking metadata (category, difficulty, date) of the
+  files it lists. Files listed there but missing from the manifest are registered
+  under the slug of their title, with the first public method of `Solution`.
+
+Building the registry only reads those two files; a solver module is imported by
+`importlib` the first time one of its callables is requested.
+
+Run with:
+    python tools/registry.py list
+    python tools/registry.py run minWindow '"ADOBECODEBANC"' '"ABC"'
+    python tools/registry.py run --stats findMin '[4, 5, 6, 7, 0, 1, 2]'
+    python tools/registry.py check-imports                 # budgets from the manifest
+    python tools/registry.py check-imports --budget-ms 20 findMin
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Callable, NamedTuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST = os.path.join('problems', 'manifest.json')
+PROGRESS = 'progress.json'
+DEFAULT_IMPORT_BUDGET_MS = 15.0
+
+
+def load_problem(relative_path: str, root: str = ROOT):
+    """
+    Imports a problem file by path; the `problems` tree is not a package.
+
+    Modules are cached in `sys.modules` under a name derived from the path, so each
+    file is executed at most once per process.
+    """
+    # importlib.util pulls in a few modules of its own; it is only needed once a
+    # solver is actually loaded, so it is not imported at the top of the registry.
+    import importlib.util
+
+    path = os.path.join(root, relative_path)
+    parts = os.path.splitext(os.path.relpath(path, os.path.join(root, 'problems')))[0].split(os.sep)
+    name = 'problems_' + '_'.join(parts)
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name]
+
+
+def slugify(title: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+
+
+class Problem(NamedTuple):
+    """One registered solver. `entry` is `Class.method`, or `None` to pick the first public method."""
+    name: str
+    title: str
+    file: str
+    entry: str | None
+    aliases: tuple[str, ...] = ()
+    category: str | None = None
+    difficulty: str | None = None
+    date: str | None = None
+    import_budget_ms: float | None = None
+
+
+class Registry:
+    """
+    Name-to-callable map over the problems of one checkout.
+
+    Example:
+        >>> registry = Registry()
+        >>> registry.load('maxSubArray')([-2, 1, -3, 4, -1, 2, 1, -5, 4])
+        6
+    """
+
+    def __init__(self, root: str = ROOT):
+        self.root = root
+        self._problems: dict[str, Problem] = {}
+        self._aliases: dict[str, str] = {}
+        self._callables: dict[str, Callable] = {}
+
+        with open(os.path.join(root, MANIFEST)) as f:
+            manifest = json.load(f)
+        progress_path = os.path.join(root, PROGRESS)
+        progress = []
+        if os.path.exists(progress_path):
+            with open(progress_path) as f:
+                progress = json.load(f).get('problems_solved', [])
+        tracked = {entry['file']: entry for entry in progress}
+
+        for name, spec in manifest.items():
+            meta = tracked.pop(spec['file'], {})
+            self._add(Problem(name, spec.get('title', name), spec['file'], spec.get('entry'),
+                              tuple(spec.get('aliases', ())), meta.get('category'), meta.get('difficulty'),
+                              meta.get('date'), spec.get('import_budget_ms')))
+        for file, meta in tracked.items():
+            self._add(Problem(slugify(meta['title']), meta['title'], file, None, (), meta.get('category'),
+                              meta.get('difficulty'), meta.get('date')))
+
+    def _add(self, problem: Problem):
+        if problem.name in self._problems:
+            raise ValueError(f"Duplicate problem name {problem.name!r}")
+        self._problems[problem.name] = problem
+        for alias in problem.aliases:
+            self._aliases[alias] = problem.name
+
+    def names(self) -> list[str]:
+        return list(self._problems)
+
+    def problem(self, name: str) -> Problem:
+        """Looks a problem up by name or alias. Raises `KeyError` if it is not registered."""
+        name = self._aliases.get(name, name)
+        if name not in self._problems:
+            raise KeyError(f"Unknown problem {name!r}; registered: {', '.join(self._problems)}")
+        return self._problems[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._problems or name in self._aliases
+
+    def load(self, name: str) -> Callable:
+        """
+        The solver callable of `name`, importing its module on first use.
+
+        The entry class is instantiated once; later calls return the same bound method.
+        """
+        problem = self.problem(name)
+        if problem.name not in self._callables:
+            module = load_problem(problem.file, self.root)
+            if problem.entry:
+                class_name, method_name = problem.entry.split('.')
+            else:
+                class_name = 'Solution'
+                method_name = next(attr for attr in vars(module.Solution) if not attr.startswith('_'))
+            self._callables[problem.name] = getattr(getattr(module, class_name)(), method_name)
+        return self._callables[problem.name]
+
+
+def parse_argument(text: str):
+    """CLI arguments are JSON (`[1, 2]`, `"abc"`, `3`); anything else is taken as a plain string."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def measure_cold_start(name: str, root: str = ROOT) -> tuple[float, float, list[tuple[int, str]]]:
+    """
+    Loads `name` in a fresh interpreter started with `-X importtime`.
+
+    Returns:
+        The wall time of the whole process in seconds (what a one-shot CLI call pays),
+        the seconds spent loading the solver module itself (its own imports included,
+        the interpreter and the registry excluded), and the top-level imports by
+        cumulative microseconds, slowest first.
+    """
+    import subprocess  # only the budget check spawns processes; keep it off the `run` path
+
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--root', root,
+                                'load', name], capture_output=True, text=True, check=True)
+    elapsed = time.perf_counter() - start
+    load_seconds = float(completed.stdout.split()[-1])
+    imports = []
+    for line in completed.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| (\S.*)', line)
+        if match and not match.group(2).startswith(' '):
+            imports.append((int(match.group(1)), match.group(2)))
+    return elapsed, load_seconds, sorted(imports, reverse=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--root', default=ROOT, help=argparse.SUPPRESS)
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help='list the registered problems')
+    run = commands.add_parser('run', help='load one solver and call it with JSON arguments')
+    run.add_argument('name')
+    run.add_argument('args', nargs='*', help='JSON arguments (plain strings are accepted as is)')
+    run.add_argument('--stats', action='store_true',
+                     help='instrument the call and print its metrics in Prometheus text format')
+    load = commands.add_parser('load', help='load one solver, print the seconds it took and exit '
+                                            '(used by check-imports)')
+    load.add_argument('name')
+    check = commands.add_parser('check-imports', help='fail if loading a solver from a cold start is too slow')
+    check.add_argument('names', nargs='*', help='problems to check (default: all)')
+    check.add_argument('--budget-ms', type=float,
+                       help='largest accepted time to load one solver module in a fresh interpreter, its '
+                            f'imports included, in ms (default: the manifest budget, else {DEFAULT_IMPORT_BUDGET_MS:g})')
+    check.add_argument('--top', type=int, default=3, help='slowest imports to show per solver')
+    args = parser.parse_args(argv)
+
+    registry = Registry(args.root)
+    if args.command == 'list':
+        for name in registry.names():
+            problem = registry.problem(name)
+            print(f"{name:<16} {problem.title:<38} {problem.file}")
+    elif args.command == 'run':
+        solver = registry.load(args.name)
+        if args.stats:
+            from instrumentation import Instrumentation
+            instrumentation = Instrumentation()
+            solver = instrumentation.instrument(registry.problem(args.name).name, solver)
+        result = solver(*map(parse_argument, args.args))
+        try:
+            print(json.dumps(result))
+        except TypeError:
+            print(repr(result))
+        if args.stats:
+            print(instrumentation.render_prometheus(), end='')
+    elif args.command == 'load':
+        start = time.perf_counter()
+        registry.load(args.name)
+        print(time.perf_counter() - start)
+    else:
+        over = []
+        for name in args.names or registry.names():
+            problem = registry.problem(name)
+            budget = args.budget_ms or problem.import_budget_ms or DEFAULT_IMPORT_BUDGET_MS
+            elapsed, load_seconds, imports = measure_cold_start(problem.name, args.root)
+            slowest = ', '.join(f"{module} {micros / 1000:.1f} ms" for micros, module in imports[:args.top])
+            status = 'OVER BUDGET' if load_seconds * 1000 > budget else 'ok'
+            print(f"{name:<16} load {load_seconds * 1000:>6.1f} ms / {budget:g} ms  process {elapsed * 1000:>6.1f} ms  "
+                  f"{status:<11}  slowest imports: {slowest}")
+            if status != 'ok':
+                over.append(name)
+        if over:
+            print(f"Solver load over budget: {', '.join(over)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+Long-running local solver service over HTTP (TCP on localhost, or a Unix socket).
+
+Callers pay the interpreter start and the solver imports once, when the service
+starts, instead of on every call:
+
+    POST /solve/<name>   body: {"args": [...]}   ->  {"result": ..., "cached": false}
+    GET  /stats          cache and batching counters
+    GET  /health
+
+`<name>` is any name or alias of the registry (`getMaximumGold`, `maxSubArray`,
+`findMin`, `minWindow`, ...). The request path has three layers:
+
+1. A content-hash LRU cache. The key is the SHA-256 of the solver name and the
+   canonical JSON of the arguments. Values are the encoded responses, evicted
+   least recently used first once their total size exceeds `--cache-bytes`.
+   Identical requests that arrive while one is being solved share its result.
+2. Small requests (body under `--inline-bytes`, 4 KiB by default) of the
+   polynomial solvers run inline on the event loop, where a process round trip
+   would cost more than the solve itself. They block the loop while they run: at
+   4 KiB of JSON the linear solvers take well under a millisecond, so raise the
+   threshold with care. `getMaximumGold` is exponential and never runs inline.
+3. Everything else is micro-batched per solver. Requests arriving within
+   `--batch-window` ms (or up to `--max-batch` of them) are sent to the process pool
+   as a single task, which pays the inter-process overhead once per batch.
+
+Pooled requests are answered 504 after `--timeout` seconds. A batch still running
+by then (e.g. an exponential `getMaximumGold` grid) gets its workers killed and
+the pool replaced, so it cannot stall the requests batched after it. If a worker
+dies, the pool is replaced too. Requests that were running in the old pool are
+answered 503 and can be retried. Inline solves cannot be interrupted and have no
+timeout.
+
+Run with:
+    python tools/server.py --port 8765 --workers 4
+    python tools/server.py --unix /tmp/solvers.sock
+    python tools/load_test.py --port 8765 --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import signal
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from registry import Registry
+
+ALWAYS_POOLED = {'getMaximumGold'}
+
+_worker_registry = None
+
+
+def _init_worker(pids: multiprocessing.SimpleQueue):
+    global _worker_registry
+    pids.put(os.getpid())
+    # Forked workers inherit the event loop's signal handling, which would forward a
+    # SIGTERM meant for a stuck worker to the server's own wakeup fd and stop it.
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_registry = Registry()
+
+
+class WorkerPool(ProcessPoolExecutor):
+    """Process pool whose workers report their PIDs, so that `stop` can kill them."""
+
+    def __init__(self, workers: int):
+        self.pids = multiprocessing.SimpleQueue()
+        super().__init__(max_workers=workers, initializer=_init_worker, initargs=(self.pids,))
+
+    def stop(self):
+        """Shuts the pool down without waiting for the batches it is running."""
+        # The executor has no public way to stop a running task, so its workers are
+        # sent SIGTERM. A worker runs a task only after reporting its PID.
+        while not self.pids.empty():
+            try:
+                os.kill(self.pids.get(), signal.SIGTERM)
+            except ProcessLookupError:
+                pass  # Already gone (the pool broke when it died).
+        self.shutdown(wait=False, cancel_futures=True)
+
+
+def _solve_batch(name: str, batch: list[list]) -> list[tuple[bool, object]]:
+    """Process-pool task: solves every argument list of `batch` with solver `name`."""
+    solver = _worker_registry.load(name)
+    results = []
+    for args in batch:
+        try:
+            results.append((True, solver(*args)))
+        except Exception as error:
+            results.append((False, f"{type(error).__name__}: {error}"))
+    return results
+
+
+class ResultCache:
+    """LRU map of content hash to encoded response, bounded by total byte size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old)
+        self._entries[key] = value
+        self.bytes += len(value)
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Batcher:
+    """Collects concurrent requests for one solver and solves them as one pool task."""
+
+    def __init__(self, service: 'SolverService', name: str):
+        self.service = service
+        self.name = name
+        self.pending: list[tuple[list, asyncio.Future]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+    def submit(self, args: list) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((args, future))
+        if len(self.pending) >= self.service.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.service.batch_window, self.flush)
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        self.service.batches += 1
+        self.service.batched_requests += len(batch)
+        loop = asyncio.get_running_loop()
+        pool = self.service.pool
+        try:
+            task = loop.run_in_executor(pool, _solve_batch, self.name, [args for args, _ in batch])
+        except BrokenProcessPool:
+            # An earlier batch broke the pool; this one is innocent, so it gets the new pool.
+            pool = self.service.restart_pool(pool)
+            task = loop.run_in_executor(pool, _solve_batch, self.name, [args for args, _ in batch])
+        watchdog = loop.call_later(self.service.timeout, self.service.restart_pool, pool)
+
+        def deliver(task: asyncio.Future):
+            watchdog.cancel()
+            if task.cancelled():
+                error = BrokenProcessPool("the solver pool was restarted")
+            else:
+                error = task.exception()
+            if isinstance(error, BrokenProcessPool):
+                self.service.restart_pool(pool)
+            for (_, future), result in zip(batch, [None] * len(batch) if error else task.result()):
+                if future.done():
+                    continue
+                if error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+        task.add_done_callback(deliver)
+
+
+class SolverService:
+    """The HTTP front end, cache and batchers around one process pool."""
+
+    def __init__(self, workers: int, cache_bytes: int, batch_window_ms: float, max_batch: int, inline_bytes: int,
+                 timeout: float = 30.0):
+        self.registry = Registry()
+        self.workers = workers
+        self.pool = WorkerPool(workers)
+        self.cache = ResultCache(cache_bytes)
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.inline_bytes = inline_bytes
+        self.timeout = timeout
+        self.batchers: dict[str, Batcher] = {}
+        self.in_flight: dict[str, asyncio.Future] = {}
+        self.requests = self.inline = self.batches = self.batched_requests = 0
+        self.timeouts = self.pool_restarts = 0
+
+    def restart_pool(self, pool: WorkerPool) -> WorkerPool:
+        """
+        Replaces `pool` (broken, or running a batch past its timeout) with a fresh one.
+
+        The old workers are killed, so a runaway search stops using a CPU; the batches
+        still running in them fail with `BrokenProcessPool`. Returns the current pool,
+        which is unchanged if `pool` was already replaced.
+        """
+        if pool is self.pool:
+            self.pool = WorkerPool(self.workers)
+            self.pool_restarts += 1
+            pool.stop()
+        return self.pool
+
+    async def solve(self, name: str, body: bytes) -> tuple[int, bytes]:
+        """Answers one `/solve/<name>` request: `(HTTP status, JSON body)`."""
+        if name not in self.registry:
+            return 404, json.dumps({'error': f"unknown solver {name!r}"}).encode()
+        name = self.registry.problem(name).name
+        try:
+            args = json.loads(body or b'{}').get('args', [])
+            if not isinstance(args, list):
+                raise ValueError("'args' must be a list")
+        except (ValueError, AttributeError) as error:
+            return 400, json.dumps({'error': f"bad request body: {error}"}).encode()
+
+        self.requests += 1
+        canonical = json.dumps([name, args], sort_keys=True, separators=(',', ':')).encode()
+        key = hashlib.sha256(canonical).hexdigest()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return 200, cached
+        if key in self.in_flight:
+            return await asyncio.shield(self.in_flight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            try:
+                ok, result = await asyncio.wait_for(self._run(name, args, len(body)), self.timeout)
+                if ok:
+                    response = 200, json.dumps({'result': result, 'cached': False}).encode()
+                    self.cache.put(key, json.dumps({'result': result, 'cached': True}).encode())
+                else:
+                    response = 422, json.dumps({'error': result}).encode()
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                response = 504, json.dumps({'error': f"solver timed out after {self.timeout:g} s"}).encode()
+            except BrokenProcessPool as error:
+                response = 503, json.dumps({'error': f"solver pool unavailable, retry: {error}"}).encode()
+            except Exception as error:
+                response = 500, json.dumps({'error': f"{type(error).__name__}: {error}"}).encode()
+            future.set_result(response)
+            return response
+        except BaseException:
+            future.cancel()  # this request was cancelled; identical waiters see it too
+            raise
+        finally:
+            del self.in_flight[key]
+
+    async def _run(self, name: str, args: list, body_size: int) -> tuple[bool, object]:
+        """Solves inline or through the solver's batcher; returns `(ok, result or error message)`."""
+        if body_size < self.inline_bytes and name not in ALWAYS_POOLED:
+            self.inline += 1
+            try:
+                return True, self.registry.load(name)(*args)
+            except Exception as error:
+                return False, f"{type(error).__name__}: {error}"
+        return await self.batchers.setdefault(name, Batcher(self, name)).submit(args)
+
+    def stats(self) -> dict:
+        return {'requests': self.requests, 'inline': self.inline, 'batches': self.batches,
+                'batched_requests': self.batched_requests,
+                'mean_batch_size': self.batched_requests / self.batches if self.batches else 0.0,
+                'timeouts': self.timeouts, 'pool_restarts': self.pool_restarts,
+                'cache': {'entries': len(self.cache), 'bytes': self.cache.bytes, 'max_bytes': self.cache.max_bytes,
+                          'hits': self.cache.hits, 'misses': self.cache.misses,
+                          'evictions': self.cache.evictions}}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves HTTP/1.1 requests on one connection, with keep-alive."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                if method == 'POST' and path.startswith('/solve/'):
+                    status, payload = await self.solve(path[len('/solve/'):], body)
+                elif method == 'GET' and path == '/stats':
+                    status, payload = 200, json.dumps(self.stats()).encode()
+                elif method == 'GET' and path == '/health':
+                    status, payload = 200, b'{"status":"ok"}'
+                else:
+                    status, payload = 404, b'{"error":"not found"}'
+
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0'
+                reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 422: 'Unprocessable Entity',
+                          500: 'Internal Server Error', 503: 'Service Unavailable', 504: 'Gateway Timeout'}[status]
+                writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n"
+                             f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode() + payload)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.stop()
+
+
+async def serve(args: argparse.Namespace):
+    service = SolverService(args.workers, args.cache_bytes, args.batch_window, args.max_batch, args.inline_bytes,
+                            args.timeout)
+    if args.unix:
+        server = await asyncio.start_unix_server(service.handle, path=args.unix)
+        where = args.unix
+    else:
+        server = await asyncio.start_server(service.handle, host=args.host, port=args.port)
+        where = f"http://{args.host}:{server.sockets[0].getsockname()[1]}"
+    print(f"Serving {', '.join(service.registry.names())} on {where} with {args.workers} workers", flush=True)
+
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+    async with server:
+        await stop.wait()
+    service.close()
+    if args.unix and os.path.exists(args.unix):
+        os.unlink(args.unix)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port (0 picks a free one)')
+    parser.add_argument('--unix', help='serve on this Unix socket path instead of TCP')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='solver processes')
+    parser.add_argument('--cache-bytes', type=int, default=64 << 20, help='result cache size (default: 64 MiB)')
+    parser.add_argument('--batch-window', type=float, default=2.0, help='micro-batching window in ms')
+    parser.add_argument('--max-batch', type=int, default=64, help='flush a batch at this many requests')
+    parser.add_argument('--inline-bytes', type=int, default=4096,
+                        help='solve polynomial requests smaller than this on the event loop (default: 4096)')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='answer pooled requests 504 after this many seconds (default: 30)')
+    asyncio.run(serve(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
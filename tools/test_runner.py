@@ -0,0 +1,261 @@
+"""
+Parallel test runner for every problem file, whatever its test style.
+
+The problem files test themselves in three ways, all discovered from the source
+(with `ast`, without importing anything):
+
+- `unittest.TestCase` classes: every `test_*` method becomes its own task. A
+  solver may keep them in a sibling `test_<name>.py` module, so that importing it
+  does not import unittest.
+- a module-level `run_tests()` that prints results and calls `sys.exit(1)` on
+  failure: one task, failed by a non-zero exit.
+- checks written inline under `if __name__ == "__main__":` that print `PASS:` /
+  `FAIL:` lines and never fail the process: the block is run as a script, and the
+  task fails on any `FAIL` line or uncaught exception.
+
+Each task runs in its own child process, at most `--workers` at a time, and is
+killed (with its process group, so pools it started go too) when it exceeds
+`--timeout`. Task durations are kept in `.test_durations.json` and the next run
+starts the longest tasks first, so the wall time stays close to the longest task
+as long as workers are available.
+
+Run with:
+    python tools/test_runner.py                      # every file under problems/
+    python tools/test_runner.py problems/trees --workers 8 --timeout 30 --slowest 15
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import runpy
+import signal
+import sys
+import time
+import traceback
+import unittest
+from collections import deque
+from multiprocessing.connection import wait
+from typing import NamedTuple
+
+from registry import ROOT, load_problem
+
+DURATIONS = os.path.join(ROOT, '.test_durations.json')
+
+
+class Task(NamedTuple):
+    """One schedulable test: `kind` is 'unittest', 'run_tests' or 'script'."""
+    file: str
+    kind: str
+    name: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.file}::{self.name}"
+
+
+class Outcome(NamedTuple):
+    task: Task
+    status: str  # 'pass', 'fail', 'error' or 'timeout'
+    seconds: float
+    details: str = ''
+
+
+def discover(paths: list[str]) -> list[Task]:
+    """Finds the test tasks of every `.py` file under `paths` (relative to the repo root)."""
+    files = []
+    for path in paths:
+        full = os.path.join(ROOT, path)
+        if os.path.isfile(full):
+            files.append(path)
+        for directory, _, names in os.walk(full):
+            files.extend(os.path.relpath(os.path.join(directory, name), ROOT)
+                         for name in sorted(names) if name.endswith('.py'))
+
+    tasks = []
+    for file in files:
+        with open(os.path.join(ROOT, file)) as f:
+            tree = ast.parse(f.read(), file)
+        found = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and any(ast.unparse(base) in ('unittest.TestCase', 'TestCase')
+                                                      for base in node.bases):
+                found += [Task(file, 'unittest', f"{node.name}.{item.name}") for item in node.body
+                          if isinstance(item, ast.FunctionDef) and item.name.startswith('test')]
+            elif isinstance(node, ast.FunctionDef) and node.name == 'run_tests':
+                found.append(Task(file, 'run_tests', 'run_tests'))
+        # A solver whose tests were moved to a sibling `test_<name>.py` (to keep unittest
+        # out of its import) only runs them from `__main__`; they are found there.
+        test_module = os.path.join(ROOT, os.path.dirname(file), 'test_' + os.path.basename(file))
+        if not found and not os.path.exists(test_module) and any(isinstance(node, ast.If)
+                                                                 and "__name__" in ast.unparse(node.test)
+                                                                 for node in tree.body):
+            found.append(Task(file, 'script', '__main__'))
+        tasks += found
+    return tasks
+
+
+def execute(task: Task) -> tuple[str, str]:
+    """Runs one task in the current process and returns `(status, details)`."""
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            if task.kind == 'unittest':
+                module = load_problem(task.file)
+                result = unittest.TestResult()
+                unittest.defaultTestLoader.loadTestsFromName(task.name, module).run(result)
+                problems = result.errors + result.failures
+                if problems:
+                    return ('error' if result.errors else 'fail'), problems[0][1]
+                return 'pass', ''
+            if task.kind == 'run_tests':
+                load_problem(task.file).run_tests()
+            else:
+                sys.argv = [os.path.join(ROOT, task.file)]
+                runpy.run_path(sys.argv[0], run_name='__main__')
+    except SystemExit as exit:
+        if exit.code not in (None, 0):
+            return 'fail', failure_lines(output.getvalue()) or f"exit status {exit.code}"
+    except BaseException:
+        return 'error', failure_lines(output.getvalue()) + traceback.format_exc()
+    failures = failure_lines(output.getvalue())
+    return ('fail' if failures else 'pass'), failures
+
+
+def failure_lines(output: str) -> str:
+    """
+    The printed lines that report a failure in the `run_tests()` and `__main__` styles.
+
+    `run_tests()` puts the verdict on the last line of a multi-line case, so the two
+    lines before a trailing `FAILED` are kept with it.
+    """
+    lines = output.splitlines()
+    kept = []
+    for i, line in enumerate(lines):
+        if line.rstrip().endswith('FAILED'):
+            kept += lines[max(0, i - 2):i + 1]
+        elif line.startswith('FAIL') or 'ERROR' in line:
+            kept.append(line)
+    return ''.join(line + '\n' for line in kept)
+
+
+def _child(task: Task, conn):
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()  # own process group, so a timeout also kills the pools the test starts
+    start = time.perf_counter()
+    status, details = execute(task)
+    conn.send((status, time.perf_counter() - start, details))
+    conn.close()
+
+
+def _kill(process):
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def run_all(tasks: list[Task], workers: int, timeout: float, durations: dict[str, float] | None = None,
+            progress=None) -> list[Outcome]:
+    """
+    Runs `tasks` in child processes, at most `workers` at a time.
+
+    Tasks are started longest first according to `durations` (unknown ones first of
+    all, since they may be long). Each task is killed after `timeout` seconds.
+    """
+    context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+    if context.get_start_method() == 'fork':
+        for file in {task.file for task in tasks if task.kind != 'script'}:
+            load_problem(file)  # imported once here, shared by every forked child
+
+    durations = durations or {}
+    pending = deque(sorted(tasks, key=lambda task: -durations.get(task.id, float('inf'))))
+    running = {}
+    outcomes = []
+    while pending or running:
+        while pending and len(running) < workers:
+            task = pending.popleft()
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_child, args=(task, sender))
+            process.start()
+            sender.close()
+            running[receiver] = (process, task, time.perf_counter())
+
+        now = time.perf_counter()
+        deadline = min(start + timeout for _, _, start in running.values())
+        for receiver in wait(list(running), timeout=max(0.0, deadline - now)):
+            process, task, start = running.pop(receiver)
+            try:
+                status, seconds, details = receiver.recv()
+            except EOFError:
+                status, seconds, details = 'error', time.perf_counter() - start, 'worker died'
+            process.join()
+            if process.exitcode not in (0, None) and status == 'pass':
+                status, details = 'error', f"worker exit code {process.exitcode}"
+            outcomes.append(Outcome(task, status, seconds, details))
+            if progress:
+                progress(outcomes[-1])
+
+        now = time.perf_counter()
+        for receiver, (process, task, start) in list(running.items()):
+            if now - start >= timeout:
+                _kill(process)
+                process.join()
+                del running[receiver]
+                outcomes.append(Outcome(task, 'timeout', now - start, f"killed after {timeout:g} s"))
+                if progress:
+                    progress(outcomes[-1])
+    return outcomes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('paths', nargs='*', default=['problems'], help='files or directories (default: problems)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='parallel test processes')
+    parser.add_argument('--timeout', type=float, default=60.0, help='per-test timeout in seconds (default: 60)')
+    parser.add_argument('--slowest', type=int, default=10, help='number of slowest tests to report')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print every test as it finishes')
+    args = parser.parse_args(argv)
+
+    durations = {}
+    if os.path.exists(DURATIONS):
+        with open(DURATIONS) as f:
+            durations = json.load(f)
+
+    def progress(outcome: Outcome):
+        if args.verbose:
+            print(f"{outcome.status.upper():<7} {outcome.seconds:>8.3f}s  {outcome.task.id}")
+        else:
+            print('.' if outcome.status == 'pass' else outcome.status[0].upper(), end='', flush=True)
+
+    tasks = discover(args.paths)
+    start = time.perf_counter()
+    outcomes = run_all(tasks, max(1, args.workers), args.timeout, durations, progress)
+    elapsed = time.perf_counter() - start
+    if not args.verbose:
+        print()
+
+    durations.update({outcome.task.id: outcome.seconds for outcome in outcomes})
+    with open(DURATIONS, 'w') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+    failed = [outcome for outcome in outcomes if outcome.status != 'pass']
+    for outcome in failed:
+        print(f"\n{outcome.status.upper()}: {outcome.task.id}\n{outcome.details.rstrip()}")
+
+    print(f"\nSlowest {min(args.slowest, len(outcomes))} tests:")
+    for outcome in sorted(outcomes, key=lambda outcome: -outcome.seconds)[:args.slowest]:
+        print(f"  {outcome.seconds:>8.3f}s  {outcome.task.id}")
+
+    counts = {status: sum(outcome.status == status for outcome in outcomes)
+              for status in ('pass', 'fail', 'error', 'timeout')}
+    print(f"\n{len(outcomes)} tests in {elapsed:.2f}s with {args.workers} workers: "
+          + ', '.join(f"{count} {status}" for status, count in counts.items() if count))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())